@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Compact binary format for the records, it can be opened with `numpy.memmap`.
+
+The file starts with the magic bytes, the length of the header as an unsigned integer of 4 bytes
+(little endian) and the header in JSON, padded with spaces to 64 bytes. After the header every record
+is a row of signed integers of 1 byte, one per column.
+"""
+from json import dumps, loads
+from struct import pack, unpack
+
+MAGIC: bytes = b'TTTGAMES'
+ALIGNMENT: int = 64
+DTYPE: str = 'int8'
+
+
+def get_header(columns: list, **information) -> bytes:
+    """
+    Return the header of the binary file.
+
+    :type columns: list[str]
+    :param columns: The names of the columns of every record.
+
+    :param information: Other values stored in the header, for example the seed.
+
+    :rtype: bytes
+    :return: The header, its length is multiple of 64 bytes.
+    """
+    header: bytes = dumps({'dtype': DTYPE, 'columns': columns, **information}).encode()
+    prefix_size: int = len(MAGIC) + 4
+    padding: int = -(prefix_size + len(header)) % ALIGNMENT
+    header += b' ' * padding
+
+    return MAGIC + pack('<I', len(header)) + header
+
+
+def read_header(filename: str) -> tuple:
+    """
+    Read the header of the binary file.
+
+    :type filename: str
+    :param filename: The path and filename of the binary file.
+
+    :rtype: tuple[dict, int]
+    :return: The information in the header and the offset in bytes where the records start.
+    """
+    with open(filename, 'rb') as file_reference:
+        magic: bytes = file_reference.read(len(MAGIC))
+        if magic != MAGIC:
+            raise ValueError(f'The file "{filename}" is not a binary file of records.')
+
+        header_size: int = unpack('<I', file_reference.read(4))[0]
+        header: dict = loads(file_reference.read(header_size))
+
+    return header, len(MAGIC) + 4 + header_size
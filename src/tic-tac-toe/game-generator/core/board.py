@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Precomputed information of the grid, shared by the game engines.
+The constants are for the standard 3x3 grid, `Board` has the same information for any m,n,k board.
+"""
+from functools import lru_cache
+
+from numpy import ndarray, array, arange, uint64
+
+# Every cell of the grid is one bit: the cell 1 is the bit 0 and the cell 9 is the bit 8.
+CELLS: int = 9
+
+# Bit masks of the eight lines which win the game: three rows, three columns and two crosses.
+LINE_MASKS: tuple = (
+    0b000000111, 0b000111000, 0b111000000,
+    0b001001001, 0b010010010, 0b100100100,
+    0b100010001, 0b001010100,
+)
+
+
+def _get_winning_boards() -> ndarray:
+    """
+    Compute the lookup table which says if a board of one player contains a line.
+
+    :rtype: ndarray
+    :return: Array with 512 booleans, indexed by the 9-bit board of one player.
+    """
+    boards: ndarray = arange(1 << CELLS)
+    winning_boards: ndarray = boards < 0
+    line_mask: int
+    for line_mask in LINE_MASKS:
+        winning_boards |= (boards & line_mask) == line_mask
+
+    return winning_boards
+
+
+WINNING_BOARDS: ndarray = _get_winning_boards()
+
+# Bit mask for every cell number, the index 0 is not used because the cells start with 1.
+CELL_MASKS: ndarray = array([0] + [1 << index for index in range(CELLS)])
+
+# Largest board, every board of a player is stored in an unsigned integer of 64 bits, and the last bit pads the lines.
+MAXIMUM_CELLS: int = 63
+
+# Largest board with a lookup table of the winning boards, bigger boards check the lines of the last cell.
+MAXIMUM_TABLE_CELLS: int = 16
+
+
+class Board:
+    """
+    This class has the precomputed information of an m,n,k board: rows, columns and the length of the line
+    which wins. The cells are numbered from 1, row by row, and the cell `c` is the bit `c - 1` of the board.
+    Only the lines through the last marked cell can win, so a move checks at most 4 * k lines.
+    """
+    __rows: int
+    __columns: int
+    __line_length: int
+    __cells: int
+    __line_masks: tuple
+    __cell_lines: list
+    __cell_line_masks: ndarray
+    __winning_boards: ndarray
+
+    def __init__(self, rows: int = 3, columns: int = 3, line_length: int = 3) -> None:
+        """
+        Construction method.
+
+        :type rows: int
+        :param rows: Number of rows of the grid.
+
+        :type columns: int
+        :param columns: Number of columns of the grid.
+
+        :type line_length: int
+        :param line_length: Number of marks in a row, column or cross which win the game.
+
+        :rtype: None
+        """
+        if rows < 1 or columns < 1 or rows * columns > MAXIMUM_CELLS:
+            raise ValueError(f'The board must have between 1 and {MAXIMUM_CELLS} cells, got {rows}x{columns}.')
+
+        if line_length < 1 or line_length > max(rows, columns):
+            raise ValueError(f'The line length must be between 1 and {max(rows, columns)}, got {line_length}.')
+
+        self.__rows = rows
+        self.__columns = columns
+        self.__line_length = line_length
+        self.__cells = rows * columns
+        self.__line_masks = self.__get_line_masks()
+        self.__cell_lines = [()] + [
+            tuple(line_mask for line_mask in self.__line_masks if line_mask >> index & 1)
+            for index in range(self.__cells)
+        ]
+
+        # Every cell has the same number of lines, the missing ones are a bit out of the board, it is never marked.
+        maximum_lines: int = max(len(lines) for lines in self.__cell_lines)
+        self.__cell_line_masks = array([
+            list(lines) + [1 << self.__cells] * (maximum_lines - len(lines)) for lines in self.__cell_lines
+        ], dtype=uint64).reshape(self.__cells + 1, maximum_lines)
+
+        self.__winning_boards = None
+        if self.__cells <= MAXIMUM_TABLE_CELLS:
+            boards: ndarray = arange(1 << self.__cells)
+            self.__winning_boards = boards < 0
+            line_mask: int
+            for line_mask in self.__line_masks:
+                self.__winning_boards |= (boards & line_mask) == line_mask
+
+    def __get_line_masks(self) -> tuple:
+        """
+        Compute the bit masks of all the lines which win the game: rows, columns and both crosses.
+
+        :rtype: tuple[int]
+        :return: The line masks.
+        """
+        line_masks: list = []
+        directions: tuple = ((0, 1), (1, 0), (1, 1), (1, -1))
+        row: int
+        column: int
+        for row in range(self.__rows):
+            for column in range(self.__columns):
+                for row_step, column_step in directions:
+                    last_row: int = row + row_step * (self.__line_length - 1)
+                    last_column: int = column + column_step * (self.__line_length - 1)
+                    if not (0 <= last_row < self.__rows and 0 <= last_column < self.__columns):
+                        continue
+
+                    line_masks.append(sum(
+                        1 << ((row + row_step * step) * self.__columns + column + column_step * step)
+                        for step in range(self.__line_length)
+                    ))
+
+        # With a line length of 1 every direction has the same line.
+        return tuple(sorted(set(line_masks)))
+
+    @property
+    def rows(self) -> int:
+        """
+        Get the number of rows.
+
+        :rtype: int
+        :return: The rows.
+        """
+        return self.__rows
+
+    @property
+    def columns(self) -> int:
+        """
+        Get the number of columns.
+
+        :rtype: int
+        :return: The columns.
+        """
+        return self.__columns
+
+    @property
+    def line_length(self) -> int:
+        """
+        Get the number of marks in a line which win the game.
+
+        :rtype: int
+        :return: The line length.
+        """
+        return self.__line_length
+
+    @property
+    def cells(self) -> int:
+        """
+        Get the number of cells, it is the maximum number of turns.
+
+        :rtype: int
+        :return: The cells.
+        """
+        return self.__cells
+
+    @property
+    def is_standard(self) -> bool:
+        """
+        Return if it is the board of the Tic Tac Toe, 3x3 with 3 in a row.
+
+        :rtype: bool
+        :return: True for the standard board.
+        """
+        return (self.__rows, self.__columns, self.__line_length) == (3, 3, 3)
+
+    @property
+    def line_masks(self) -> tuple:
+        """
+        Get the bit masks of all the lines which win the game.
+
+        :rtype: tuple[int]
+        :return: The line masks.
+        """
+        return self.__line_masks
+
+    @property
+    def cell_line_masks(self) -> ndarray:
+        """
+        Get the bit masks of the lines through every cell, the index 0 is not used.
+        The cells with fewer lines are padded with a mask out of the board, so it never wins.
+
+        :rtype: ndarray
+        :return: Matrix of unsigned integers of 64 bits, one row per cell.
+        """
+        return self.__cell_line_masks
+
+    @property
+    def winning_boards(self) -> ndarray:
+        """
+        Get the lookup table which says if a board of one player contains a line.
+
+        :rtype: ndarray
+        :return: Array of booleans indexed by the board, or `None` if the board has more than 16 cells.
+        """
+        return self.__winning_boards
+
+    def is_winning_move(self, board: int, cell: int) -> bool:
+        """
+        Return if the cell which was just marked completes a line, only its lines are checked.
+
+        :type board: int
+        :param board: The board of the player who marked the cell, including the cell.
+
+        :type cell: int
+        :param cell: The cell number, from 1.
+
+        :rtype: bool
+        :return: True if the player won.
+        """
+        line_mask: int
+        for line_mask in self.__cell_lines[cell]:
+            if board & line_mask == line_mask:
+                return True
+
+        return False
+
+
+@lru_cache(maxsize=None)
+def get_board(rows: int = 3, columns: int = 3, line_length: int = 3) -> Board:
+    """
+    Return the board of the configuration, it is computed only one time for each process.
+
+    :type rows: int
+    :param rows: Number of rows of the grid.
+
+    :type columns: int
+    :param columns: Number of columns of the grid.
+
+    :type line_length: int
+    :param line_length: Number of marks in a line which win the game.
+
+    :rtype: Board
+    :return: The board.
+    """
+    return Board(rows, columns, line_length)
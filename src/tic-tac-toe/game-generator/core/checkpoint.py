@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Checkpoints of the generation, they allow to resume a file which was stopped before it finished.
+"""
+import json
+from mmap import mmap, ACCESS_READ
+from os import path, remove, replace, truncate
+
+from numpy import ndarray, frombuffer, count_nonzero, uint8
+
+
+class Checkpoint:
+    """
+    This class stores the progress of a file in a sidecar JSON file, next to it.
+    The progress is the number of games, the size of the file and the state of the random generator
+    after those games, so the generation continues with the same random stream.
+    """
+    __filename: str
+    __checkpoint_filename: str
+
+    def __init__(self, filename: str) -> None:
+        """
+        Construction method.
+
+        :type filename: str
+        :param filename: The path and filename of the file with the games.
+
+        :rtype: None
+        """
+        self.__filename = filename
+        self.__checkpoint_filename = f'{filename}.checkpoint'
+
+    @property
+    def filename(self) -> str:
+        """
+        Return the filename of the checkpoint.
+
+        :rtype: str
+        :return: The filename, for example `records.csv.checkpoint` for `records.csv`.
+        """
+        return self.__checkpoint_filename
+
+    def exists(self) -> bool:
+        """
+        Return if the checkpoint exists.
+
+        :rtype: bool
+        :return: True if the checkpoint exists.
+        """
+        return path.exists(self.__checkpoint_filename)
+
+    def save(self, games: int, block_size: int, random_state) -> None:
+        """
+        Store the progress. The file must be flushed before, its size is the committed size.
+        The checkpoint is replaced atomically, so a stop in the middle keeps the previous checkpoint.
+
+        :type games: int
+        :param games: Number of games committed in the file.
+
+        :type block_size: int
+        :param block_size: Number of games played at the same time, the blocks must be the same to resume.
+
+        :type random_state: dict | list
+        :param random_state: The state of the random generator after the committed games.
+
+        :rtype: None
+        """
+        information: dict = {
+            'games': games,
+            'size': path.getsize(self.__filename),
+            'block_size': block_size,
+            'random_state': random_state,
+        }
+        temporary_filename: str = f'{self.__checkpoint_filename}.tmp'
+        with open(temporary_filename, 'w') as file_reference:
+            json.dump(information, file_reference)
+        replace(temporary_filename, self.__checkpoint_filename)
+
+    def load(self) -> dict:
+        """
+        Read the progress.
+
+        :rtype: dict
+        :return: The games, the size of the file, the block size and the random state.
+        """
+        with open(self.__checkpoint_filename) as file_reference:
+            return json.load(file_reference)
+
+    def delete(self) -> None:
+        """
+        Delete the checkpoint.
+
+        :rtype: None
+        """
+        if self.exists():
+            remove(self.__checkpoint_filename)
+
+
+def recover_rows(filename: str, offset: int, row_size: int = None) -> int:
+    """
+    Count the complete rows written after the offset, and truncate the incomplete row at the end of the file.
+
+    :type filename: str
+    :param filename: The path and filename of the file with the games.
+
+    :type offset: int
+    :param offset: The size of the file in the checkpoint, it is the beginning of a row.
+
+    :type row_size: int
+    :param row_size: Size in bytes of every row for the binary files. If it is `None`, the rows are lines.
+
+    :rtype: int
+    :return: The number of complete rows after the offset.
+    """
+    size: int = path.getsize(filename)
+    if size < offset:
+        raise ValueError(f'The file "{filename}" has {size} bytes, it is smaller than its checkpoint ({offset}).')
+
+    if size == offset:
+        return 0
+
+    if row_size is not None:
+        rows: int = (size - offset) // row_size
+        end: int = offset + rows * row_size
+    else:
+        with open(filename, 'rb') as file_reference, mmap(file_reference.fileno(), 0, access=ACCESS_READ) as data:
+            end: int = data.rfind(b'\n', offset) + 1 or offset
+            characters: ndarray = frombuffer(data, dtype=uint8, count=end - offset, offset=offset)
+            rows: int = int(count_nonzero(characters == ord('\n')))
+            del characters
+
+    if end < size:
+        truncate(filename, end)
+
+    return rows
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Table with all the distinct games, it samples games by index instead of playing them.
+"""
+from os import path
+
+from numpy import ndarray, random, array, load, savez, bincount, searchsorted, int8, float64
+
+from .board import CELLS, CELL_MASKS, WINNING_BOARDS
+from .game_batch import COLUMNS
+
+
+def enumerate_games() -> tuple:
+    """
+    Walk the tree of the game and return every distinct complete game, in lexicographic order of the cells.
+    The probability of a game is the probability to play it with uniform random movements.
+
+    :rtype: tuple[ndarray, ndarray]
+    :return: The games with the same columns as `Game.get_information_to_store`, and their probabilities.
+    """
+    cell_masks: list = CELL_MASKS.tolist()
+    winning_boards: list = WINNING_BOARDS.tolist()
+    games: list = []
+    probabilities: list = []
+    row: list = [0] * COLUMNS
+
+    def walk(turn: int, boards: tuple, available_cells: tuple, probability: float) -> None:
+        player: int = turn % 2
+        probability /= len(available_cells)
+        cell: int
+        for cell in available_cells:
+            board: int = boards[player] | cell_masks[cell]
+            row[turn * 2] = player + 1
+            row[turn * 2 + 1] = cell
+
+            if winning_boards[board] or turn == CELLS - 1:
+                used_columns: int = turn * 2 + 2
+                winner: int = player + 1 if winning_boards[board] else 0
+                games.append(row[:used_columns] + [0] * (COLUMNS - used_columns - 1) + [winner])
+                probabilities.append(probability)
+                continue
+
+            next_boards: tuple = (board, boards[1]) if player == 0 else (boards[0], board)
+            walk(turn + 1, next_boards, tuple(free for free in available_cells if free != cell), probability)
+
+    walk(0, (0, 0), tuple(range(1, CELLS + 1)), 1.0)
+
+    return array(games, dtype=int8), array(probabilities, dtype=float64)
+
+
+class GameTable:
+    """
+    This class keeps the table with all the distinct games and samples from it.
+    """
+    __filename: str
+    __games: ndarray
+    __probabilities: ndarray
+    __cumulative_probabilities: ndarray
+
+    def __init__(self, filename: str = 'tic-tac-toe-games.npz') -> None:
+        """
+        Construction method. It loads the table from the file, or it enumerates the games and stores them.
+
+        :type filename: str
+        :param filename: The path and filename of the cached table.
+
+        :rtype: None
+        """
+        self.__filename = filename
+
+        if path.exists(self.__filename):
+            with load(self.__filename) as table:
+                self.__games = table['games']
+                self.__probabilities = table['probabilities']
+        else:
+            self.__games, self.__probabilities = enumerate_games()
+            savez(self.__filename, games=self.__games, probabilities=self.__probabilities)
+
+        self.__cumulative_probabilities = self.__probabilities.cumsum()
+
+    def __len__(self) -> int:
+        return self.__games.shape[0]
+
+    @property
+    def filename(self) -> str:
+        """
+        Get the filename of the cached table.
+
+        :rtype: str
+        :return: The filename.
+        """
+        return self.__filename
+
+    @property
+    def games(self) -> ndarray:
+        """
+        Get all the distinct games.
+
+        :rtype: ndarray
+        :return: The games, one row per game.
+        """
+        return self.__games
+
+    @property
+    def probabilities(self) -> ndarray:
+        """
+        Get the probability of every game, playing with uniform random movements.
+
+        :rtype: ndarray
+        :return: The probabilities, in the same order as the games.
+        """
+        return self.__probabilities
+
+    def sample(self, number_games: int, seed=None) -> ndarray:
+        """
+        Return games chosen with the same probability as if they were played with random movements.
+
+        :type number_games: int
+        :param number_games: Number of games.
+
+        :type seed: int | numpy.random.Generator | None
+        :param seed: Seed or generator for the random choice. If it is `None` the results are not reproducible.
+
+        :rtype: ndarray
+        :return: The games, with the same columns as `simulate_batch`.
+        """
+        generator: random.Generator = random.default_rng(seed)
+        uniform_values: ndarray = generator.random(number_games) * self.__cumulative_probabilities[-1]
+        indexes: ndarray = searchsorted(self.__cumulative_probabilities, uniform_values, side='right')
+
+        return self.__games[indexes.clip(max=len(self) - 1)]
+
+    def get_outcome_distribution(self) -> ndarray:
+        """
+        Return the exact probability of every result, playing with uniform random movements.
+
+        :rtype: ndarray
+        :return: The probabilities of drawn game, won the player 1 and won the player 2.
+        """
+        return bincount(self.__games[:, -1], weights=self.__probabilities, minlength=3)
@@ -3,7 +3,35 @@
 """
 Handle files in the Operating System.
 """
-from os import remove, path
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from os import remove, path, cpu_count
+from queue import Queue
+from shutil import copyfileobj
+from threading import Thread
+from time import monotonic, perf_counter
+from typing import BinaryIO, Optional, Union
+
+COMPRESSIONS: tuple = ('gzip',)
+
+
+def compress_block(information: bytes, level: int = 1) -> bytes:
+    """
+    Compress a block as an independent gzip member.
+    The concatenation of the members is a valid gzip file, it is read as the concatenation of the blocks.
+
+    :type information: bytes
+    :param information: The bytes of the block.
+
+    :type level: int
+    :param level: The level of compression, from 1 (fastest) to 9 (smallest).
+
+    :rtype: bytes
+    :return: The gzip member.
+    """
+    # The window bits 16 + 15 write the gzip header and trailer, zlib releases the GIL while it compresses.
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(information) + compressor.flush()
 
 
 class File:
@@ -59,6 +87,40 @@ class File:
         """
         return self.__filename
 
+    def merge(self, filenames: list, skip_headers: bool = True, header_size: int = None,
+              delete_sources: bool = True) -> None:
+        """
+        Write the content of several files into this file, in the same order as the list.
+
+        :type filenames: list[str]
+        :param filenames: The files which will be concatenated.
+
+        :type skip_headers: bool
+        :param skip_headers: If true, it keeps the headers only from the first file.
+
+        :type header_size: int
+        :param header_size: Size in bytes of the headers. If it is `None`, the headers are the first line.
+
+        :type delete_sources: bool
+        :param delete_sources: If true, it deletes the files after they were merged.
+
+        :rtype: None
+        """
+        with open(self.__filename, 'wb') as target_reference:
+            index: int
+            filename: str
+            for index, filename in enumerate(filenames):
+                with open(filename, 'rb') as source_reference:
+                    if skip_headers and index > 0 and header_size is None:
+                        source_reference.readline()
+                    elif skip_headers and index > 0:
+                        source_reference.seek(header_size)
+                    copyfileobj(source_reference, target_reference, 16 * 1024 * 1024)
+
+        if delete_sources:
+            for filename in filenames:
+                remove(filename)
+
     def append(self, information: str) -> None:
         """
         Add information to the end of the file.
@@ -71,3 +133,258 @@ class File:
         if path.exists(self.__filename):
             with open(self.__filename, 'a') as file_reference:
                 file_reference.write(information)
+
+
+class BufferedFileWriter:
+    """
+    This class keeps the file open and writes the information in blocks.
+    The blocks are written by a background thread, so the caller continues while the disk is busy.
+    With compression, the blocks are compressed by a pool of threads and written in the same order.
+    """
+    __filename: str
+    __buffer_size: int
+    __flush_interval: float
+    __compression: Optional[str]
+    __compression_level: int
+    __compression_workers: int
+    __executor: Optional[ThreadPoolExecutor]
+    __buffer: bytearray
+    __queue: Queue
+    __thread: Optional[Thread]
+    __file_reference: Optional[BinaryIO]
+    __error: Optional[BaseException]
+    __bytes_written: int
+    __disk_seconds: float
+    __start_time: float
+    __end_time: float
+    __last_flush: float
+
+    def __init__(self, filename: str, buffer_size: int = 4 * 1024 * 1024, flush_interval: float = 1.0,
+                 queue_size: int = 8, compression: str = None, compression_level: int = 1,
+                 compression_workers: int = None) -> None:
+        """
+        Construction method.
+
+        :type filename: str
+        :param filename: File information with the path and name.
+
+        :type buffer_size: int
+        :param buffer_size: Size in bytes of the block which is handed to the background thread.
+
+        :type flush_interval: float
+        :param flush_interval: Maximum seconds that the information waits in the buffer before to be handed.
+
+        :type queue_size: int
+        :param queue_size: Maximum number of blocks waiting for the background thread.
+        If the queue is full, the caller waits until the disk is released.
+
+        :type compression: str
+        :param compression: The compression of the blocks, `gzip` or `None` for no compression.
+
+        :type compression_level: int
+        :param compression_level: The level of compression, from 1 (fastest) to 9 (smallest).
+
+        :type compression_workers: int
+        :param compression_workers: Number of threads which compress the blocks, by default the number of CPUs.
+
+        :rtype: None
+        """
+        if compression is not None and compression not in COMPRESSIONS:
+            raise ValueError(f'Unknown compression "{compression}", the options are: {", ".join(COMPRESSIONS)}.')
+
+        self.__filename = filename
+        self.__buffer_size = buffer_size
+        self.__flush_interval = flush_interval
+        self.__compression = compression
+        self.__compression_level = compression_level
+        self.__compression_workers = compression_workers or cpu_count() or 1
+        self.__executor = None
+        self.__buffer = bytearray()
+        self.__queue = Queue(maxsize=queue_size)
+        self.__thread = None
+        self.__file_reference = None
+        self.__error = None
+        self.__bytes_written = 0
+        self.__disk_seconds = 0.0
+        self.__start_time = 0.0
+        self.__end_time = 0.0
+        self.__last_flush = 0.0
+
+    def __enter__(self) -> 'BufferedFileWriter':
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def filename(self) -> str:
+        """
+        Return the filename.
+
+        :rtype: str
+        :return: The filename.
+        """
+        return self.__filename
+
+    @property
+    def bytes_written(self) -> int:
+        """
+        Return the number of bytes already written in the file, after the compression.
+
+        :rtype: int
+        :return: The bytes written.
+        """
+        return self.__bytes_written
+
+    @property
+    def disk_seconds(self) -> float:
+        """
+        Return the seconds which the background thread spent writing in the file, without the compression.
+
+        :rtype: float
+        :return: The seconds.
+        """
+        return self.__disk_seconds
+
+    @property
+    def duration(self) -> float:
+        """
+        Return the seconds since the file was opened until it was closed, or until now if it is open.
+
+        :rtype: float
+        :return: The duration in seconds.
+        """
+        end_time: float = monotonic() if self.__file_reference else self.__end_time
+        return end_time - self.__start_time
+
+    @property
+    def bytes_per_second(self) -> float:
+        """
+        Return the write throughput.
+
+        :rtype: float
+        :return: The bytes written per second.
+        """
+        duration: float = self.duration
+        return self.__bytes_written / duration if duration > 0 else 0.0
+
+    def open(self, overwrite: bool = True) -> None:
+        """
+        Open the file and start the background thread.
+
+        :type overwrite: bool
+        :param overwrite: If true, it truncates the file. Otherwise, it appends the information.
+
+        :rtype: None
+        """
+        self.__file_reference = open(self.__filename, 'wb' if overwrite else 'ab')
+        self.__error = None
+        self.__bytes_written = 0
+        self.__disk_seconds = 0.0
+        self.__start_time = monotonic()
+        self.__last_flush = self.__start_time
+        if self.__compression is not None:
+            self.__executor = ThreadPoolExecutor(max_workers=self.__compression_workers,
+                                                 thread_name_prefix=f'compressor-{self.__filename}')
+        self.__thread = Thread(target=self.__write_blocks, name=f'writer-{self.__filename}', daemon=True)
+        self.__thread.start()
+
+    def write(self, information: bytes) -> None:
+        """
+        Add information to the buffer, it is handed to the background thread when the buffer is full
+        or when the flush interval is reached.
+
+        :type information: bytes
+        :param information: Bytes which will be added in the file.
+
+        :rtype: None
+        """
+        self.__raise_error()
+        self.__buffer += information
+
+        if len(self.__buffer) >= self.__buffer_size or monotonic() - self.__last_flush >= self.__flush_interval:
+            self.__hand_buffer()
+
+    def flush(self) -> None:
+        """
+        Write all the pending information in the file and wait until it finishes.
+
+        :rtype: None
+        """
+        self.__hand_buffer()
+        self.__queue.join()
+        self.__raise_error()
+        self.__file_reference.flush()
+
+    def close(self) -> None:
+        """
+        Write all the pending information, stop the background thread and close the file.
+
+        :rtype: None
+        """
+        if not self.__file_reference:
+            return
+
+        try:
+            self.__hand_buffer()
+            self.__queue.put(None)
+            self.__thread.join()
+        finally:
+            if self.__executor is not None:
+                self.__executor.shutdown()
+                self.__executor = None
+            self.__file_reference.close()
+            self.__file_reference = None
+            self.__end_time = monotonic()
+
+        self.__raise_error()
+
+    def __hand_buffer(self) -> None:
+        """
+        Hand the buffer to the background thread and start a new one.
+
+        :rtype: None
+        """
+        if self.__buffer:
+            if self.__executor is not None:
+                self.__queue.put(self.__executor.submit(compress_block, self.__buffer, self.__compression_level))
+            else:
+                self.__queue.put(self.__buffer)
+            self.__buffer = bytearray()
+
+        self.__last_flush = monotonic()
+
+    def __write_blocks(self) -> None:
+        """
+        Loop of the background thread, it writes the blocks until it receives `None`.
+
+        :rtype: None
+        """
+        while True:
+            block: Union[bytearray, Future, None] = self.__queue.get()
+            try:
+                if block is None:
+                    return
+
+                if isinstance(block, Future):
+                    block = block.result()
+
+                if self.__error is None:
+                    start_time: float = perf_counter()
+                    self.__file_reference.write(block)
+                    self.__disk_seconds += perf_counter() - start_time
+                    self.__bytes_written += len(block)
+            except BaseException as error:
+                self.__error = error
+            finally:
+                self.__queue.task_done()
+
+    def __raise_error(self) -> None:
+        """
+        Raise in the caller the error which happened in the background thread.
+
+        :rtype: None
+        """
+        if self.__error is not None:
+            raise self.__error
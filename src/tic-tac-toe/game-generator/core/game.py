@@ -5,15 +5,25 @@ The main class for the game.
 """
 from numpy import random
 
-from core.file import File
-from core.history import Record, History
+from .board import CELLS, CELL_MASKS, WINNING_BOARDS, Board, get_board
+from .file import File
+from .history import History
+from .policy import Policy, RandomPolicy
+
+# Lookup tables as lists, indexing them with integers is faster than with NumPy arrays.
+_CELL_MASKS: list = CELL_MASKS.tolist()
+_WINNING_BOARDS: list = WINNING_BOARDS.tolist()
 
 
 class Game:
     """
     This class compute the Tic Tac Toe game.
+    The board of each player is an integer of 9 bits, the bit 0 is the cell 1.
+    Other m,n,k boards have one bit per cell, and only the lines through the marked cell are checked.
     """
-    __grid: list
+    __board: Board
+    __boards: list
+    __policies: tuple
     __player_1: int
     __player_2: int
     __turns: int
@@ -21,22 +31,30 @@ class Game:
     __history: History
     __csv_file: File
 
-    def __init__(self) -> None:
+    def __init__(self, policies: tuple = None, board: Board = None) -> None:
         """
         Construction method.
 
+        :type policies: tuple[Policy, Policy]
+        :param policies: The policies which choose the movements of the player 1 and the player 2.
+        By default, both players choose random movements.
+
+        :type board: Board
+        :param board: The configuration of the board. By default, the 3x3 board with 3 in a row.
+        The policies which are not random only play on the 3x3 board.
+
         :rtype: None
         """
-        self.__grid = [
-            0, 0, 0,
-            0, 0, 0,
-            0, 0, 0,
-        ]
+        self.__board = board if board is not None else get_board()
+        self.__boards = [0, 0]
+        self.__policies = policies if policies is not None else (RandomPolicy(), RandomPolicy())
+        if not self.__board.is_standard and not all(isinstance(policy, RandomPolicy) for policy in self.__policies):
+            raise ValueError('Only the random policy plays on boards different than 3x3 with 3 in a row.')
         self.__player_1 = 1
         self.__player_2 = 2
-        self.__turns = 9
+        self.__turns = self.__board.cells
         self.__winner = 0
-        self.__history = History()
+        self.__history = History(self.__turns)
 
     def play(self) -> int:
         """
@@ -45,38 +63,28 @@ class Game:
         :rtype: int
         :return: Returns 0 if the game is drawn; 1 if won the player 1; 2 if won the player 2.
         """
-        available_cells: list = [1, 2, 3, 4, 5, 6, 7, 8, 9]
+        available_cells: list = list(range(1, self.__turns + 1))
+        is_standard: bool = self.__board.is_standard
 
         turn: int
         for turn in range(1, self.__turns + 1):
-            cell: int = random.choice(available_cells)
-            available_cell_index: int = available_cells.index(cell)
-            available_cells.pop(available_cell_index)
-            cell_index: int = cell - 1
+            board_index: int = (turn - 1) % 2
+            policy: Policy = self.__policies[board_index]
+            candidate_cells: list = available_cells
+            if not isinstance(policy, RandomPolicy):
+                candidates: int = policy.get_candidates(self.__boards[board_index], self.__boards[1 - board_index],
+                                                        random)
+                candidate_cells = [cell for cell in available_cells if candidates >> (cell - 1) & 1]
+            cell: int = random.choice(candidate_cells)
+            available_cells.remove(cell)
             player_id: int = self.__player_1 if turn % 2 else self.__player_2
-            self.__grid[cell_index]: int = player_id
-            record = Record(player=player_id, turn=turn, cell=cell)
-            self.__history.append(record)
-
-            if turn < 5:
-                continue
-
-            player: int
-            for player in [self.__player_1, self.__player_2]:
-                marks_to_win: list = [player, player, player]
-                row_1: bool = self.__grid[:3] == marks_to_win
-                row_2: bool = self.__grid[3:6] == marks_to_win
-                row_3: bool = self.__grid[6:9] == marks_to_win
-                column_1: bool = self.__grid[::3] == marks_to_win
-                column_2: bool = self.__grid[1::3] == marks_to_win
-                column_3: bool = self.__grid[2::3] == marks_to_win
-                cross_1: bool = self.__grid[::4] == marks_to_win
-                cross_2: bool = self.__grid[2:8:2] == marks_to_win
-                if row_1 or row_2 or row_3 or column_1 or column_2 or column_3 or cross_1 or cross_2:
-                    self.__winner: int = player
-                    break
-
-            if self.__winner:
+            board: int = self.__boards[board_index] | (_CELL_MASKS[cell] if is_standard else 1 << (cell - 1))
+            self.__boards[board_index] = board
+            self.__history.add(player_id, cell)
+
+            # Only the player who marked the cell can win in this turn, with a line through the cell.
+            if _WINNING_BOARDS[board] if is_standard else self.__board.is_winning_move(board, cell):
+                self.__winner = player_id
                 break
 
         return self.__winner
@@ -87,12 +95,14 @@ class Game:
 
         :rtype: None
         """
+        grid: list = self.grid
+        columns: int = self.__board.columns
         print('=========')
         print('| GRID  |')
         print('=========')
-        print(self.__grid[:3])
-        print(self.__grid[3:6])
-        print(self.__grid[6:])
+        row: int
+        for row in range(self.__board.rows):
+            print(grid[row * columns:(row + 1) * columns])
         print()
 
     def display_winner(self) -> None:
@@ -119,7 +129,13 @@ class Game:
         :rtype: list
         :return: Return the Grid
         """
-        return self.__grid
+        board_1: int
+        board_2: int
+        board_1, board_2 = self.__boards
+        return [
+            self.__player_1 if board_1 >> index & 1 else self.__player_2 if board_2 >> index & 1 else 0
+            for index in range(self.__turns)
+        ]
 
     @property
     def history(self) -> History:
@@ -142,17 +158,18 @@ class Game:
         return self.__winner
 
     @staticmethod
-    def get_headers_to_store() -> str:
+    def get_headers_to_store(cells: int = CELLS) -> str:
         """
         Return the headers for the CSV file.
 
+        :type cells: int
+        :param cells: Number of cells of the board, there is one turn per cell.
+
         :rtype: str
         :return: The headers.
         """
-        headers: str = 'turn_1_player,turn_1_cell,turn_2_player,turn_2_cell,turn_3_player,turn_3_cell,' \
-                       'turn_4_player,turn_4_cell,turn_5_player,turn_5_cell,turn_6_player,turn_6_cell,' \
-                       'turn_7_player,turn_7_cell,turn_8_player,turn_8_cell,turn_9_player,turn_9_cell,' \
-                       'winner'
+        headers: str = ''.join(f'turn_{turn}_player,turn_{turn}_cell,' for turn in range(1, cells + 1))
+        headers += 'winner'
 
         return headers
 
@@ -165,14 +182,12 @@ class Game:
         :return: Information about the game.
         """
         information: str = ''.join(
-            f'{record.player},{record.cell},'
-            for record in self.__history.records()
+            f'{player},{cell},'
+            for player, cell in zip(self.__history.players, self.__history.cells)
         )
 
-        total_records: int = len(self.__history.records())
-        for _ in range(total_records, 9):
-            information += '0,0,'
-
+        total_records: int = len(self.__history)
+        information += '0,0,' * (self.__turns - total_records)
         information += f'{self.__winner}'
 
         return information
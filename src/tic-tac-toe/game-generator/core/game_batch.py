@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Vectorized engine which plays many games at the same time.
+"""
+from numpy import ndarray, random, arange, tile, empty, zeros, ones, where, int8, int16, int64, uint8, uint16, uint64
+
+from .board import CELLS, CELL_MASKS, WINNING_BOARDS, Board
+from .policy import RandomPolicy
+
+# Columns in the information: player and cell for each turn, plus the winner.
+COLUMNS: int = CELLS * 2 + 1
+
+# Player ID for every turn, the player 1 plays the odd turns and the player 2 the even turns.
+_TURN_PLAYERS: ndarray = (arange(CELLS) % 2 + 1).astype(int8)
+
+
+def simulate_batch(number_games: int, seed=None, policies: tuple = None, board: Board = None) -> ndarray:
+    """
+    Play a batch of games with random movements.
+    Every game is a random permutation of the cells, it is cut in the turn where a player won.
+    Boards bigger than 4x4 have no lookup table of the winning boards, every turn checks only the lines
+    through its cell, so the cost grows with the line length instead of the area of the board.
+
+    :type number_games: int
+    :param number_games: Number of games which will play.
+
+    :type seed: int | numpy.random.Generator | None
+    :param seed: Seed or generator for the random movements. If it is `None` the results are not reproducible.
+
+    :type policies: tuple[Policy, Policy]
+    :param policies: The policies of the player 1 and the player 2. If it is `None` or both are random,
+    the games are random permutations; otherwise the games are played turn by turn, see `simulate_batch_policies`.
+
+    :type board: Board
+    :param board: The configuration of the board. By default, the 3x3 board with 3 in a row.
+
+    :rtype: ndarray
+    :return: Matrix with one row per game, the columns are the same as `Game.get_information_to_store`.
+    """
+    generator: random.Generator = random.default_rng(seed)
+    if policies is not None and not all(isinstance(policy, RandomPolicy) for policy in policies):
+        if board is not None and not board.is_standard:
+            raise ValueError('Only the random policy plays on boards different than 3x3 with 3 in a row.')
+        return simulate_batch_policies(number_games, policies, generator)
+
+    if board is not None and not board.is_standard:
+        return _simulate_batch_board(number_games, generator, board)
+
+    cells: ndarray = generator.permuted(tile(arange(1, CELLS + 1, dtype=int8), (number_games, 1)), axis=1)
+
+    # Board of the player who marked the cell, after each turn.
+    cell_masks: ndarray = CELL_MASKS.astype(uint16)[cells]
+    boards: ndarray = empty(cells.shape, dtype=uint16)
+    boards[:, 0::2] = cell_masks[:, 0::2].cumsum(axis=1, dtype=uint16)
+    boards[:, 1::2] = cell_masks[:, 1::2].cumsum(axis=1, dtype=uint16)
+
+    wins: ndarray = WINNING_BOARDS[boards]
+    has_winner: ndarray = wins.any(axis=1)
+    winning_turn: ndarray = wins.argmax(axis=1)
+    last_turn: ndarray = where(has_winner, winning_turn, CELLS - 1)
+    played: ndarray = arange(CELLS) <= last_turn[:, None]
+
+    games: ndarray = empty((number_games, COLUMNS), dtype=int8)
+    games[:, 0:-1:2] = _TURN_PLAYERS * played
+    games[:, 1:-1:2] = cells * played
+    games[:, -1] = where(has_winner, winning_turn % 2 + 1, 0)
+
+    return games
+
+
+def _simulate_batch_board(number_games: int, generator: random.Generator, board: Board) -> ndarray:
+    """
+    Play a batch of games with random movements on any m,n,k board, see `simulate_batch`.
+
+    :type number_games: int
+    :param number_games: Number of games which will play.
+
+    :type generator: numpy.random.Generator
+    :param generator: Generator for the random movements.
+
+    :type board: Board
+    :param board: The configuration of the board.
+
+    :rtype: ndarray
+    :return: Matrix with one row per game, with two columns per cell plus the winner.
+    """
+    number_cells: int = board.cells
+    cells: ndarray = generator.permuted(tile(arange(1, number_cells + 1, dtype=int8), (number_games, 1)), axis=1)
+
+    # Board of the player who marked the cell, after each turn.
+    cell_masks: ndarray = (uint64(1) << (cells.astype(uint64) - uint64(1)))
+    boards: ndarray = empty(cells.shape, dtype=uint64)
+    boards[:, 0::2] = cell_masks[:, 0::2].cumsum(axis=1, dtype=uint64)
+    boards[:, 1::2] = cell_masks[:, 1::2].cumsum(axis=1, dtype=uint64)
+
+    if board.winning_boards is not None:
+        wins: ndarray = board.winning_boards[boards]
+    else:
+        wins: ndarray = empty(cells.shape, dtype=bool)
+        turn: int
+        for turn in range(number_cells):
+            line_masks: ndarray = board.cell_line_masks[cells[:, turn]]
+            wins[:, turn] = ((boards[:, turn, None] & line_masks) == line_masks).any(axis=1)
+
+    has_winner: ndarray = wins.any(axis=1)
+    winning_turn: ndarray = wins.argmax(axis=1)
+    last_turn: ndarray = where(has_winner, winning_turn, number_cells - 1)
+    played: ndarray = arange(number_cells) <= last_turn[:, None]
+
+    games: ndarray = empty((number_games, number_cells * 2 + 1), dtype=int8)
+    games[:, 0:-1:2] = (arange(number_cells) % 2 + 1).astype(int8) * played
+    games[:, 1:-1:2] = cells * played
+    games[:, -1] = where(has_winner, winning_turn % 2 + 1, 0)
+
+    return games
+
+
+def simulate_batch_policies(number_games: int, policies: tuple, seed=None) -> ndarray:
+    """
+    Play a batch of games turn by turn, every player chooses the candidate cells with its policy.
+    The cell is chosen with uniform probability between the candidates.
+
+    :type number_games: int
+    :param number_games: Number of games which will play.
+
+    :type policies: tuple[Policy, Policy]
+    :param policies: The policies of the player 1 and the player 2.
+
+    :type seed: int | numpy.random.Generator | None
+    :param seed: Seed or generator for the random movements. If it is `None` the results are not reproducible.
+
+    :rtype: ndarray
+    :return: Matrix with one row per game, the columns are the same as `Game.get_information_to_store`.
+    """
+    generator: random.Generator = random.default_rng(seed)
+    boards: ndarray = zeros((2, number_games), dtype=int64)
+    playing: ndarray = ones(number_games, dtype=bool)
+    cell_bits: ndarray = arange(CELLS)
+
+    games: ndarray = zeros((number_games, COLUMNS), dtype=int8)
+    turn: int
+    for turn in range(CELLS):
+        board_index: int = turn % 2
+        candidates: ndarray = policies[board_index].get_candidates(boards[board_index], boards[1 - board_index],
+                                                                   generator)
+        is_candidate: ndarray = (candidates[:, None] >> cell_bits) & 1
+        # The random keys are in [1, 2) for the candidates, so the maximum is always a candidate.
+        cell_index: ndarray = ((generator.random((number_games, CELLS)) + 1) * is_candidate).argmax(axis=1)
+
+        boards[board_index] |= where(playing, 1 << cell_index, 0)
+        games[:, turn * 2] = where(playing, board_index + 1, 0)
+        games[:, turn * 2 + 1] = where(playing, cell_index + 1, 0)
+
+        won: ndarray = playing & WINNING_BOARDS[boards[board_index]]
+        games[won, -1] = board_index + 1
+        playing &= ~won
+
+    return games
+
+
+def get_information_to_store(games: ndarray) -> bytes:
+    """
+    Return the information of the games as lines for the CSV file.
+
+    :type games: ndarray
+    :param games: Matrix with the games, as returned by `simulate_batch`.
+
+    :rtype: bytes
+    :return: One line per game, every line finish with a new line character.
+    """
+    if games.size == 0 or games.max() < 10:
+        characters: ndarray = empty((games.shape[0], games.shape[1] * 2), dtype=uint8)
+        characters[:, 0::2] = games + ord('0')
+        characters[:, 1::2] = ord(',')
+        characters[:, -1] = ord('\n')
+
+        return characters.tobytes()
+
+    # The cells of the big boards have many digits: every value is aligned to the right with zero bytes,
+    # which are removed after the formatting.
+    values: ndarray = games.astype(int16)
+    digits: int = len(str(int(values.max())))
+    characters: ndarray = zeros((games.shape[0], games.shape[1], digits + 1), dtype=uint8)
+    position: int
+    for position in range(digits):
+        place: int = 10 ** (digits - 1 - position)
+        digit: ndarray = (values // place % 10 + ord('0')).astype(uint8)
+        characters[:, :, position] = digit if place == 1 else where(values >= place, digit, 0)
+    characters[:, :, -1] = ord(',')
+    characters[:, -1, -1] = ord('\n')
+
+    return characters[characters != 0].tobytes()
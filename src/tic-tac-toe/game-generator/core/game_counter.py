@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Count the distinct games, so every game is stored one time with its number of occurrences.
+"""
+from numpy import ndarray, bincount, concatenate, empty, ones, unique, ascontiguousarray, int8, int64, dtype
+
+from .game_batch import get_information_to_store
+
+# Name of the column with the occurrences of every game.
+COUNT_COLUMN: str = 'count'
+
+
+class GameCounter:
+    """
+    This class keeps the distinct games in a sorted array with their counts.
+    The memory depends on the number of distinct games, not on the number of games added.
+    """
+    __columns: int
+    __games: ndarray
+    __counts: ndarray
+
+    def __init__(self, columns: int) -> None:
+        """
+        Construction method.
+
+        :type columns: int
+        :param columns: Number of columns of every game.
+
+        :rtype: None
+        """
+        self.__columns = columns
+        self.__games = empty((0, columns), dtype=int8)
+        self.__counts = empty(0, dtype=int64)
+
+    def __len__(self) -> int:
+        return self.__games.shape[0]
+
+    @property
+    def games(self) -> ndarray:
+        """
+        Get the distinct games, sorted by their bytes.
+
+        :rtype: ndarray
+        :return: The games, one row per game.
+        """
+        return self.__games
+
+    @property
+    def counts(self) -> ndarray:
+        """
+        Get the occurrences of every distinct game.
+
+        :rtype: ndarray
+        :return: The counts, in the same order as the games.
+        """
+        return self.__counts
+
+    @property
+    def total(self) -> int:
+        """
+        Get the number of games added, including the repeated ones.
+
+        :rtype: int
+        :return: The number of games.
+        """
+        return int(self.__counts.sum())
+
+    def add(self, games: ndarray, counts: ndarray = None) -> None:
+        """
+        Add games to the counter.
+
+        :type games: ndarray
+        :param games: The games, one row per game.
+
+        :type counts: ndarray
+        :param counts: The occurrences of every game, by default one.
+
+        :rtype: None
+        """
+        if counts is None:
+            counts = ones(games.shape[0], dtype=int64)
+
+        # Every row is compared as a single value of bytes, it is faster than to compare the columns.
+        row_type: dtype = dtype((bytes, self.__columns))
+        rows: ndarray = concatenate([self.__games, ascontiguousarray(games, dtype=int8)]).view(row_type).ravel()
+        unique_rows: ndarray
+        inverse: ndarray
+        unique_rows, inverse = unique(rows, return_inverse=True)
+
+        self.__games = unique_rows.view(int8).reshape(-1, self.__columns)
+        self.__counts = bincount(inverse.ravel(), weights=concatenate([self.__counts, counts]),
+                                 minlength=len(unique_rows)).astype(int64)
+
+    def merge(self, game_counter: 'GameCounter') -> None:
+        """
+        Add the games of other counter.
+
+        :type game_counter: GameCounter
+        :param game_counter: The other counter.
+
+        :rtype: None
+        """
+        self.add(game_counter.games, game_counter.counts)
+
+    def get_information_to_store(self) -> bytes:
+        """
+        Return the distinct games as lines for the CSV file, the last column is the count.
+
+        :rtype: bytes
+        :return: One line per distinct game, every line finish with a new line character.
+        """
+        lines: list = get_information_to_store(self.__games).decode().splitlines()
+        return ''.join(f'{line},{count}\n' for line, count in zip(lines, self.__counts.tolist())).encode()
@@ -9,6 +9,7 @@ class Record:
     """
     This class store the records for each turn.
     """
+    __slots__ = ('__player', '__turn', '__cell')
     __player: int
     __turn: int
     __cell: int
@@ -66,17 +67,73 @@ class Record:
 class History:
     """
     This class keep the record of the turns and the movements.
+    The players and cells are stored in fixed arrays of bytes, the records are created only when they are requested.
     """
-    __records: list[Record]
+    __slots__ = ('__players', '__cells', '__total_turns')
+    __players: bytearray
+    __cells: bytearray
+    __total_turns: int
 
-    def __init__(self):
-        self.__records: list[Record] = []
+    def __init__(self, turns: int = 9) -> None:
+        """
+        Construction method.
+
+        :type turns: int
+        :param turns: Maximum number of turns in the game.
+
+        :rtype: None
+        """
+        self.__players = bytearray(turns)
+        self.__cells = bytearray(turns)
+        self.__total_turns = 0
+
+    def __len__(self) -> int:
+        return self.__total_turns
+
+    @property
+    def players(self) -> bytes:
+        """
+        Get the player ID for each turn.
+
+        :rtype: bytes
+        :return: The players, one byte per turn.
+        """
+        return bytes(self.__players[:self.__total_turns])
+
+    @property
+    def cells(self) -> bytes:
+        """
+        Get the cell marked in each turn.
+
+        :rtype: bytes
+        :return: The cells, one byte per turn.
+        """
+        return bytes(self.__cells[:self.__total_turns])
 
     def records(self) -> list[Record]:
         """
         Return the records of the history for each turn.
         """
-        return self.__records
+        return [
+            Record(player=self.__players[index], turn=index + 1, cell=self.__cells[index])
+            for index in range(self.__total_turns)
+        ]
+
+    def add(self, player: int, cell: int) -> None:
+        """
+        Add the movement of the next turn to the history.
+
+        :type player: int
+        :param player: Player ID.
+
+        :type cell: int
+        :param cell: Cell number of the position of the marked option.
+
+        :rtype: None
+        """
+        self.__players[self.__total_turns] = player
+        self.__cells[self.__total_turns] = cell
+        self.__total_turns += 1
 
     def append(self, record: Record) -> None:
         """
@@ -87,4 +144,4 @@ class History:
 
         :rtype: None
         """
-        self.__records.append(record)
+        self.add(record.player, record.cell)
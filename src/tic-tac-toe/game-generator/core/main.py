@@ -3,10 +3,37 @@
 """
 Start the loop of the Tic Tac Toe games.
 """
-from core.game import Game
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import repeat
+from os import cpu_count, path
+from time import perf_counter
+from typing import Callable
 
+from numpy import random, array, int8, uint32
 
-def start(number_games: int, csv_filename: str) -> None:
+from .binary_file import get_header
+from .board import Board, get_board
+from .checkpoint import Checkpoint, recover_rows
+from .enumeration import GameTable
+from .file import File, BufferedFileWriter, COMPRESSIONS, compress_block
+from .game import Game
+from .game_counter import GameCounter, COUNT_COLUMN
+from .metrics import GenerationMetrics
+from .game_batch import simulate_batch, get_information_to_store
+from .policy import Policy, RandomPolicy
+
+ENGINES: tuple = ('batch', 'table', 'single')
+FILE_FORMATS: tuple = ('csv', 'binary')
+
+
+def start(number_games: int, csv_filename: str, engine: str = 'batch', seed=None,
+          block_size: int = 100000, buffer_size: int = 4 * 1024 * 1024, flush_interval: float = 1.0,
+          workers: int = 1, merge_shards: bool = True, file_format: str = 'csv',
+          table_filename: str = 'tic-tac-toe-games.npz', policies: tuple = None, deduplicate: bool = False,
+          resume: bool = False, checkpoint_interval: float = 60.0, compression: str = None,
+          compression_level: int = 1, report_interval: float = None, report_callback: Callable = None,
+          splits: dict = None, rows: int = 3, columns: int = 3, line_length: int = 3) -> None:
     """
     Start the loop of the games.
 
@@ -16,17 +43,756 @@ def start(number_games: int, csv_filename: str) -> None:
     :type csv_filename: str
     :param csv_filename: The path and filename where the information will be storage.
 
+    :type engine: str
+    :param engine: The engine which plays the games: `batch` plays blocks of games with NumPy arrays,
+    `table` samples blocks of games from the table of all the distinct games, `single` plays one `Game` at a time.
+
+    :type seed: int | numpy.random.SeedSequence
+    :param seed: Seed for the random movements. If it is `None` the results are not reproducible.
+
+    :type block_size: int
+    :param block_size: Number of games played at the same time by the `batch` engine.
+
+    :type buffer_size: int
+    :param buffer_size: Size in bytes of the blocks written in the CSV file by the background thread.
+
+    :type flush_interval: float
+    :param flush_interval: Maximum seconds that the records wait in memory before to be written.
+
+    :type workers: int
+    :param workers: Number of processes which play the games. Every process writes its own shard file,
+    with an independent random stream spawned from the seed.
+
+    :type merge_shards: bool
+    :param merge_shards: If true, the shard files are merged in order into the CSV file and deleted.
+
+    :type file_format: str
+    :param file_format: The format of the file: `csv` is text with comma separated values,
+    `binary` is a header and one byte per column, see `core.binary_file`.
+
+    :type table_filename: str
+    :param table_filename: The path and filename of the cached table of games, used by the `table` engine.
+    It is created the first time.
+
+    :type policies: tuple[Policy, Policy]
+    :param policies: The policies which choose the movements of the player 1 and the player 2.
+    By default, both players choose random movements.
+
+    :type deduplicate: bool
+    :param deduplicate: If true, every distinct game is stored one time with the column `count`,
+    which has its number of occurrences. The workers count their games and the counters are merged in one file.
+    Only for the `csv` format.
+
+    :type resume: bool
+    :param resume: If true, it continues the files which were stopped before they finished, from their checkpoints.
+    The games already written are kept, and the random streams continue from the state in the checkpoints.
+    The checkpoints are deleted when the file is complete, or when the shards are merged.
+
+    :type checkpoint_interval: float
+    :param checkpoint_interval: Seconds between the checkpoints, see `core.checkpoint`.
+
+    :type compression: str
+    :param compression: The compression of the CSV file, `gzip` or `None`. The blocks are compressed by a pool
+    of threads as independent gzip members, the file is read as a normal gzip file.
+
+    :type compression_level: int
+    :param compression_level: The level of compression, from 1 (fastest) to 9 (smallest).
+
+    :type report_interval: float
+    :param report_interval: Seconds between the reports of the progress in the standard error, every worker
+    reports its own progress. If it is `None`, only the summary is displayed. See `core.metrics`.
+
+    :type report_callback: Callable
+    :param report_callback: Function which receives the metrics of every report and of the summary.
+    With workers, it runs in every process, so it must be picklable.
+
+    :type splits: dict[str, float]
+    :param splits: The ratio of the games for every split, for example `{'train': 0.98, 'test': 0.02}`.
+    Every split has its own file, see `get_split_filenames`, with the exact number of games of its ratio
+    and an independent random stream spawned from the seed. If it is `None`, all the games are in one file.
+
+    :type rows: int
+    :param rows: Number of rows of the board.
+
+    :type columns: int
+    :param columns: Number of columns of the board.
+
+    :type line_length: int
+    :param line_length: Number of marks in a line which win the game. The boards different than 3x3 with
+    3 in a row are only played with random movements by the `batch` and `single` engines, see `core.board`.
+
     :rtype: None
     """
-    first_loop = True
-    for _ in range(number_games):
-        game = Game()
+    if splits is not None:
+        split_seeds: list = _get_seed_sequence(seed).spawn(len(splits))
+        split_games: list = get_split_games(number_games, splits)
+        split_filename: str
+        split_number_games: int
+        split_seed: random.SeedSequence
+        for split_filename, split_number_games, split_seed in zip(get_split_filenames(csv_filename, splits),
+                                                                  split_games, split_seeds):
+            start(split_number_games, split_filename, engine=engine, seed=split_seed, block_size=block_size,
+                  buffer_size=buffer_size, flush_interval=flush_interval, workers=workers,
+                  merge_shards=merge_shards, file_format=file_format, table_filename=table_filename,
+                  policies=policies, deduplicate=deduplicate, resume=resume, checkpoint_interval=checkpoint_interval,
+                  compression=compression, compression_level=compression_level,
+                  report_interval=report_interval, report_callback=report_callback,
+                  rows=rows, columns=columns, line_length=line_length)
+        return
+
+    if engine not in ENGINES:
+        raise ValueError(f'Unknown engine "{engine}", the options are: {", ".join(ENGINES)}.')
+
+    if file_format not in FILE_FORMATS:
+        raise ValueError(f'Unknown file format "{file_format}", the options are: {", ".join(FILE_FORMATS)}.')
+
+    if workers < 1:
+        raise ValueError(f'The number of workers must be at least 1, got {workers}.')
+
+    if deduplicate and file_format != 'csv':
+        raise ValueError('The deduplicated games are only stored in the csv format, the count needs more than a byte.')
+
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError(f'Unknown compression "{compression}", the options are: {", ".join(COMPRESSIONS)}.')
+
+    if compression is not None and file_format != 'csv':
+        raise ValueError('The compression is only for the csv format, the binary format is memory-mapped.')
+
+    if compression is not None and resume:
+        raise ValueError('The compressed files cannot be resumed, their size does not match the checkpoints.')
+
+    if deduplicate and resume:
+        raise ValueError('The deduplicated games are counted in memory, they cannot be resumed.')
+
+    if resume and workers > 1 and path.exists(csv_filename):
+        raise ValueError(f'The file "{csv_filename}" has the shards already merged, there is nothing to resume.')
+
+    if policies is None:
+        policies = (RandomPolicy(), RandomPolicy())
+
+    if engine == 'table' and not all(isinstance(policy, RandomPolicy) for policy in policies):
+        raise ValueError('The table engine samples games with random movements, it does not support other policies.')
+
+    board: Board = get_board(rows, columns, line_length)
+    if engine == 'table' and not board.is_standard:
+        raise ValueError('The table engine only has the games of the board 3x3 with 3 in a row.')
+
+    if not board.is_standard and not all(isinstance(policy, RandomPolicy) for policy in policies):
+        raise ValueError('Only the random policy plays on boards different than 3x3 with 3 in a row.')
+
+    policy: Policy
+    for policy in policies:
+        policy.prepare()
+
+    seed_sequence: random.SeedSequence = _get_seed_sequence(seed)
+    headers: bytes = _get_headers(file_format, seed_sequence, workers, board)
+    metrics: GenerationMetrics = GenerationMetrics(callback=report_callback)
+
+    if engine == 'table':
+        GameTable(table_filename)
+
+    if deduplicate:
+        metrics.merge(_generate_deduplicated(csv_filename, number_games, engine, seed_sequence, block_size,
+                                             buffer_size, flush_interval, workers, headers,
+                                             table_filename, policies, compression, compression_level, board))
+    elif workers == 1:
+        metrics.merge(generate(csv_filename, number_games, engine, seed_sequence,
+                               block_size, buffer_size, flush_interval, file_format, headers,
+                               table_filename, policies, resume, checkpoint_interval,
+                               compression, compression_level, report_interval, report_callback, board))
+        Checkpoint(csv_filename).delete()
+    else:
+        shard_filenames: list = get_shard_filenames(csv_filename, workers)
+        shard_games: list = [number_games // workers + (index < number_games % workers) for index in range(workers)]
+        # The CPUs are shared by the workers, every worker compresses its shard with its part of them.
+        compression_workers: int = max(1, (cpu_count() or 1) // workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            shard_metrics: GenerationMetrics
+            for shard_metrics in executor.map(
+                    generate, shard_filenames, shard_games, repeat(engine), seed_sequence.spawn(workers),
+                    repeat(block_size), repeat(buffer_size), repeat(flush_interval),
+                    repeat(file_format), repeat(headers), repeat(table_filename), repeat(policies),
+                    repeat(resume), repeat(checkpoint_interval), repeat(compression), repeat(compression_level),
+                    repeat(report_interval), repeat(report_callback), repeat(board), repeat(compression_workers),
+            ):
+                metrics.merge(shard_metrics)
+
+        if merge_shards:
+            # The compressed headers are the first gzip member of every shard, they are always the same bytes.
+            header_size: int = len(compress_block(headers, compression_level)) if compression else len(headers)
+            File(csv_filename).merge(shard_filenames, header_size=header_size)
+            shard_filename: str
+            for shard_filename in shard_filenames:
+                Checkpoint(shard_filename).delete()
+
+    metrics.display_summary(csv_filename, seed_sequence.entropy)
+
+
+def generate(csv_filename: str, number_games: int, engine: str, seed_sequence: random.SeedSequence,
+             block_size: int, buffer_size: int, flush_interval: float,
+             file_format: str = 'csv', headers: bytes = None,
+             table_filename: str = 'tic-tac-toe-games.npz', policies: tuple = None,
+             resume: bool = False, checkpoint_interval: float = 60.0, compression: str = None,
+             compression_level: int = 1, report_interval: float = None,
+             report_callback: Callable = None, board: Board = None,
+             compression_workers: int = None) -> GenerationMetrics:
+    """
+    Play the games and write them in one file, with its headers.
+    The progress is stored periodically in a checkpoint, next to the file.
+
+    :type csv_filename: str
+    :param csv_filename: The path and filename where the information will be storage.
+
+    :type number_games: int
+    :param number_games: Number of games which will play.
+
+    :type engine: str
+    :param engine: The engine which plays the games.
+
+    :type seed_sequence: numpy.random.SeedSequence
+    :param seed_sequence: Source of the random stream for this file.
+
+    :type block_size: int
+    :param block_size: Number of games played at the same time by the `batch` engine.
+
+    :type buffer_size: int
+    :param buffer_size: Size in bytes of the blocks written in the CSV file by the background thread.
+
+    :type flush_interval: float
+    :param flush_interval: Maximum seconds that the records wait in memory before to be written.
+
+    :type file_format: str
+    :param file_format: The format of the file, `csv` or `binary`.
+
+    :type headers: bytes
+    :param headers: The headers of the file. If it is `None`, they are created for the file format.
+
+    :type table_filename: str
+    :param table_filename: The path and filename of the cached table of games, used by the `table` engine.
+
+    :type policies: tuple[Policy, Policy]
+    :param policies: The policies which choose the movements of the player 1 and the player 2.
+
+    :type resume: bool
+    :param resume: If true and the file has a checkpoint, it continues the file from the checkpoint.
+
+    :type checkpoint_interval: float
+    :param checkpoint_interval: Seconds between the checkpoints.
+
+    :type compression: str
+    :param compression: The compression of the file, `gzip` or `None`. The compressed files have no checkpoints.
+
+    :type compression_level: int
+    :param compression_level: The level of compression, from 1 (fastest) to 9 (smallest).
+
+    :type report_interval: float
+    :param report_interval: Seconds between the reports of the progress. If it is `None`, there are no reports.
+
+    :type report_callback: Callable
+    :param report_callback: Function which receives the metrics of every report.
+
+    :type board: Board
+    :param board: The configuration of the board. By default, the 3x3 board with 3 in a row.
+
+    :type compression_workers: int
+    :param compression_workers: Number of threads which compress the blocks, by default the number of CPUs.
+    The workers divide the CPUs between them.
+
+    :rtype: GenerationMetrics
+    :return: The metrics of the generation, with the bytes written in the file.
+    """
+    if board is None:
+        board = get_board()
+
+    if headers is None:
+        headers = _get_headers(file_format, seed_sequence, workers=1, board=board)
+
+    checkpoint: Checkpoint = Checkpoint(csv_filename) if compression is None else None
+    progress: dict = None
+    if resume and checkpoint is not None and checkpoint.exists():
+        progress = checkpoint.load()
+        progress['skip_games'] = recover_rows(csv_filename, progress.get('size'),
+                                              board.cells * 2 + 1 if file_format == 'binary' else None)
+        block_size = progress.get('block_size')
+    elif resume and path.exists(csv_filename):
+        raise ValueError(f'The file "{csv_filename}" has not a checkpoint, it cannot be resumed.')
+
+    csv_writer: BufferedFileWriter = BufferedFileWriter(csv_filename, buffer_size=buffer_size,
+                                                        flush_interval=flush_interval, compression=compression,
+                                                        compression_level=compression_level,
+                                                        compression_workers=compression_workers)
+    metrics: GenerationMetrics = GenerationMetrics(path.basename(csv_filename), report_interval, report_callback)
+    csv_writer.open(overwrite=progress is None)
+    try:
+        if progress is None:
+            csv_writer.write(headers)
+            if compression is not None:
+                # The headers are an independent block, so the merge of the shards can skip them.
+                csv_writer.flush()
+
+        if engine == 'single':
+            _play_single(number_games, csv_writer, seed_sequence, file_format, policies,
+                         checkpoint, checkpoint_interval, progress, metrics, board)
+        elif engine == 'table':
+            _play_batch(number_games, csv_writer, seed_sequence, block_size, file_format,
+                        GameTable(table_filename).sample, checkpoint, checkpoint_interval, progress, metrics)
+        else:
+            _play_batch(number_games, csv_writer, seed_sequence, block_size, file_format,
+                        partial(simulate_batch, policies=policies, board=board), checkpoint, checkpoint_interval,
+                        progress, metrics)
+    finally:
+        csv_writer.close()
+
+    metrics.add_writer(csv_writer.bytes_written, csv_writer.disk_seconds)
+    return metrics
+
+
+def count_games(number_games: int, engine: str, seed_sequence: random.SeedSequence, block_size: int,
+                table_filename: str = 'tic-tac-toe-games.npz', policies: tuple = None,
+                board: Board = None) -> GameCounter:
+    """
+    Play the games and count the distinct games, the memory depends on the distinct games only.
+
+    :type number_games: int
+    :param number_games: Number of games which will play.
+
+    :type engine: str
+    :param engine: The engine which plays the games.
+
+    :type seed_sequence: numpy.random.SeedSequence
+    :param seed_sequence: Source of the random stream, the same as `generate`.
+
+    :type block_size: int
+    :param block_size: Number of games added to the counter at the same time.
+
+    :type table_filename: str
+    :param table_filename: The path and filename of the cached table of games, used by the `table` engine.
+
+    :type policies: tuple[Policy, Policy]
+    :param policies: The policies which choose the movements of the player 1 and the player 2.
+
+    :type board: Board
+    :param board: The configuration of the board. By default, the 3x3 board with 3 in a row.
+
+    :rtype: GameCounter
+    :return: The distinct games with their counts.
+    """
+    if board is None:
+        board = get_board()
+
+    game_counter: GameCounter = GameCounter(board.cells * 2 + 1)
+
+    if engine == 'single':
+        random.seed(seed_sequence.generate_state(4))
+        first_game: int
+        for first_game in range(0, number_games, block_size):
+            games: list = []
+            for _ in range(min(block_size, number_games - first_game)):
+                game = Game(policies, board)
+                game.play()
+                games.append(game.get_information_to_store().split(','))
+            game_counter.add(array(games, dtype=int8))
+        return game_counter
+
+    play_games: Callable = GameTable(table_filename).sample if engine == 'table' \
+        else partial(simulate_batch, policies=policies, board=board)
+    generator: random.Generator = random.default_rng(seed_sequence)
+    first_game: int
+    for first_game in range(0, number_games, block_size):
+        game_counter.add(play_games(min(block_size, number_games - first_game), generator))
+
+    return game_counter
+
+
+def get_shard_filenames(csv_filename: str, workers: int) -> list:
+    """
+    Return the filenames of the shards for every worker, next to the CSV file.
+
+    :type csv_filename: str
+    :param csv_filename: The path and filename of the CSV file.
+
+    :type workers: int
+    :param workers: Number of workers.
+
+    :rtype: list[str]
+    :return: The filenames, for example `records-shard-000.csv` for `records.csv`,
+    or `records-shard-000.csv.gz` for `records.csv.gz`.
+    """
+    return [_add_suffix(csv_filename, f'shard-{index:03d}') for index in range(workers)]
+
+
+def get_split_filenames(csv_filename: str, splits: dict) -> list:
+    """
+    Return the filenames of the splits, next to the CSV file.
+
+    :type csv_filename: str
+    :param csv_filename: The path and filename of the CSV file.
+
+    :type splits: dict[str, float]
+    :param splits: The ratio of the games for every split.
+
+    :rtype: list[str]
+    :return: The filenames, for example `records-train.csv` for `records.csv`.
+    """
+    return [_add_suffix(csv_filename, split) for split in splits]
+
+
+def get_split_games(number_games: int, splits: dict) -> list:
+    """
+    Return the number of games of every split, the games of the rounding are added to the first split.
+
+    :type number_games: int
+    :param number_games: Number of games of all the splits.
+
+    :type splits: dict[str, float]
+    :param splits: The ratio of the games for every split.
+
+    :rtype: list[int]
+    :return: The number of games of every split, in the same order.
+    """
+    ratios: list = list(splits.values())
+    if not splits or any(ratio < 0 for ratio in ratios) or abs(sum(ratios) - 1.0) > 1e-9:
+        raise ValueError(f'The ratios of the splits must be positive and their sum must be 1, got {splits}.')
+
+    split_games: list = [int(number_games * ratio) for ratio in ratios]
+    split_games[0] += number_games - sum(split_games)
+
+    return split_games
+
+
+def _add_suffix(filename: str, suffix: str) -> str:
+    """
+    Return the filename with a suffix before its extension, the compressed extensions are kept together.
+
+    :type filename: str
+    :param filename: The path and filename.
+
+    :type suffix: str
+    :param suffix: The suffix.
+
+    :rtype: str
+    :return: The filename, for example `records-train.csv.gz` for `records.csv.gz` and `train`.
+    """
+    root: str
+    extension: str
+    root, extension = path.splitext(filename)
+    if extension == '.gz':
+        inner_extension: str
+        root, inner_extension = path.splitext(root)
+        extension = f'{inner_extension}{extension}'
+
+    return f'{root}-{suffix}{extension}'
+
+
+def _get_seed_sequence(seed) -> random.SeedSequence:
+    """
+    Return the seed sequence of the seed.
+
+    :type seed: int | numpy.random.SeedSequence | None
+    :param seed: The seed, or a seed sequence spawned from other, for example for a split.
+
+    :rtype: numpy.random.SeedSequence
+    :return: The seed sequence.
+    """
+    if isinstance(seed, random.SeedSequence):
+        return seed
+
+    return random.SeedSequence(seed)
+
+
+def _get_headers(file_format: str, seed_sequence: random.SeedSequence, workers: int, board: Board = None) -> bytes:
+    """
+    Return the headers of the file.
+
+    :type file_format: str
+    :param file_format: The format of the file, `csv` or `binary`.
+
+    :type seed_sequence: numpy.random.SeedSequence
+    :param seed_sequence: Source of the random streams, its entropy is stored in the binary headers.
+
+    :type workers: int
+    :param workers: Number of workers, it is stored in the binary headers.
+
+    :type board: Board
+    :param board: The configuration of the board, it is stored in the binary headers.
+    By default, the 3x3 board with 3 in a row.
+
+    :rtype: bytes
+    :return: The headers.
+    """
+    if board is None:
+        board = get_board()
+
+    headers: str = Game.get_headers_to_store(board.cells)
+    if file_format == 'binary':
+        return get_header(headers.split(','), seed=seed_sequence.entropy, spawn_key=list(seed_sequence.spawn_key),
+                          workers=workers, board=[board.rows, board.columns, board.line_length])
+
+    return f'{headers}\n'.encode()
+
+
+def _generate_deduplicated(csv_filename: str, number_games: int, engine: str, seed_sequence: random.SeedSequence,
+                           block_size: int, buffer_size: int, flush_interval: float, workers: int, headers: bytes,
+                           table_filename: str, policies: tuple, compression: str = None,
+                           compression_level: int = 1, board: Board = None) -> GenerationMetrics:
+    """
+    Count the distinct games with one or more workers and write them in the CSV file, with the column `count`.
+
+    :type csv_filename: str
+    :param csv_filename: The path and filename where the information will be storage.
+
+    :type number_games: int
+    :param number_games: Number of games which will play.
+
+    :type engine: str
+    :param engine: The engine which plays the games.
+
+    :type seed_sequence: numpy.random.SeedSequence
+    :param seed_sequence: Source of the random streams, every worker has its own spawned stream.
+
+    :type block_size: int
+    :param block_size: Number of games added to the counter at the same time.
+
+    :type buffer_size: int
+    :param buffer_size: Size in bytes of the blocks written in the CSV file by the background thread.
+
+    :type flush_interval: float
+    :param flush_interval: Maximum seconds that the records wait in memory before to be written.
+
+    :type workers: int
+    :param workers: Number of processes which play the games.
+
+    :type headers: bytes
+    :param headers: The headers of the CSV file, without the column `count`.
+
+    :type table_filename: str
+    :param table_filename: The path and filename of the cached table of games, used by the `table` engine.
+
+    :type policies: tuple[Policy, Policy]
+    :param policies: The policies which choose the movements of the player 1 and the player 2.
+
+    :type compression: str
+    :param compression: The compression of the file, `gzip` or `None`.
+
+    :type compression_level: int
+    :param compression_level: The level of compression, from 1 (fastest) to 9 (smallest).
+
+    :type board: Board
+    :param board: The configuration of the board.
+
+    :rtype: GenerationMetrics
+    :return: The metrics of the generation, the simulation time includes the count of the games.
+    """
+    metrics: GenerationMetrics = GenerationMetrics(path.basename(csv_filename))
+    start_time: float = perf_counter()
+    if workers == 1:
+        game_counter: GameCounter = count_games(number_games, engine, seed_sequence, block_size,
+                                                table_filename, policies, board)
+    else:
+        shard_games: list = [number_games // workers + (index < number_games % workers) for index in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            game_counters: list = list(executor.map(
+                count_games, shard_games, repeat(engine), seed_sequence.spawn(workers), repeat(block_size),
+                repeat(table_filename), repeat(policies), repeat(board),
+            ))
+        game_counter: GameCounter = game_counters[0]
+        other_counter: GameCounter
+        for other_counter in game_counters[1:]:
+            game_counter.merge(other_counter)
+
+    played: float = perf_counter()
+    information: bytes = game_counter.get_information_to_store()
+    formatted: float = perf_counter()
+    with BufferedFileWriter(csv_filename, buffer_size=buffer_size, flush_interval=flush_interval,
+                            compression=compression, compression_level=compression_level) as csv_writer:
+        csv_writer.write(headers.replace(b'\n', f',{COUNT_COLUMN}\n'.encode()))
+        csv_writer.write(information)
+
+    metrics.add_block(game_counter.total, len(game_counter), len(information), played - start_time,
+                      formatted - played, perf_counter() - formatted)
+    metrics.add_writer(csv_writer.bytes_written, csv_writer.disk_seconds)
+    return metrics
+
+
+def _play_batch(number_games: int, csv_writer: BufferedFileWriter, seed_sequence: random.SeedSequence,
+                block_size: int, file_format: str = 'csv', play_games: Callable = simulate_batch,
+                checkpoint: Checkpoint = None, checkpoint_interval: float = 60.0, progress: dict = None,
+                metrics: GenerationMetrics = None) -> None:
+    """
+    Play the games in blocks with the batch engine.
+    The clock is sampled once per block for the metrics and the checkpoints.
+
+    :type number_games: int
+    :param number_games: Number of games which will play.
+
+    :type csv_writer: BufferedFileWriter
+    :param csv_writer: The writer of the CSV file.
+
+    :type seed_sequence: numpy.random.SeedSequence
+    :param seed_sequence: Source of the random stream.
+
+    :type block_size: int
+    :param block_size: Number of games played at the same time.
+
+    :type file_format: str
+    :param file_format: The format of the file, `csv` or `binary`.
+
+    :type play_games: Callable
+    :param play_games: Function which returns a block of games, with the same arguments as `simulate_batch`.
+
+    :type checkpoint: Checkpoint
+    :param checkpoint: The checkpoint of the file. If it is `None`, the progress is not stored.
+
+    :type checkpoint_interval: float
+    :param checkpoint_interval: Seconds between the checkpoints, they are stored between the blocks.
+
+    :type progress: dict
+    :param progress: The progress of the checkpoint to resume the file, and the games written after it.
+
+    :type metrics: GenerationMetrics
+    :param metrics: The metrics of the generation. If it is `None`, they are not measured.
+
+    :rtype: None
+    """
+    generator: random.Generator = random.default_rng(seed_sequence)
+    start_game: int = 0
+    skip_games: int = 0
+    if progress is not None:
+        generator.bit_generator.state = progress.get('random_state')
+        start_game = progress.get('games')
+        skip_games = progress.get('skip_games')
+    elif checkpoint is not None:
+        csv_writer.flush()
+        checkpoint.save(0, block_size, generator.bit_generator.state)
+
+    clock: float = perf_counter()
+    last_checkpoint: float = clock
+    first_game: int
+    for first_game in range(start_game, number_games, block_size):
+        block_games: int = min(block_size, number_games - first_game)
+        games = play_games(block_games, generator)
+        played: float = perf_counter()
+
+        # The games after the checkpoint are played again, only the games which are not in the file are written.
+        if skip_games:
+            skipped_games: int = min(skip_games, games.shape[0])
+            games = games[skipped_games:]
+            skip_games -= skipped_games
+
+        information: bytes = games.tobytes() if file_format == 'binary' else get_information_to_store(games)
+        formatted: float = perf_counter()
+        csv_writer.write(information)
+
+        if checkpoint is not None and not skip_games and formatted - last_checkpoint >= checkpoint_interval:
+            csv_writer.flush()
+            checkpoint.save(first_game + block_games, block_size, generator.bit_generator.state)
+            last_checkpoint = formatted
+
+        written: float = perf_counter()
+        if metrics is not None:
+            metrics.add_block(block_games, games.shape[0], len(information),
+                              played - clock, formatted - played, written - formatted, written)
+        clock = written
+
+    if checkpoint is not None:
+        csv_writer.flush()
+        checkpoint.save(max(start_game, number_games), block_size, generator.bit_generator.state)
+
+
+def _play_single(number_games: int, csv_writer: BufferedFileWriter, seed_sequence: random.SeedSequence,
+                 file_format: str = 'csv', policies: tuple = None,
+                 checkpoint: Checkpoint = None, checkpoint_interval: float = 60.0, progress: dict = None,
+                 metrics: GenerationMetrics = None, board: Board = None) -> None:
+    """
+    Play one game at a time with the single engine.
+    The clock is sampled for every game, it is negligible because every game is slow.
+
+    :type number_games: int
+    :param number_games: Number of games which will play.
+
+    :type csv_writer: BufferedFileWriter
+    :param csv_writer: The writer of the CSV file.
+
+    :type seed_sequence: numpy.random.SeedSequence
+    :param seed_sequence: Source of the random stream, the single engine uses the global NumPy state.
+
+    :type file_format: str
+    :param file_format: The format of the file, `csv` or `binary`.
+
+    :type policies: tuple[Policy, Policy]
+    :param policies: The policies which choose the movements of the player 1 and the player 2.
+
+    :type checkpoint: Checkpoint
+    :param checkpoint: The checkpoint of the file. If it is `None`, the progress is not stored.
+
+    :type checkpoint_interval: float
+    :param checkpoint_interval: Seconds between the checkpoints.
+
+    :type progress: dict
+    :param progress: The progress of the checkpoint to resume the file, and the games written after it.
+
+    :type metrics: GenerationMetrics
+    :param metrics: The metrics of the generation. If it is `None`, they are not measured.
+
+    :type board: Board
+    :param board: The configuration of the board. By default, the 3x3 board with 3 in a row.
+
+    :rtype: None
+    """
+    random.seed(seed_sequence.generate_state(4))
+    start_game: int = 0
+    skip_games: int = 0
+    if progress is not None:
+        name, keys, position, has_gauss, cached_gaussian = progress.get('random_state')
+        random.set_state((name, array(keys, dtype=uint32), position, has_gauss, cached_gaussian))
+        start_game = progress.get('games')
+        skip_games = progress.get('skip_games')
+    elif checkpoint is not None:
+        csv_writer.flush()
+        checkpoint.save(0, 1, _get_random_state())
+
+    clock: float = perf_counter()
+    last_checkpoint: float = clock
+    game_number: int
+    for game_number in range(start_game, number_games):
+        game = Game(policies, board)
         game.play()
+        played: float = perf_counter()
+
+        # The games after the checkpoint are played again, only the games which are not in the file are written.
+        information: bytes = b''
+        if skip_games:
+            skip_games -= 1
+        elif file_format == 'binary':
+            information = array(game.get_information_to_store().split(','), dtype=int8).tobytes()
+        else:
+            information = f'{game.get_information_to_store()}\n'.encode()
+        formatted: float = perf_counter()
+        csv_writer.write(information)
+
+        if checkpoint is not None and not skip_games and formatted - last_checkpoint >= checkpoint_interval:
+            csv_writer.flush()
+            checkpoint.save(game_number + 1, 1, _get_random_state())
+            last_checkpoint = formatted
 
-        if first_loop:
-            headers = game.get_headers_to_store()
-            game.store_information(csv_filename, information=headers, overwrite=True)
-            first_loop = False
+        written: float = perf_counter()
+        if metrics is not None:
+            metrics.add_block(1, 1 if information else 0, len(information),
+                              played - clock, formatted - played, written - formatted, written)
+        clock = written
+
+    if checkpoint is not None:
+        csv_writer.flush()
+        checkpoint.save(max(start_game, number_games), 1, _get_random_state())
+
+
+def _get_random_state() -> list:
+    """
+    Return the state of the global NumPy random generator, which is used by the single engine.
+
+    :rtype: list
+    :return: The state, with the values which can be stored in JSON.
+    """
+    name, keys, position, has_gauss, cached_gaussian = random.get_state()
+    return [name, keys.tolist(), position, has_gauss, cached_gaussian]
 
-        information = game.get_information_to_store()
-        game.store_information(csv_filename, information=information)
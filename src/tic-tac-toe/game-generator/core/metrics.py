@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Metrics of the generation: throughput and the time split between simulation, formatting and I/O.
+"""
+import sys
+from datetime import timedelta
+from time import perf_counter
+from typing import Callable, Optional
+
+
+class GenerationMetrics:
+    """
+    This class accumulates the metrics of the generation, block by block.
+    The engines sample the clock once per block, so the cost per game is negligible.
+    The metrics are reported periodically to the standard error and to the callback.
+    """
+    __label: str
+    __report_interval: Optional[float]
+    __callback: Optional[Callable]
+    __games: int
+    __rows: int
+    __bytes: int
+    __bytes_written: int
+    __simulation_seconds: float
+    __formatting_seconds: float
+    __io_seconds: float
+    __disk_seconds: float
+    __start_time: float
+    __last_report: float
+
+    def __init__(self, label: str = '', report_interval: float = None, callback: Callable = None) -> None:
+        """
+        Construction method.
+
+        :type label: str
+        :param label: The name in the reports, for example the file of the worker.
+
+        :type report_interval: float
+        :param report_interval: Seconds between the reports. If it is `None`, there are no periodic reports.
+
+        :type callback: Callable
+        :param callback: Function which receives the information of every report, see `get_information`.
+        With workers, it runs in every process, so it must be picklable.
+
+        :rtype: None
+        """
+        self.__label = label
+        self.__report_interval = report_interval
+        self.__callback = callback
+        self.__games = 0
+        self.__rows = 0
+        self.__bytes = 0
+        self.__bytes_written = 0
+        self.__simulation_seconds = 0.0
+        self.__formatting_seconds = 0.0
+        self.__io_seconds = 0.0
+        self.__disk_seconds = 0.0
+        self.start()
+
+    @property
+    def games(self) -> int:
+        """
+        Return the number of games played.
+
+        :rtype: int
+        :return: The games.
+        """
+        return self.__games
+
+    @property
+    def rows(self) -> int:
+        """
+        Return the number of rows formatted, they are less than the games when the games are deduplicated.
+
+        :rtype: int
+        :return: The rows.
+        """
+        return self.__rows
+
+    @property
+    def bytes_written(self) -> int:
+        """
+        Return the bytes written in the files, after the compression.
+
+        :rtype: int
+        :return: The bytes written.
+        """
+        return self.__bytes_written
+
+    def start(self) -> None:
+        """
+        Start the clock of the generation.
+
+        :rtype: None
+        """
+        self.__start_time = perf_counter()
+        self.__last_report = self.__start_time
+
+    def add_block(self, games: int, rows: int, number_bytes: int, simulation_seconds: float,
+                  formatting_seconds: float, io_seconds: float, now: float = None) -> None:
+        """
+        Add the metrics of a block, and report them if the report interval is reached.
+
+        :type games: int
+        :param games: Number of games played in the block.
+
+        :type rows: int
+        :param rows: Number of rows formatted in the block.
+
+        :type number_bytes: int
+        :param number_bytes: Bytes formatted in the block, before the compression.
+
+        :type simulation_seconds: float
+        :param simulation_seconds: Seconds which took to play the games.
+
+        :type formatting_seconds: float
+        :param formatting_seconds: Seconds which took to format the rows.
+
+        :type io_seconds: float
+        :param io_seconds: Seconds which the engine waited for the writer.
+
+        :type now: float
+        :param now: The last sample of `time.perf_counter`, so the clock is not sampled again.
+
+        :rtype: None
+        """
+        self.__games += games
+        self.__rows += rows
+        self.__bytes += number_bytes
+        self.__simulation_seconds += simulation_seconds
+        self.__formatting_seconds += formatting_seconds
+        self.__io_seconds += io_seconds
+
+        if self.__report_interval is not None:
+            now = perf_counter() if now is None else now
+            if now - self.__last_report >= self.__report_interval:
+                self.report(now)
+
+    def add_writer(self, bytes_written: int, disk_seconds: float) -> None:
+        """
+        Add the metrics of the writer, when the file is closed.
+
+        :type bytes_written: int
+        :param bytes_written: Bytes written in the file.
+
+        :type disk_seconds: float
+        :param disk_seconds: Seconds which the background thread of the writer spent writing in the disk.
+
+        :rtype: None
+        """
+        self.__bytes_written += bytes_written
+        self.__disk_seconds += disk_seconds
+
+    def merge(self, metrics: 'GenerationMetrics') -> None:
+        """
+        Add the metrics of other generation, for example of a worker. The clock of this generation is kept.
+
+        :type metrics: GenerationMetrics
+        :param metrics: The other metrics.
+
+        :rtype: None
+        """
+        self.__games += metrics.__games
+        self.__rows += metrics.__rows
+        self.__bytes += metrics.__bytes
+        self.__bytes_written += metrics.__bytes_written
+        self.__simulation_seconds += metrics.__simulation_seconds
+        self.__formatting_seconds += metrics.__formatting_seconds
+        self.__io_seconds += metrics.__io_seconds
+        self.__disk_seconds += metrics.__disk_seconds
+
+    def get_information(self, now: float = None) -> dict:
+        """
+        Return the metrics.
+
+        :type now: float
+        :param now: The last sample of `time.perf_counter`, by default the clock is sampled.
+
+        :rtype: dict
+        :return: The games, rows, bytes and their rates per second, and the seconds of every stage.
+        """
+        duration: float = (perf_counter() if now is None else now) - self.__start_time
+
+        def get_rate(value: float) -> float:
+            return value / duration if duration > 0 else 0.0
+
+        return {
+            'label': self.__label,
+            'duration': duration,
+            'games': self.__games,
+            'rows': self.__rows,
+            'bytes': self.__bytes,
+            'bytes_written': self.__bytes_written,
+            'games_per_second': get_rate(self.__games),
+            'rows_per_second': get_rate(self.__rows),
+            'bytes_per_second': get_rate(self.__bytes),
+            'simulation_seconds': self.__simulation_seconds,
+            'formatting_seconds': self.__formatting_seconds,
+            'io_seconds': self.__io_seconds,
+            'disk_seconds': self.__disk_seconds,
+        }
+
+    def report(self, now: float = None) -> None:
+        """
+        Report the metrics to the standard error and to the callback.
+
+        :type now: float
+        :param now: The last sample of `time.perf_counter`, by default the clock is sampled.
+
+        :rtype: None
+        """
+        information: dict = self.get_information(now)
+        self.__last_report = self.__start_time + information['duration']
+        label: str = f'[{self.__label}] ' if self.__label else ''
+        print(f'{label}{information["games"]:,} games, {information["games_per_second"]:,.0f} games/s, '
+              f'{information["rows_per_second"]:,.0f} rows/s, {information["bytes_per_second"]:,.0f} bytes/s, '
+              f'time: simulation {information["simulation_seconds"]:.1f} s, '
+              f'formatting {information["formatting_seconds"]:.1f} s, I/O {information["io_seconds"]:.1f} s',
+              file=sys.stderr, flush=True)
+
+        if self.__callback is not None:
+            self.__callback(information)
+
+    def display_summary(self, filename: str, seed) -> None:
+        """
+        Display the summary of the generation.
+
+        :type filename: str
+        :param filename: The path and filename of the file.
+
+        :type seed: int
+        :param seed: The entropy of the seed, it reproduces the same records.
+
+        :rtype: None
+        """
+        information: dict = self.get_information()
+        duration: float = information['duration']
+        print('========================================')
+        print('===   Summary of the game generator  ===')
+        print('========================================')
+        print(f'File: {filename}')
+        print(f'Seed: {seed}')
+        print(f'Games: {information["games"]:,}')
+        print(f'Rows: {information["rows"]:,}')
+        print(f'Duration: {timedelta(seconds=duration)}')
+        print(f'Games per second: {information["games_per_second"]:,.0f}')
+        print(f'Rows per second: {information["rows_per_second"]:,.0f}')
+        print(f'Bytes written: {information["bytes_written"]:,}')
+        print(f'Bytes per second: {information["bytes_written"] / duration if duration > 0 else 0.0:,.0f}')
+        print(f'Simulation time: {timedelta(seconds=information["simulation_seconds"])}')
+        print(f'Formatting time: {timedelta(seconds=information["formatting_seconds"])}')
+        print(f'I/O wait time: {timedelta(seconds=information["io_seconds"])}')
+        print(f'Disk write time: {timedelta(seconds=information["disk_seconds"])}')
+
+        if self.__callback is not None:
+            self.__callback(information)
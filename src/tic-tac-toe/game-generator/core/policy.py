@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Policies which choose the movements of the players.
+
+A policy returns the candidate cells as a 9-bit mask, the engine chooses one of them with uniform probability.
+The boards can be integers for the single engine, or NumPy arrays for the batch engine.
+"""
+from functools import lru_cache
+from os import path
+
+from numpy import ndarray, arange, zeros, save, load, stack, shape, where, uint16, int16, int8
+
+from .board import CELLS, CELL_MASKS, WINNING_BOARDS
+
+FULL_BOARD: int = (1 << CELLS) - 1
+CENTER_MASK: int = 0b000010000
+CORNERS_MASK: int = 0b101000101
+
+
+def get_state_index(board_player, board_opponent):
+    """
+    Return the index of the state in the tables, from the point of view of the player who moves.
+
+    :type board_player: int | ndarray
+    :param board_player: The board of the player who moves.
+
+    :type board_opponent: int | ndarray
+    :param board_opponent: The board of the opponent.
+
+    :rtype: int | ndarray
+    :return: The index of the state.
+    """
+    return (board_player << CELLS) | board_opponent
+
+
+def solve_game() -> tuple:
+    """
+    Solve the game with minimax, every state is solved one time thanks to the transposition table.
+
+    :rtype: tuple[ndarray, ndarray]
+    :return: The value of every state for the player who moves (1 win, 0 drawn, -1 lose),
+    and the mask of the optimal cells for every state. The states which are not reachable have the mask 0.
+    """
+    cell_masks: list = CELL_MASKS.tolist()[1:]
+    winning_boards: list = WINNING_BOARDS.tolist()
+    values: dict = {}
+    optimal_moves: dict = {}
+
+    def get_value(board_player: int, board_opponent: int) -> int:
+        state_index: int = get_state_index(board_player, board_opponent)
+        if state_index in values:
+            return values[state_index]
+
+        if winning_boards[board_opponent]:
+            value: int = -1
+        elif board_player | board_opponent == FULL_BOARD:
+            value: int = 0
+        else:
+            move_values: list = [
+                (-get_value(board_opponent, board_player | cell_mask), cell_mask)
+                for cell_mask in cell_masks
+                if not (board_player | board_opponent) & cell_mask
+            ]
+            value: int = max(move_value for move_value, _ in move_values)
+            optimal_moves[state_index] = sum(cell_mask for move_value, cell_mask in move_values if move_value == value)
+
+        values[state_index] = value
+        return value
+
+    get_value(0, 0)
+
+    value_table: ndarray = zeros(1 << (CELLS * 2), dtype=int8)
+    move_table: ndarray = zeros(1 << (CELLS * 2), dtype=uint16)
+    value_table[list(values.keys())] = list(values.values())
+    move_table[list(optimal_moves.keys())] = list(optimal_moves.values())
+
+    return value_table, move_table
+
+
+@lru_cache(maxsize=None)
+def get_transposition_table(filename: str = None) -> tuple:
+    """
+    Return the solved game, it is solved only one time for each process.
+    If the file exists, it is mapped in memory, so the processes share the same pages.
+
+    :type filename: str
+    :param filename: The path and filename of the cached table. If it is `None`, the table is not stored.
+
+    :rtype: tuple[ndarray, ndarray]
+    :return: The values and the optimal moves for every state, see `solve_game`.
+    """
+    if filename and path.exists(filename):
+        tables: ndarray = load(filename, mmap_mode='r')
+        return tables[0], tables[1]
+
+    value_table: ndarray
+    move_table: ndarray
+    value_table, move_table = solve_game()
+    if filename:
+        save(filename, stack([value_table.astype(int16), move_table.astype(int16)]))
+
+    return value_table, move_table
+
+
+@lru_cache(maxsize=None)
+def get_heuristic_table() -> ndarray:
+    """
+    Return the moves of the heuristic for every state: win, block the opponent, center, corners or any free cell.
+
+    :rtype: ndarray
+    :return: The mask of the candidate cells for every state.
+    """
+    states: ndarray = arange(1 << (CELLS * 2))
+    boards_player: ndarray = states >> CELLS
+    boards_opponent: ndarray = states & FULL_BOARD
+    free_cells: ndarray = ~(boards_player | boards_opponent) & FULL_BOARD
+
+    winning_moves: ndarray = zeros(states.shape, dtype=uint16)
+    blocking_moves: ndarray = zeros(states.shape, dtype=uint16)
+    cell_mask: int
+    for cell_mask in CELL_MASKS.tolist()[1:]:
+        is_free: ndarray = (free_cells & cell_mask) > 0
+        winning_moves |= where(is_free & WINNING_BOARDS[boards_player | cell_mask], cell_mask, 0).astype(uint16)
+        blocking_moves |= where(is_free & WINNING_BOARDS[boards_opponent | cell_mask], cell_mask, 0).astype(uint16)
+
+    candidates: ndarray = free_cells.astype(uint16)
+    candidates = where(free_cells & CORNERS_MASK, free_cells & CORNERS_MASK, candidates)
+    candidates = where(free_cells & CENTER_MASK, CENTER_MASK, candidates)
+    candidates = where(blocking_moves, blocking_moves, candidates)
+    candidates = where(winning_moves, winning_moves, candidates)
+
+    return candidates.astype(uint16)
+
+
+class Policy:
+    """
+    This class is the interface of the policies.
+    """
+
+    def prepare(self) -> None:
+        """
+        Compute the tables of the policy before the games start, so they are stored one time for all the workers.
+
+        :rtype: None
+        """
+
+    def get_candidates(self, board_player, board_opponent, generator):
+        """
+        Return the candidate cells for the player who moves.
+
+        :type board_player: int | ndarray
+        :param board_player: The board of the player who moves.
+
+        :type board_opponent: int | ndarray
+        :param board_opponent: The board of the opponent.
+
+        :type generator: numpy.random.Generator
+        :param generator: Source of random values, for the policies which need them.
+
+        :rtype: int | ndarray
+        :return: The mask of the candidate cells, always a subset of the free cells.
+        """
+        raise NotImplementedError
+
+
+class RandomPolicy(Policy):
+    """
+    Every free cell is a candidate.
+    """
+
+    def get_candidates(self, board_player, board_opponent, generator):
+        return ~(board_player | board_opponent) & FULL_BOARD
+
+
+class OptimalPolicy(Policy):
+    """
+    The cells which keep the best result with minimax, read from the transposition table.
+    """
+    __table_filename: str
+
+    def __init__(self, table_filename: str = None) -> None:
+        """
+        Construction method.
+
+        :type table_filename: str
+        :param table_filename: The path and filename of the cached transposition table.
+
+        :rtype: None
+        """
+        self.__table_filename = table_filename
+
+    def prepare(self) -> None:
+        get_transposition_table(self.__table_filename)
+
+    def get_candidates(self, board_player, board_opponent, generator):
+        move_table: ndarray = get_transposition_table(self.__table_filename)[1]
+        return move_table[get_state_index(board_player, board_opponent)]
+
+
+class HeuristicPolicy(Policy):
+    """
+    The cells which win, then the cells which block the opponent, then the center, the corners and the others.
+    """
+
+    def get_candidates(self, board_player, board_opponent, generator):
+        return get_heuristic_table()[get_state_index(board_player, board_opponent)]
+
+
+class EpsilonGreedyPolicy(Policy):
+    """
+    With the probability epsilon every free cell is a candidate, otherwise the cells of the base policy.
+    """
+    __epsilon: float
+    __policy: Policy
+
+    def __init__(self, epsilon: float = 0.1, policy: Policy = None) -> None:
+        """
+        Construction method.
+
+        :type epsilon: float
+        :param epsilon: Probability to play a random movement.
+
+        :type policy: Policy
+        :param policy: The policy for the other movements, by default the optimal policy.
+
+        :rtype: None
+        """
+        self.__epsilon = epsilon
+        self.__policy = policy if policy is not None else OptimalPolicy()
+
+    def prepare(self) -> None:
+        self.__policy.prepare()
+
+    def get_candidates(self, board_player, board_opponent, generator):
+        free_cells = ~(board_player | board_opponent) & FULL_BOARD
+        candidates = self.__policy.get_candidates(board_player, board_opponent, generator)
+        is_random = generator.random(shape(board_player) or None) < self.__epsilon
+
+        return where(is_random, free_cells, candidates)
+
+
+POLICIES: tuple = ('random', 'optimal', 'heuristic', 'epsilon-greedy')
+
+
+def get_policy(name: str, epsilon: float = 0.1, table_filename: str = None) -> Policy:
+    """
+    Return the policy by its name.
+
+    :type name: str
+    :param name: The name of the policy, one of `POLICIES`.
+
+    :type epsilon: float
+    :param epsilon: Probability to play a random movement, for the `epsilon-greedy` policy.
+
+    :type table_filename: str
+    :param table_filename: The path and filename of the cached transposition table, for the optimal policies.
+
+    :rtype: Policy
+    :return: The policy.
+    """
+    if name == 'random':
+        return RandomPolicy()
+
+    if name == 'optimal':
+        return OptimalPolicy(table_filename)
+
+    if name == 'heuristic':
+        return HeuristicPolicy()
+
+    if name == 'epsilon-greedy':
+        return EpsilonGreedyPolicy(epsilon, OptimalPolicy(table_filename))
+
+    raise ValueError(f'Unknown policy "{name}", the options are: {", ".join(POLICIES)}.')
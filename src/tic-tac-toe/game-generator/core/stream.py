@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Stream of games in memory, for the consumers which do not need the CSV file.
+"""
+from typing import Iterator
+
+from numpy import ndarray, random
+
+from .board import Board
+from .enumeration import GameTable
+from .game import Game
+from .game_batch import simulate_batch
+from .policy import get_policy
+
+
+def get_columns(board: Board = None) -> list:
+    """
+    Return the names of the columns of the games, the same as the headers of the CSV file.
+
+    :type board: Board
+    :param board: The configuration of the board. By default, the 3x3 board with 3 in a row.
+
+    :rtype: list[str]
+    :return: The columns.
+    """
+    if board is None:
+        return Game.get_headers_to_store().split(',')
+
+    return Game.get_headers_to_store(board.cells).split(',')
+
+
+def iter_game_batches(batch_size: int, seed=None, number_batches: int = None, engine: str = 'batch',
+                      policies: tuple = None, table_filename: str = 'tic-tac-toe-games.npz',
+                      board: Board = None) -> Iterator[ndarray]:
+    """
+    Yield batches of new games, with the same columns as the CSV file.
+
+    :type batch_size: int
+    :param batch_size: Number of games in every batch.
+
+    :type seed: int | numpy.random.SeedSequence | None
+    :param seed: Seed for the random movements. If it is `None` the results are not reproducible.
+
+    :type number_batches: int
+    :param number_batches: Number of batches. If it is `None`, the stream never ends.
+
+    :type engine: str
+    :param engine: The engine which plays the games: `batch` or `table`.
+
+    :type policies: tuple[Policy | str, Policy | str]
+    :param policies: The policies of the player 1 and the player 2, or their names. Only for the `batch` engine.
+
+    :type table_filename: str
+    :param table_filename: The path and filename of the cached table of games, used by the `table` engine.
+
+    :type board: Board
+    :param board: The configuration of the board, only for the `batch` engine. By default, the 3x3 board.
+
+    :rtype: Iterator[ndarray]
+    :return: Matrices of signed integers of 1 byte, one row per game.
+    """
+    if engine == 'table' and board is not None and not board.is_standard:
+        raise ValueError('The table engine only has the games of the board 3x3 with 3 in a row.')
+
+    generator: random.Generator = random.default_rng(seed)
+    game_table: GameTable = GameTable(table_filename) if engine == 'table' else None
+    if policies is not None:
+        policies = tuple(get_policy(policy) if isinstance(policy, str) else policy for policy in policies)
+
+    batch: int = 0
+    while number_batches is None or batch < number_batches:
+        if game_table is not None:
+            yield game_table.sample(batch_size, generator)
+        else:
+            yield simulate_batch(batch_size, generator, policies, board)
+        batch += 1
@@ -0,0 +1,19 @@
+Feature: Write a file with the buffered writer
+  It will write blocks of information with a background thread, keeping the file open.
+
+  Scenario Outline: Write blocks
+    Given I want to write <number blocks> blocks with a buffer of <buffer size> bytes
+    When I write the blocks in the file
+    Then The file contains all the blocks in order
+    And The writer reports the bytes written
+
+    Examples: Get few amount of buffers
+      | number blocks | buffer size |
+      | 1             | 1           |
+      | 1000          | 64          |
+      | 1000          | 1048576     |
+
+  Scenario: Write blocks with an error
+    Given I want to write 100 blocks with a buffer of 1048576 bytes
+    When I write the blocks and an error happens
+    Then The file contains all the blocks in order
@@ -0,0 +1,28 @@
+Feature: Play a batch of games
+  It will play many games at the same time with the vectorized engine.
+  Every game must have the same results as the game played by the single engine with the same movements.
+
+  Scenario Outline: Play a batch with seed
+    Given I want to run a batch of <number games> games with the seed <seed>
+    When I start the batch of games
+    Then Every game in the batch has the same results as a single game
+    And Every CSV line in the batch is the same as a single game
+
+    Examples: Get few amount of batches
+      | number games | seed |
+      | 1            | 1    |
+      | 10           | 7    |
+      | 1000         | 42   |
+
+  Scenario Outline: Play a batch on other boards
+    Given I want to run a batch of <number games> games on the board <rows>x<columns> with <line length> in a row and the seed <seed>
+    When I start the batch of games
+    Then Every game in the batch has the same results as a single game
+    And Every CSV line in the batch is the same as a single game
+
+    Examples: Get few amount of batches
+      | number games | rows | columns | line length | seed |
+      | 100          | 3    | 3       | 3           | 7    |
+      | 200          | 4    | 4       | 3           | 42   |
+      | 200          | 5    | 4       | 4           | 42   |
+      | 100          | 6    | 7       | 4           | 7    |
@@ -0,0 +1,24 @@
+Feature: Enumerate all the distinct games
+  It will walk the tree of the game once and sample the games from the table.
+
+  Scenario: Enumerate the games
+    Given I want to load the table of games
+    Then The table has 255168 games
+    And The table has 46080 drawn games, 131184 won by player 1 and 77904 won by player 2
+    And The probabilities of the games sum 1
+
+  Scenario Outline: Sample the games
+    Given I want to load the table of games
+    When I sample <number games> games with the seed <seed>
+    Then Every sampled game is in the table
+    And The results of the sampled games follow the exact distribution
+
+    Examples: Get few amount of samples
+      | number games | seed |
+      | 100000       | 1    |
+      | 100000       | 42   |
+
+  Scenario: Compare the batch engine with the table
+    Given I want to load the table of games
+    When I play 100000 games with the batch engine and the seed 3
+    Then The results of the sampled games follow the exact distribution
@@ -0,0 +1,95 @@
+Feature: Generate the CSV file with the games
+  It will play the games and store them in the CSV file, with one or more workers.
+
+  Scenario Outline: Generate with workers
+    Given I want to generate <number games> games with the <engine> engine, <workers> workers and the seed <seed>
+    When I generate the games two times
+    Then The CSV file has the headers and <number games> games
+    And The CSV files are the same in both generations
+
+    Examples: Get few amount of generations
+      | number games | engine | workers | seed |
+      | 1000         | batch  | 1       | 42   |
+      | 1001         | batch  | 3       | 42   |
+      | 100          | single | 2       | 7    |
+
+  Scenario Outline: Generate the binary format
+    Given I want to generate <number games> games with the <engine> engine, <workers> workers and the seed <seed>
+    When I generate the games in CSV and binary formats
+    Then The binary records are the same as the CSV records
+
+    Examples: Get few amount of generations
+      | number games | engine | workers | seed |
+      | 1000         | batch  | 1       | 42   |
+      | 1001         | batch  | 3       | 42   |
+      | 10           | single | 1       | 7    |
+
+  Scenario Outline: Generate the deduplicated games
+    Given I want to generate <number games> games with the <engine> engine, <workers> workers and the seed <seed>
+    When I generate the games with and without deduplication
+    Then The deduplicated games have the counts of the CSV records
+
+    Examples: Get few amount of generations
+      | number games | engine | workers | seed |
+      | 5000         | batch  | 1       | 42   |
+      | 5001         | table  | 3       | 42   |
+      | 50           | single | 2       | 7    |
+
+  Scenario Outline: Resume a stopped generation
+    Given I want to generate <number games> games with the <engine> engine, <workers> workers and the seed <seed>
+    When I generate the games in <file format> format and it stops after <blocks> blocks
+    And I resume the generation
+    Then The resumed file is the same as the file without interruption
+
+    Examples: Get few amount of generations
+      | number games | engine | workers | seed | file format | blocks |
+      | 1000         | batch  | 1       | 42   | csv         | 3      |
+      | 1000         | table  | 1       | 42   | binary      | 2      |
+      | 1000         | batch  | 2       | 42   | csv         | 1      |
+      | 30           | single | 1       | 7    | csv         | 12     |
+
+  Scenario Outline: Generate the compressed CSV file
+    Given I want to generate <number games> games with the <engine> engine, <workers> workers and the seed <seed>
+    When I generate the games with and without compression
+    Then The decompressed file is the same as the CSV file
+
+    Examples: Get few amount of generations
+      | number games | engine | workers | seed |
+      | 1000         | batch  | 1       | 42   |
+      | 5001         | batch  | 3       | 42   |
+      | 100          | single | 2       | 7    |
+
+  Scenario Outline: Report the metrics of the generation
+    Given I want to generate <number games> games with the <engine> engine, <workers> workers and the seed <seed>
+    When I generate the games with the reports of the metrics
+    Then The reports have the progress and the summary has <number games> games
+
+    Examples: Get few amount of generations
+      | number games | engine | workers | seed |
+      | 1000         | batch  | 1       | 42   |
+      | 100          | single | 1       | 7    |
+      | 1001         | batch  | 3       | 42   |
+
+  Scenario Outline: Generate the splits
+    Given I want to generate <number games> games with the <engine> engine, <workers> workers and the seed <seed>
+    When I generate the games in the splits train 0.8, validation 0.15 and test 0.05 two times
+    Then The split files have <train games>, <validation games> and <test games> games
+    And The split files are the same in both generations
+
+    Examples: Get few amount of generations
+      | number games | engine | workers | seed | train games | validation games | test games |
+      | 1000         | batch  | 1       | 42   | 800         | 150              | 50         |
+      | 1001         | table  | 2       | 42   | 801         | 150              | 50         |
+      | 99           | single | 1       | 7    | 81          | 14               | 4          |
+
+  Scenario Outline: Generate the games on other boards
+    Given I want to generate <number games> games with the <engine> engine, <workers> workers and the seed <seed>
+    And The board is <rows>x<columns> with <line length> in a row
+    When I generate the games in CSV and binary formats
+    Then The binary records are the same as the CSV records
+
+    Examples: Get few amount of generations
+      | number games | engine | workers | seed | rows | columns | line length |
+      | 1000         | batch  | 1       | 42   | 4    | 4       | 4           |
+      | 1001         | batch  | 3       | 42   | 5    | 4       | 4           |
+      | 20           | single | 1       | 7    | 6    | 7       | 4           |
@@ -8,6 +8,7 @@ Feature: Play a game with not random
     Then I got the results for the game
     And The winner with <winner player ID>
     And The returned grid with <returned grid>
+    And The history follows the turns cells
     # Player ID for the winner status: 0 for drawn; 1 for player one; 2 for player two.
 
     # The one dimension array is representing the grid of the game. It means:
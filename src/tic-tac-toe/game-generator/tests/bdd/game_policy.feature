@@ -0,0 +1,25 @@
+Feature: Play games with the policies of the players
+  It will play games where the players choose the movements with random, optimal, heuristic or epsilon-greedy policies.
+
+  Scenario Outline: Play a batch with policies
+    Given I want to play <number games> games where the player 1 is <policy 1> and the player 2 is <policy 2>
+    When I play the games with the <engine> engine and the seed <seed>
+    Then The player 1 wins between <minimum won> and <maximum won> games and loses at most <maximum lost> games
+    # Both players are optimal, so the game is always drawn.
+    # An optimal player never loses, and the heuristic player never loses against the epsilon-greedy one.
+
+    Examples: Get few amount of policies
+      | number games | policy 1       | policy 2       | engine | seed | minimum won | maximum won | maximum lost |
+      | 1000         | optimal        | optimal        | batch  | 1    | 0           | 0           | 0            |
+      | 1000         | optimal        | random         | batch  | 2    | 900         | 1000        | 0            |
+      | 1000         | random         | optimal        | batch  | 3    | 0           | 0           | 1000         |
+      | 1000         | optimal        | heuristic      | batch  | 4    | 100         | 1000        | 0            |
+      | 1000         | epsilon-greedy | random         | batch  | 5    | 700         | 1000        | 300          |
+      | 50           | optimal        | optimal        | single | 6    | 0           | 0           | 0            |
+      | 50           | optimal        | random         | single | 7    | 40          | 50          | 0            |
+      | 50           | heuristic      | epsilon-greedy | single | 8    | 5           | 50          | 0            |
+
+  Scenario: Solve the game with the transposition table
+    Given I want to solve the game
+    Then The value of the empty board is drawn
+    And The optimal cells for the empty board are all the cells
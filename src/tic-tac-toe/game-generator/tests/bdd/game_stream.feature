@@ -0,0 +1,25 @@
+Feature: Stream the games in memory
+  It will yield batches of new games, without writing them in a file.
+
+  Scenario Outline: Stream batches
+    Given I want to stream <number batches> batches of <batch size> games with the <engine> engine and the seed <seed>
+    When I read the stream two times
+    Then Every batch has <batch size> games with the columns of the CSV file
+    And Both streams have the same games
+
+    Examples: Get few amount of batches
+      | number batches | batch size | engine | seed |
+      | 1              | 10         | batch  | 1    |
+      | 5              | 1000       | batch  | 42   |
+      | 3              | 100        | table  | 7    |
+
+  Scenario Outline: Stream batches from other application
+    # The predict classification loads the package `core` with other name, it uses the board and the stream.
+    Given I import the package of the game generator with the name game_generator_core_test
+    When I stream 2 batches of 10 games with the board of <rows> rows, <columns> columns and <line length> in a row
+    Then Every batch has 10 games with the columns of the board
+
+    Examples: Get few boards
+      | rows | columns | line length |
+      | 3    | 3       | 3           |
+      | 4    | 4       | 3           |
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Steps for the enumeration feature using BDD tests.
+"""
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from behave import *
+from numpy import bincount, isin
+
+from core.enumeration import GameTable
+from core.game_batch import simulate_batch
+
+use_step_matcher("re")
+
+test_case = TestCase()
+
+
+@given("I want to load the table of games")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    context.temporary_directory = TemporaryDirectory()
+    context.add_cleanup(context.temporary_directory.cleanup)
+    context.game_table = GameTable(path.join(context.temporary_directory.name, 'games.npz'))
+
+
+@then("The table has (?P<number_games>\\d+) games")
+def step_impl(context, number_games):
+    """
+    :type context: behave.runner.Context
+    :type number_games: str
+    """
+    test_case.assertEqual(int(number_games), len(context.game_table))
+
+    cached_table = GameTable(context.game_table.filename)
+    test_case.assertEqual(context.game_table.games.tolist(), cached_table.games.tolist())
+
+
+@step("The table has (?P<drawn>\\d+) drawn games, (?P<player_1>\\d+) won by player 1 "
+      "and (?P<player_2>\\d+) won by player 2")
+def step_impl(context, drawn, player_1, player_2):
+    """
+    :type context: behave.runner.Context
+    :type drawn: str
+    :type player_1: str
+    :type player_2: str
+    """
+    test_case.assertEqual(
+        [int(drawn), int(player_1), int(player_2)],
+        bincount(context.game_table.games[:, -1]).tolist()
+    )
+
+
+@step("The probabilities of the games sum 1")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    test_case.assertAlmostEqual(1.0, context.game_table.probabilities.sum())
+    test_case.assertAlmostEqual(1.0, context.game_table.get_outcome_distribution().sum())
+
+
+@when("I sample (?P<number_games>\\d+) games with the seed (?P<seed>\\d+)")
+def step_impl(context, number_games, seed):
+    """
+    :type context: behave.runner.Context
+    :type number_games: str
+    :type seed: str
+    """
+    context.games = context.game_table.sample(int(number_games), int(seed))
+
+
+@when("I play (?P<number_games>\\d+) games with the batch engine and the seed (?P<seed>\\d+)")
+def step_impl(context, number_games, seed):
+    """
+    :type context: behave.runner.Context
+    :type number_games: str
+    :type seed: str
+    """
+    context.games = simulate_batch(int(number_games), int(seed))
+
+
+@then("Every sampled game is in the table")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    table_rows = context.game_table.games.view(f'V{context.game_table.games.shape[1]}').ravel()
+    sampled_rows = context.games.view(f'V{context.games.shape[1]}').ravel()
+    test_case.assertTrue(isin(sampled_rows, table_rows).all())
+
+
+@step("The results of the sampled games follow the exact distribution")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    expected = context.game_table.get_outcome_distribution()
+    observed = bincount(context.games[:, -1], minlength=3) / len(context.games)
+    for expected_value, observed_value in zip(expected, observed):
+        test_case.assertAlmostEqual(expected_value, observed_value, delta=0.01)
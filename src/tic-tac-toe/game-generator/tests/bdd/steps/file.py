@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Steps for the file feature using BDD tests.
+"""
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from behave import *
+
+from core.file import BufferedFileWriter
+
+use_step_matcher("re")
+
+test_case = TestCase()
+
+
+@given("I want to write (?P<number_blocks>\\d+) blocks with a buffer of (?P<buffer_size>\\d+) bytes")
+def step_impl(context, number_blocks, buffer_size):
+    """
+    :type context: behave.runner.Context
+    :type number_blocks: str
+    :type buffer_size: str
+    """
+    context.temporary_directory = TemporaryDirectory()
+    context.add_cleanup(context.temporary_directory.cleanup)
+    context.filename = path.join(context.temporary_directory.name, 'records.csv')
+    context.blocks = [f'{index},{index % 3}\n'.encode() for index in range(int(number_blocks))]
+    context.writer = BufferedFileWriter(context.filename, buffer_size=int(buffer_size))
+
+
+@when("I write the blocks in the file")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    with context.writer:
+        for block in context.blocks:
+            context.writer.write(block)
+
+
+@when("I write the blocks and an error happens")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    with test_case.assertRaises(KeyboardInterrupt):
+        with context.writer:
+            for block in context.blocks:
+                context.writer.write(block)
+            raise KeyboardInterrupt()
+
+
+@then("The file contains all the blocks in order")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    with open(context.filename, 'rb') as file_reference:
+        content = file_reference.read()
+
+    test_case.assertEqual(b''.join(context.blocks), content)
+
+
+@step("The writer reports the bytes written")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    expected_bytes = sum(len(block) for block in context.blocks)
+    test_case.assertEqual(
+        expected_bytes,
+        context.writer.bytes_written,
+        f'Expected {expected_bytes}, got {context.writer.bytes_written}'
+    )
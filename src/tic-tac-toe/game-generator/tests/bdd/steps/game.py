@@ -38,6 +38,10 @@ def step_impl(context):
     """
     :type context: behave.runner.Context
     """
+    if 'turn_cells' not in context:
+        context.game.play()
+        return
+
     with patch('core.game.random.choice') as mock_random_choice:
         mock_random_choice.side_effect = context.turn_cells
         context.game.play()
@@ -88,3 +92,15 @@ def step_impl(context, returned_grid):
         context.game.grid,
         f'Expected {returned_grid}, got {context.game.grid}'
     )
+
+
+@step("The history follows the turns cells")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    records = context.game.history.records()
+    test_case.assertEqual(len(context.game.history), len(records))
+    test_case.assertEqual(context.turn_cells[:len(records)], [record.cell for record in records])
+    test_case.assertEqual(list(range(1, len(records) + 1)), [record.turn for record in records])
+    test_case.assertEqual([2 - record.turn % 2 for record in records], [record.player for record in records])
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Steps for the batch game feature using BDD tests.
+"""
+from unittest import TestCase
+from unittest.mock import patch
+
+from behave import *
+
+from core.board import Board, get_board
+from core.game import Game
+from core.game_batch import simulate_batch, get_information_to_store
+
+use_step_matcher("re")
+
+test_case = TestCase()
+
+
+def play_single_game(cells: list, board: Board = None) -> Game:
+    """
+    Play a game with the single engine, marking the cells in the same order.
+
+    :type cells: list[int]
+    :param cells: The cells marked in every turn, the game can finish before using all of them.
+
+    :type board: Board
+    :param board: The configuration of the board, by default 3x3.
+
+    :rtype: Game
+    :return: The game already played.
+    """
+    board = board or get_board()
+    missing_cells = [cell for cell in range(1, board.cells + 1) if cell not in cells]
+    game = Game(board=board)
+    with patch('core.game.random.choice') as mock_random_choice:
+        mock_random_choice.side_effect = cells + missing_cells
+        game.play()
+
+    return game
+
+
+@given("I want to run a batch of (?P<number_games>\\d+) games with the seed (?P<seed>\\d+)")
+def step_impl(context, number_games, seed):
+    """
+    :type context: behave.runner.Context
+    :type number_games: str
+    :type seed: str
+    """
+    context.number_games = int(number_games)
+    context.seed = int(seed)
+    context.board = get_board()
+
+
+@given("I want to run a batch of (?P<number_games>\\d+) games on the board (?P<rows>\\d+)x(?P<columns>\\d+) "
+       "with (?P<line_length>\\d+) in a row and the seed (?P<seed>\\d+)")
+def step_impl(context, number_games, rows, columns, line_length, seed):
+    """
+    :type context: behave.runner.Context
+    :type number_games: str
+    :type rows: str
+    :type columns: str
+    :type line_length: str
+    :type seed: str
+    """
+    context.number_games = int(number_games)
+    context.seed = int(seed)
+    context.board = get_board(int(rows), int(columns), int(line_length))
+
+
+@when("I start the batch of games")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    context.games = simulate_batch(context.number_games, context.seed, board=context.board)
+
+
+@then("Every game in the batch has the same results as a single game")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    test_case.assertEqual((context.number_games, context.board.cells * 2 + 1), context.games.shape)
+
+    for row in context.games:
+        cells = [int(cell) for cell in row[1:-1:2] if cell]
+        game = play_single_game(cells, context.board)
+        test_case.assertEqual(
+            game.winner,
+            row[-1],
+            f'Expected {game.winner}, got {row[-1]} for the cells {cells}'
+        )
+
+
+@step("Every CSV line in the batch is the same as a single game")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    lines = get_information_to_store(context.games).decode().splitlines()
+    test_case.assertEqual(context.number_games, len(lines))
+
+    for line, row in zip(lines, context.games):
+        cells = [int(cell) for cell in row[1:-1:2] if cell]
+        game = play_single_game(cells, context.board)
+        test_case.assertEqual(
+            game.get_information_to_store(),
+            line,
+            f'Expected {game.get_information_to_store()}, got {line}'
+        )
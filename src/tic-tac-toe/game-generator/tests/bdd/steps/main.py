@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Steps for the game generator feature using BDD tests.
+"""
+import gzip
+from collections import Counter
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from behave import *
+from numpy import fromfile, loadtxt, int8
+
+from core.binary_file import read_header
+from core.game import Game
+from core.game_counter import COUNT_COLUMN
+from core.main import start, get_shard_filenames, get_split_filenames
+from core import main
+
+use_step_matcher("re")
+
+test_case = TestCase()
+
+
+@given("I want to generate (?P<number_games>\\d+) games with the (?P<engine>\\w+) engine, "
+       "(?P<workers>\\d+) workers and the seed (?P<seed>\\d+)")
+def step_impl(context, number_games, engine, workers, seed):
+    """
+    :type context: behave.runner.Context
+    :type number_games: str
+    :type engine: str
+    :type workers: str
+    :type seed: str
+    """
+    context.temporary_directory = TemporaryDirectory()
+    context.add_cleanup(context.temporary_directory.cleanup)
+    context.generator_options = {
+        'number_games': int(number_games),
+        'engine': engine,
+        'workers': int(workers),
+        'seed': int(seed),
+    }
+
+
+@step("The board is (?P<rows>\\d+)x(?P<columns>\\d+) with (?P<line_length>\\d+) in a row")
+def step_impl(context, rows, columns, line_length):
+    """
+    :type context: behave.runner.Context
+    :type rows: str
+    :type columns: str
+    :type line_length: str
+    """
+    context.generator_options.update({'rows': int(rows), 'columns': int(columns), 'line_length': int(line_length)})
+
+
+@when("I generate the games two times")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    context.csv_filenames = []
+    for index in range(2):
+        csv_filename = path.join(context.temporary_directory.name, f'records-{index}.csv')
+        start(csv_filename=csv_filename, **context.generator_options)
+        context.csv_filenames.append(csv_filename)
+
+
+@then("The CSV file has the headers and (?P<number_games>\\d+) games")
+def step_impl(context, number_games):
+    """
+    :type context: behave.runner.Context
+    :type number_games: str
+    """
+    with open(context.csv_filenames[0]) as file_reference:
+        lines = file_reference.read().splitlines()
+
+    test_case.assertEqual(Game.get_headers_to_store(), lines[0])
+    test_case.assertEqual(int(number_games), len(lines) - 1)
+    test_case.assertNotIn(Game.get_headers_to_store(), lines[1:])
+
+
+@step("The CSV files are the same in both generations")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    contents = []
+    for csv_filename in context.csv_filenames:
+        with open(csv_filename, 'rb') as file_reference:
+            contents.append(file_reference.read())
+
+    test_case.assertEqual(contents[0], contents[1])
+
+
+@when("I generate the games in CSV and binary formats")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    context.csv_filename = path.join(context.temporary_directory.name, 'records.csv')
+    start(csv_filename=context.csv_filename, file_format='csv', **context.generator_options)
+    context.binary_filename = path.join(context.temporary_directory.name, 'records.bin')
+    start(csv_filename=context.binary_filename, file_format='binary', **context.generator_options)
+
+
+@then("The binary records are the same as the CSV records")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    header, offset = read_header(context.binary_filename)
+    board = [context.generator_options.get(name, 3) for name in ('rows', 'columns', 'line_length')]
+    columns = Game.get_headers_to_store(board[0] * board[1]).split(',')
+    test_case.assertEqual(columns, header.get('columns'))
+    test_case.assertEqual(board, header.get('board'))
+    test_case.assertEqual(context.generator_options.get('seed'), header.get('seed'))
+
+    binary_records = fromfile(context.binary_filename, dtype=int8, offset=offset).reshape(-1, len(columns))
+    csv_records = loadtxt(context.csv_filename, dtype=int8, delimiter=',', skiprows=1, ndmin=2)
+    test_case.assertEqual(csv_records.tolist(), binary_records.tolist())
+
+
+@when("I generate the games with and without deduplication")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    context.csv_filename = path.join(context.temporary_directory.name, 'records.csv')
+    start(csv_filename=context.csv_filename, **context.generator_options)
+    context.deduplicated_filename = path.join(context.temporary_directory.name, 'records-deduplicated.csv')
+    start(csv_filename=context.deduplicated_filename, deduplicate=True, **context.generator_options)
+
+
+@then("The deduplicated games have the counts of the CSV records")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    with open(context.csv_filename) as file_reference:
+        csv_lines = file_reference.read().splitlines()
+    with open(context.deduplicated_filename) as file_reference:
+        deduplicated_lines = file_reference.read().splitlines()
+
+    test_case.assertEqual(f'{csv_lines[0]},{COUNT_COLUMN}', deduplicated_lines[0])
+    counts = {}
+    for line in deduplicated_lines[1:]:
+        game, count = line.rsplit(',', 1)
+        counts[game] = int(count)
+
+    test_case.assertEqual(len(counts), len(deduplicated_lines) - 1)
+    test_case.assertEqual(dict(Counter(csv_lines[1:])), counts)
+
+
+@when("I generate the games in (?P<file_format>\\w+) format and it stops after (?P<blocks>\\d+) blocks")
+def step_impl(context, file_format, blocks):
+    """
+    :type context: behave.runner.Context
+    :type file_format: str
+    :type blocks: str
+    """
+    extension = 'bin' if file_format == 'binary' else 'csv'
+    context.generator_options.update({'file_format': file_format, 'block_size': 100, 'checkpoint_interval': 0.0})
+    context.complete_filename = path.join(context.temporary_directory.name, f'records-complete.{extension}')
+    start(csv_filename=context.complete_filename, **context.generator_options)
+
+    context.csv_filename = path.join(context.temporary_directory.name, f'records.{extension}')
+    written_blocks = []
+
+    def stop_after_blocks(write, information):
+        # The single engine writes one game at a time, every game is a block.
+        if len(written_blocks) == int(blocks):
+            raise KeyboardInterrupt
+        written_blocks.append(information)
+        write(information)
+
+    original_write = main.BufferedFileWriter.write
+    with patch.object(main.BufferedFileWriter, 'write', autospec=True,
+                      side_effect=lambda writer, information: stop_after_blocks(
+                          lambda block: original_write(writer, block), information)):
+        try:
+            start(csv_filename=context.csv_filename, **context.generator_options)
+        except KeyboardInterrupt:
+            pass
+
+    # The games written after the last checkpoint are kept, the last one is incomplete.
+    workers = context.generator_options.get('workers')
+    stopped_filenames = get_shard_filenames(context.csv_filename, workers) if workers > 1 else [context.csv_filename]
+    with open(stopped_filenames[0], 'ab') as file_reference:
+        with open(context.complete_filename, 'rb') as complete_reference:
+            complete_reference.seek(path.getsize(stopped_filenames[0]))
+            file_reference.write(complete_reference.read(60))
+
+
+@step("I resume the generation")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    start(csv_filename=context.csv_filename, resume=True, **context.generator_options)
+
+
+@then("The resumed file is the same as the file without interruption")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    with open(context.complete_filename, 'rb') as file_reference:
+        complete_content = file_reference.read()
+    with open(context.csv_filename, 'rb') as file_reference:
+        resumed_content = file_reference.read()
+
+    test_case.assertEqual(complete_content, resumed_content)
+    test_case.assertFalse(path.exists(f'{context.csv_filename}.checkpoint'))
+
+
+@when("I generate the games with and without compression")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    context.csv_filename = path.join(context.temporary_directory.name, 'records.csv')
+    start(csv_filename=context.csv_filename, **context.generator_options)
+    context.compressed_filename = path.join(context.temporary_directory.name, 'records.csv.gz')
+    start(csv_filename=context.compressed_filename, compression='gzip', buffer_size=4096,
+          **context.generator_options)
+
+
+@then("The decompressed file is the same as the CSV file")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    with open(context.csv_filename, 'rb') as file_reference:
+        csv_content = file_reference.read()
+    with gzip.open(context.compressed_filename, 'rb') as file_reference:
+        decompressed_content = file_reference.read()
+
+    test_case.assertEqual(csv_content, decompressed_content)
+    test_case.assertLess(path.getsize(context.compressed_filename), len(csv_content))
+
+
+@when("I generate the games with the reports of the metrics")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    context.csv_filename = path.join(context.temporary_directory.name, 'records.csv')
+    context.reports = []
+    # With workers, the reports of the processes are not received by this list, only the summary.
+    start(csv_filename=context.csv_filename, block_size=100, report_interval=0.0,
+          report_callback=context.reports.append, **context.generator_options)
+
+
+@then("The reports have the progress and the summary has (?P<number_games>\\d+) games")
+def step_impl(context, number_games):
+    """
+    :type context: behave.runner.Context
+    :type number_games: str
+    """
+    summary = context.reports[-1]
+    test_case.assertEqual(int(number_games), summary.get('games'))
+    test_case.assertEqual(int(number_games), summary.get('rows'))
+    test_case.assertGreater(summary.get('simulation_seconds'), 0.0)
+    # With workers, the bytes written include the headers of every shard.
+    test_case.assertGreaterEqual(summary.get('bytes_written'), path.getsize(context.csv_filename))
+
+    if context.generator_options.get('workers') == 1:
+        test_case.assertEqual(path.getsize(context.csv_filename), summary.get('bytes_written'))
+        progress = [report.get('games') for report in context.reports[:-1]]
+        test_case.assertGreater(len(progress), 1)
+        test_case.assertEqual(sorted(progress), progress)
+        test_case.assertEqual(int(number_games), progress[-1])
+
+
+@when("I generate the games in the splits train (?P<train>[\\d.]+), validation (?P<validation>[\\d.]+) "
+      "and test (?P<test>[\\d.]+) two times")
+def step_impl(context, train, validation, test):
+    """
+    :type context: behave.runner.Context
+    :type train: str
+    :type validation: str
+    :type test: str
+    """
+    splits = {'train': float(train), 'validation': float(validation), 'test': float(test)}
+    context.split_filenames = []
+    for index in range(2):
+        csv_filename = path.join(context.temporary_directory.name, f'records-{index}.csv')
+        start(csv_filename=csv_filename, splits=splits, **context.generator_options)
+        context.split_filenames.append(get_split_filenames(csv_filename, splits))
+
+
+@then("The split files have (?P<train_games>\\d+), (?P<validation_games>\\d+) and (?P<test_games>\\d+) games")
+def step_impl(context, train_games, validation_games, test_games):
+    """
+    :type context: behave.runner.Context
+    :type train_games: str
+    :type validation_games: str
+    :type test_games: str
+    """
+    test_case.assertTrue(context.split_filenames[0][0].endswith('records-0-train.csv'))
+    split_games = []
+    for split_filename in context.split_filenames[0]:
+        with open(split_filename) as file_reference:
+            lines = file_reference.read().splitlines()
+        test_case.assertEqual(Game.get_headers_to_store(), lines[0])
+        split_games.append(len(lines) - 1)
+
+    test_case.assertEqual([int(train_games), int(validation_games), int(test_games)], split_games)
+
+
+@step("The split files are the same in both generations")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    for first_filename, second_filename in zip(*context.split_filenames):
+        with open(first_filename, 'rb') as first_reference, open(second_filename, 'rb') as second_reference:
+            test_case.assertEqual(first_reference.read(), second_reference.read())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Steps for the policy feature using BDD tests.
+"""
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from behave import *
+from numpy import random
+
+from core.game import Game
+from core.game_batch import simulate_batch
+from core.policy import get_policy, get_transposition_table
+
+use_step_matcher("re")
+
+test_case = TestCase()
+
+
+@given("I want to play (?P<number_games>\\d+) games where the player 1 is (?P<policy_1>[\\w-]+) "
+       "and the player 2 is (?P<policy_2>[\\w-]+)")
+def step_impl(context, number_games, policy_1, policy_2):
+    """
+    :type context: behave.runner.Context
+    :type number_games: str
+    :type policy_1: str
+    :type policy_2: str
+    """
+    context.number_games = int(number_games)
+    context.policies = (get_policy(policy_1), get_policy(policy_2))
+
+
+@when("I play the games with the (?P<engine>\\w+) engine and the seed (?P<seed>\\d+)")
+def step_impl(context, engine, seed):
+    """
+    :type context: behave.runner.Context
+    :type engine: str
+    :type seed: str
+    """
+    if engine == 'batch':
+        context.winners = simulate_batch(context.number_games, int(seed), context.policies)[:, -1].tolist()
+        return
+
+    random.seed(int(seed))
+    context.winners = []
+    for _ in range(context.number_games):
+        game = Game(context.policies)
+        context.winners.append(game.play())
+
+
+@then("The player 1 wins between (?P<minimum_won>\\d+) and (?P<maximum_won>\\d+) games "
+      "and loses at most (?P<maximum_lost>\\d+) games")
+def step_impl(context, minimum_won, maximum_won, maximum_lost):
+    """
+    :type context: behave.runner.Context
+    :type minimum_won: str
+    :type maximum_won: str
+    :type maximum_lost: str
+    """
+    won = context.winners.count(1)
+    lost = context.winners.count(2)
+    test_case.assertGreaterEqual(won, int(minimum_won), f'Expected at least {minimum_won} won, got {won}')
+    test_case.assertLessEqual(won, int(maximum_won), f'Expected at most {maximum_won} won, got {won}')
+    test_case.assertLessEqual(lost, int(maximum_lost), f'Expected at most {maximum_lost} lost, got {lost}')
+
+
+@given("I want to solve the game")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    context.temporary_directory = TemporaryDirectory()
+    context.add_cleanup(context.temporary_directory.cleanup)
+    table_filename = path.join(context.temporary_directory.name, 'optimal.npy')
+    context.value_table, context.move_table = get_transposition_table(table_filename)
+    context.cached_value_table, context.cached_move_table = get_transposition_table.__wrapped__(table_filename)
+
+
+@then("The value of the empty board is drawn")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    test_case.assertEqual(0, context.value_table[0])
+    test_case.assertEqual(context.value_table.tolist(), context.cached_value_table.tolist())
+
+
+@step("The optimal cells for the empty board are all the cells")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    test_case.assertEqual(0b111111111, context.move_table[0])
+    test_case.assertEqual(context.move_table.tolist(), context.cached_move_table.tolist())
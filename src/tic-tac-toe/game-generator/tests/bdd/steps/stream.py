@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Steps for the stream feature using BDD tests.
+"""
+import sys
+from importlib import import_module
+from importlib.util import module_from_spec, spec_from_file_location
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from behave import *
+
+from core.game import Game
+from core.stream import get_columns, iter_game_batches
+
+use_step_matcher("re")
+
+test_case = TestCase()
+
+
+@given("I want to stream (?P<number_batches>\\d+) batches of (?P<batch_size>\\d+) games "
+       "with the (?P<engine>\\w+) engine and the seed (?P<seed>\\d+)")
+def step_impl(context, number_batches, batch_size, engine, seed):
+    """
+    :type context: behave.runner.Context
+    :type number_batches: str
+    :type batch_size: str
+    :type engine: str
+    :type seed: str
+    """
+    context.temporary_directory = TemporaryDirectory()
+    context.add_cleanup(context.temporary_directory.cleanup)
+    context.stream_options = {
+        'batch_size': int(batch_size),
+        'seed': int(seed),
+        'number_batches': int(number_batches),
+        'engine': engine,
+        'table_filename': path.join(context.temporary_directory.name, 'games.npz'),
+    }
+
+
+@when("I read the stream two times")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    context.streams = [list(iter_game_batches(**context.stream_options)) for _ in range(2)]
+
+
+@then("Every batch has (?P<batch_size>\\d+) games with the columns of the CSV file")
+def step_impl(context, batch_size):
+    """
+    :type context: behave.runner.Context
+    :type batch_size: str
+    """
+    test_case.assertEqual(Game.get_headers_to_store().split(','), get_columns())
+    test_case.assertEqual(context.stream_options.get('number_batches'), len(context.streams[0]))
+    for batch in context.streams[0]:
+        test_case.assertEqual((int(batch_size), len(get_columns())), batch.shape)
+
+
+@step("Both streams have the same games")
+def step_impl(context):
+    """
+    :type context: behave.runner.Context
+    """
+    first_stream, second_stream = context.streams
+    for first_batch, second_batch in zip(first_stream, second_stream):
+        test_case.assertEqual(first_batch.tolist(), second_batch.tolist())
+
+
+@given("I import the package of the game generator with the name (?P<package_name>\\w+)")
+def step_impl(context, package_name):
+    """
+    :type context: behave.runner.Context
+    :type package_name: str
+    """
+    package_directory: str = path.dirname(path.abspath(import_module('core').__file__))
+    spec = spec_from_file_location(package_name, path.join(package_directory, '__init__.py'),
+                                   submodule_search_locations=[package_directory])
+    sys.modules[package_name] = module_from_spec(spec)
+    context.add_cleanup(lambda: [sys.modules.pop(name) for name in list(sys.modules)
+                                 if name == package_name or name.startswith(f'{package_name}.')])
+    spec.loader.exec_module(sys.modules[package_name])
+    context.package_name = package_name
+
+
+@when("I stream (?P<number_batches>\\d+) batches of (?P<batch_size>\\d+) games with the board of (?P<rows>\\d+) rows, "
+      "(?P<columns>\\d+) columns and (?P<line_length>\\d+) in a row")
+def step_impl(context, number_batches, batch_size, rows, columns, line_length):
+    """
+    :type context: behave.runner.Context
+    :type number_batches: str
+    :type batch_size: str
+    :type rows: str
+    :type columns: str
+    :type line_length: str
+    """
+    board_module = import_module(f'{context.package_name}.board')
+    stream_module = import_module(f'{context.package_name}.stream')
+    context.board = board_module.get_board(int(rows), int(columns), int(line_length))
+    context.board_columns = stream_module.get_columns(context.board)
+    context.streams = [list(stream_module.iter_game_batches(int(batch_size), seed=1,
+                                                            number_batches=int(number_batches),
+                                                            board=context.board))]
+
+
+@then("Every batch has (?P<batch_size>\\d+) games with the columns of the board")
+def step_impl(context, batch_size):
+    """
+    :type context: behave.runner.Context
+    :type batch_size: str
+    """
+    test_case.assertEqual(context.board.cells * 2 + 1, len(context.board_columns))
+    for batch in context.streams[0]:
+        test_case.assertEqual((int(batch_size), len(context.board_columns)), batch.shape)
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Benchmark of the throughput of the game generator.
+
+Every stage runs in its own process, so the peak of the resident memory belongs only to that stage.
+The results are stored as JSON, and they are compared with a baseline:
+
+    python tests/benchmark/benchmark.py --sizes 1000 100000 --baseline tests/benchmark/baseline.json
+
+The exit code is 1 when the games per second of any measurement regress more than the threshold.
+Use `--update-baseline` to store the results as the new baseline, a missing baseline is an error without it.
+"""
+import json
+import sys
+from argparse import ArgumentParser, SUPPRESS
+from contextlib import redirect_stdout
+from io import StringIO
+from os import path
+from platform import platform, python_version
+from resource import getrusage, RUSAGE_SELF
+from subprocess import run, PIPE
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+GAME_GENERATOR_DIRECTORY: str = path.dirname(path.dirname(path.dirname(path.abspath(__file__))))
+
+# Stage and engines measured for every number of games.
+STAGES: dict = {
+    'play': ('single', 'batch', 'table'),
+    'information': ('single', 'batch'),
+    'store': ('single',),
+    'start': ('single', 'batch', 'table'),
+}
+
+
+def measure(stage: str, engine: str, number_games: int) -> dict:
+    """
+    Measure one stage with one engine, in the current process.
+
+    :type stage: str
+    :param stage: The stage: `play` plays the games, `information` formats them for the CSV file,
+    `store` writes them with `Game.store_information`, `start` runs the whole `core.main.start`.
+
+    :type engine: str
+    :param engine: The engine: `single`, `batch` or `table`.
+
+    :type number_games: int
+    :param number_games: Number of games.
+
+    :rtype: dict
+    :return: The seconds, the bytes produced and the peak of the resident memory in KiB.
+    """
+    sys.path.insert(0, GAME_GENERATOR_DIRECTORY)
+    from numpy import random
+    from core.enumeration import GameTable
+    from core.game import Game
+    from core.game_batch import simulate_batch, get_information_to_store
+    from core.main import start
+
+    random.seed(42)
+    generator: random.Generator = random.default_rng(42)
+    number_bytes: int = 0
+
+    with TemporaryDirectory() as temporary_directory:
+        filename: str = path.join(temporary_directory, 'records.csv')
+
+        if stage == 'start':
+            with redirect_stdout(StringIO()):
+                start_time: float = perf_counter()
+                start(number_games, filename, engine=engine, seed=42,
+                      table_filename=path.join(GAME_GENERATOR_DIRECTORY, 'tic-tac-toe-games.npz'))
+                seconds: float = perf_counter() - start_time
+            number_bytes = path.getsize(filename)
+
+        elif engine == 'single':
+            games: list = []
+            start_time: float = perf_counter()
+            for _ in range(number_games):
+                game = Game()
+                game.play()
+                games.append(game)
+            seconds: float = perf_counter() - start_time
+
+            if stage in ('information', 'store'):
+                start_time = perf_counter()
+                information: list = [game.get_information_to_store() for game in games]
+                seconds = perf_counter() - start_time
+                number_bytes = sum(len(line) + 1 for line in information)
+
+                if stage == 'store':
+                    start_time = perf_counter()
+                    for game, line in zip(games, information):
+                        game.store_information(filename, line)
+                    seconds = perf_counter() - start_time
+
+        else:
+            play_games = simulate_batch
+            if engine == 'table':
+                play_games = GameTable(path.join(GAME_GENERATOR_DIRECTORY, 'tic-tac-toe-games.npz')).sample
+
+            start_time: float = perf_counter()
+            games = play_games(number_games, generator)
+            seconds: float = perf_counter() - start_time
+
+            if stage == 'information':
+                start_time = perf_counter()
+                number_bytes = len(get_information_to_store(games))
+                seconds = perf_counter() - start_time
+
+    return {
+        'seconds': seconds,
+        'bytes': number_bytes,
+        'peak_rss_kib': getrusage(RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def run_measurement(stage: str, engine: str, number_games: int) -> dict:
+    """
+    Measure one stage with one engine in a new process.
+
+    :type stage: str
+    :param stage: The stage, one of `STAGES`.
+
+    :type engine: str
+    :param engine: The engine.
+
+    :type number_games: int
+    :param number_games: Number of games.
+
+    :rtype: dict
+    :return: The result, with the games and the bytes per second.
+    """
+    process = run([sys.executable, path.abspath(__file__), '--measure', stage, engine, str(number_games)],
+                  stdout=PIPE, check=True, cwd=GAME_GENERATOR_DIRECTORY)
+    measurement: dict = json.loads(process.stdout.decode().splitlines()[-1])
+    seconds: float = measurement.get('seconds')
+
+    return {
+        'stage': stage,
+        'engine': engine,
+        'games': number_games,
+        'seconds': seconds,
+        'games_per_second': number_games / seconds if seconds > 0 else 0.0,
+        'bytes': measurement.get('bytes'),
+        'bytes_per_second': measurement.get('bytes') / seconds if seconds > 0 else 0.0,
+        'peak_rss_kib': measurement.get('peak_rss_kib'),
+    }
+
+
+def get_regressions(results: list, baseline: list, threshold: float) -> list:
+    """
+    Compare the results with the baseline, the measurements are matched by stage, engine and games.
+
+    :type results: list[dict]
+    :param results: The new results.
+
+    :type baseline: list[dict]
+    :param baseline: The results of the baseline.
+
+    :type threshold: float
+    :param threshold: The maximum fraction of games per second which can be lost, for example 0.1 is 10%.
+
+    :rtype: list[str]
+    :return: The description of every regression.
+    """
+    baseline_results: dict = {(result['stage'], result['engine'], result['games']): result for result in baseline}
+    regressions: list = []
+    result: dict
+    for result in results:
+        key: tuple = (result['stage'], result['engine'], result['games'])
+        if key not in baseline_results:
+            continue
+
+        expected: float = baseline_results[key]['games_per_second']
+        if result['games_per_second'] < expected * (1 - threshold):
+            regressions.append(f'{key[0]} {key[1]} {key[2]:,} games: '
+                               f'{result["games_per_second"]:,.0f} games/s, baseline {expected:,.0f} games/s')
+
+    return regressions
+
+
+def display_results(results: list) -> None:
+    """
+    Display the results as a table.
+
+    :type results: list[dict]
+    :param results: The results.
+
+    :rtype: None
+    """
+    print('========================================')
+    print('===  Benchmark of the game generator ===')
+    print('========================================')
+    print(f'{"Stage":<12}{"Engine":<8}{"Games":>12}{"Games/s":>14}{"Bytes/s":>16}{"Peak RSS MiB":>14}')
+    result: dict
+    for result in results:
+        print(f'{result["stage"]:<12}{result["engine"]:<8}{result["games"]:>12,}'
+              f'{result["games_per_second"]:>14,.0f}{result["bytes_per_second"]:>16,.0f}'
+              f'{result["peak_rss_kib"] / 1024:>14,.1f}')
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(
+        prog='Tic Tac Toe game generator benchmark',
+        description='Measure the games per second, the bytes per second and the peak of memory of the generator.'
+    )
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7],
+                        help='Number of games of every measurement.')
+    parser.add_argument('--stages', type=str, nargs='+', default=list(STAGES), choices=list(STAGES),
+                        help='The stages which are measured.')
+    parser.add_argument('--max-single-games', type=int, default=10 ** 5,
+                        help='Maximum number of games for the single engine, it plays one game at a time.')
+    parser.add_argument('-o', '--output', type=str, default='benchmark-results.json',
+                        help='The JSON file which stores the results.')
+    parser.add_argument('--baseline', type=str, default=None,
+                        help='The JSON file with the results of the baseline.')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Maximum fraction of games per second lost against the baseline, 0.1 is 10%%.')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='Store the results as the new baseline instead of the comparison, it is needed to '
+                             'create the baseline.')
+    parser.add_argument('--measure', type=str, nargs=3, default=None, metavar=('STAGE', 'ENGINE', 'GAMES'),
+                        help=SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure is not None:
+        print(json.dumps(measure(args.measure[0], args.measure[1], int(args.measure[2]))))
+        sys.exit(0)
+
+    if args.baseline is not None and not args.update_baseline and not path.exists(args.baseline):
+        # The first comparison would always pass, so the baseline is only created explicitly.
+        parser.error(f'The baseline "{args.baseline}" does not exist, create it with --update-baseline.')
+
+    benchmark_results: list = []
+    for benchmark_stage in args.stages:
+        for benchmark_engine in STAGES[benchmark_stage]:
+            for benchmark_games in args.sizes:
+                if benchmark_engine == 'single' and benchmark_games > args.max_single_games:
+                    continue
+                benchmark_results.append(run_measurement(benchmark_stage, benchmark_engine, benchmark_games))
+
+    display_results(benchmark_results)
+    with open(args.output, 'w') as file_reference:
+        json.dump({'python': python_version(), 'platform': platform(), 'results': benchmark_results},
+                  file_reference, indent=2)
+    print(f'Results: {args.output}')
+
+    if args.baseline is None:
+        sys.exit(0)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as file_reference:
+            json.dump({'python': python_version(), 'platform': platform(), 'results': benchmark_results},
+                      file_reference, indent=2)
+        print(f'Baseline updated: {args.baseline}')
+        sys.exit(0)
+
+    with open(args.baseline) as file_reference:
+        baseline_results: list = json.load(file_reference).get('results', [])
+
+    benchmark_regressions: list = get_regressions(benchmark_results, baseline_results, args.threshold)
+    if benchmark_regressions:
+        print(f'Regressions greater than {args.threshold:.0%}:')
+        for regression in benchmark_regressions:
+            print(f'  {regression}')
+        sys.exit(1)
+
+    print(f'No regressions greater than {args.threshold:.0%}.')
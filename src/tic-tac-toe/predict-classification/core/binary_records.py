@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Load the binary file of records created by the game generator, with `numpy.memmap`.
+
+The format is described in `game-generator/core/binary_file.py`: the magic bytes, the length of the header
+as an unsigned integer of 4 bytes (little endian), the header in JSON padded to 64 bytes and the records
+as rows of signed integers of 1 byte.
+"""
+from json import dumps, loads
+from os.path import getsize
+from struct import pack, unpack
+
+from numpy import ndarray, memmap, empty, dtype
+from pandas import DataFrame
+
+MAGIC: bytes = b'TTTGAMES'
+ALIGNMENT: int = 64
+
+
+def get_header(columns: list, data_type: str = 'int8', **information) -> bytes:
+    """
+    Return the header of a binary file of records, the same format as the game generator.
+
+    :type columns: list[str]
+    :param columns: The names of the columns of every record.
+
+    :type data_type: str
+    :param data_type: The NumPy type of the values of the records.
+
+    :param information: Other values stored in the header, for example the source of the records.
+
+    :rtype: bytes
+    :return: The header, its length is multiple of 64 bytes.
+    """
+    header: bytes = dumps({'dtype': data_type, 'columns': columns, **information}).encode()
+    prefix_size: int = len(MAGIC) + 4
+    padding: int = -(prefix_size + len(header)) % ALIGNMENT
+    header += b' ' * padding
+
+    return MAGIC + pack('<I', len(header)) + header
+
+
+def read_header(filename: str) -> tuple:
+    """
+    Read the header of a binary file of records.
+
+    :type filename: str
+    :param filename: The path and filename of the binary file.
+
+    :rtype: tuple[dict, int]
+    :return: The information in the header and the offset in bytes where the records start.
+    """
+    with open(filename, 'rb') as file_reference:
+        magic: bytes = file_reference.read(len(MAGIC))
+        if magic != MAGIC:
+            raise ValueError(f'The file "{filename}" is not a binary file of records.')
+
+        header_size: int = unpack('<I', file_reference.read(4))[0]
+        header: dict = loads(file_reference.read(header_size))
+
+    return header, len(MAGIC) + 4 + header_size
+
+
+class BinaryRecords:
+    """
+    Open the binary file of records without reading it in memory.
+    """
+    __filename: str
+    __header: dict
+    __offset: int
+    __records: ndarray
+
+    def __init__(self, filename: str) -> None:
+        """
+        Construction method.
+
+        :type filename: str
+        :param filename: The path and filename of the binary file.
+
+        :rtype: None
+        """
+        self.__filename = filename
+        self.__header, self.__offset = read_header(self.__filename)
+
+        data_type: dtype = dtype(self.__header.get('dtype'))
+        row_size: int = len(self.columns) * data_type.itemsize
+        rows: int = (getsize(self.__filename) - self.__offset) // row_size
+
+        if rows:
+            self.__records = memmap(self.__filename, dtype=data_type, mode='r',
+                                    offset=self.__offset, shape=(rows, len(self.columns)))
+        else:
+            self.__records = empty((0, len(self.columns)), dtype=data_type)
+
+    def __len__(self) -> int:
+        return self.__records.shape[0]
+
+    @property
+    def header(self) -> dict:
+        """
+        Get the information stored in the header, for example the columns and the seed.
+
+        :rtype: dict
+        :return: The header.
+        """
+        return self.__header
+
+    @property
+    def columns(self) -> list:
+        """
+        Get the names of the columns.
+
+        :rtype: list[str]
+        :return: The columns.
+        """
+        return self.__header.get('columns')
+
+    @property
+    def records(self) -> ndarray:
+        """
+        Get the records as a matrix mapped to the file, one row per game.
+
+        :rtype: ndarray
+        :return: The records.
+        """
+        return self.__records
+
+    def get_data_frame(self, columns: list = None) -> DataFrame:
+        """
+        Return the records as a data frame. Without columns, the data frame uses the mapped file directly.
+
+        :type columns: list[str]
+        :param columns: The Columns Names which will be loaded, by default all of them.
+
+        :rtype: DataFrame
+        :return: The data frame with the records.
+        """
+        if columns is None:
+            return DataFrame(self.__records, columns=self.columns, copy=False)
+
+        indexes: list = [self.columns.index(column) for column in columns]
+        return DataFrame(self.__records[:, indexes], columns=columns, copy=False)
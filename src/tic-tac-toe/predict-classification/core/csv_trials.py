@@ -23,6 +23,29 @@ class CsvTrials:
         self.__trials_path = trials_path
         self.__csv_path = csv_path
 
+    @staticmethod
+    def __get_metric(metrics: dict, name: str, prefix: str = '') -> dict:
+        """
+        Return a categorical metric of the trial, with the dense labels or with the sparse labels.
+
+        :type metrics: dict
+        :param metrics: The metrics of the trial.
+
+        :type name: str
+        :param name: The name of the metric with dense labels, for example `categorical_accuracy`.
+
+        :type prefix: str
+        :param prefix: The prefix of the metric, for example `val_` for the validation set.
+
+        :rtype: dict
+        :return: The metric, with the name `sparse_categorical_accuracy` for the sparse labels.
+        """
+        metric: dict = metrics.get(f'{prefix}{name}')
+        if metric is None:
+            metric = metrics.get(f'{prefix}sparse_{name}')
+
+        return metric
+
     def generate(self):
         csv_headers = 'trial_id,batch_size,units,layers,learning_rate,amsgrad,best_epoch,score,' \
                       'accuracy,accuracy_epoch,' \
@@ -58,16 +81,16 @@ class CsvTrials:
                     tuner_round = values.get('tuner/round')
                     score = json_data.get('score')
                     metrics = json_data.get('metrics').get('metrics')
-                    cat_accuracy = metrics.get('categorical_accuracy')
+                    cat_accuracy = self.__get_metric(metrics, 'categorical_accuracy')
                     cat_accuracy_value = cat_accuracy.get('observations')[0].get('value')[0]
                     cat_accuracy_epoch = cat_accuracy.get('observations')[0].get('step') + 1
-                    cat_cross_entropy = metrics.get('categorical_crossentropy')
+                    cat_cross_entropy = self.__get_metric(metrics, 'categorical_crossentropy')
                     cat_cross_entropy_value = cat_cross_entropy.get('observations')[0].get('value')[0]
                     cat_cross_entropy_epoch = cat_cross_entropy.get('observations')[0].get('step') + 1
-                    cat_accuracy_val = metrics.get('val_categorical_accuracy')
+                    cat_accuracy_val = self.__get_metric(metrics, 'categorical_accuracy', 'val_')
                     cat_accuracy_val_value = cat_accuracy_val.get('observations')[0].get('value')[0]
                     cat_accuracy_val_epoch = cat_accuracy_val.get('observations')[0].get('step') + 1
-                    cat_cross_entropy_val = metrics.get('val_categorical_crossentropy')
+                    cat_cross_entropy_val = self.__get_metric(metrics, 'categorical_crossentropy', 'val_')
                     cat_cross_entropy_val_value = cat_cross_entropy_val.get('observations')[0].get('value')[0]
                     cat_cross_entropy_val_epoch = cat_cross_entropy_val.get('observations')[0].get('step') + 1
                     best_step = json_data.get('best_step')
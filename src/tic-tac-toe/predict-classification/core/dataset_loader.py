@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Load the CSV files of records with compact types, and cache them as binary files of records.
+"""
+import gzip
+from hashlib import sha256
+from json import dumps
+from os import makedirs, remove, replace, stat
+from os.path import abspath, basename, exists, join, splitext
+
+from numpy import ndarray, iinfo
+from pandas import DataFrame, read_csv
+
+from core.binary_records import BinaryRecords, get_header
+
+GZIP_MAGIC: bytes = b'\x1f\x8b'
+
+
+def is_gzip_file(filename: str) -> bool:
+    """
+    Check if the file is compressed with gzip, by its suffix or its magic bytes.
+
+    :type filename: str
+    :param filename: The path and filename.
+
+    :rtype: bool
+    :return: True if it is a gzip file, for example the files of `game-generator/main.py --compression gzip`.
+    """
+    if filename.endswith('.gz'):
+        return True
+
+    with open(filename, 'rb') as file_reference:
+        return file_reference.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+
+
+class DatasetLoader:
+    """
+    Load the CSV files of records as data frames of signed integers of 1 byte, with only the needed columns.
+    The first load parses the CSV file in chunks and stores the records in a binary file, see `BinaryRecords`.
+    The next loads map the binary file, while the size and the modification time of the CSV file are the same.
+    """
+    __cache_directory: str
+    __data_type: str
+    __chunk_size: int
+
+    def __init__(self, cache_directory: str = 'dataset-cache', data_type: str = 'int8',
+                 chunk_size: int = 1000000) -> None:
+        """
+        Construction method.
+
+        :type cache_directory: str
+        :param cache_directory: The directory of the binary files.
+
+        :type data_type: str
+        :param data_type: The NumPy type of the values. The deduplicated records have the column `count`,
+        which needs a bigger type, for example `int32`.
+
+        :type chunk_size: int
+        :param chunk_size: Number of rows parsed at the same time, it limits the memory of the first load.
+
+        :rtype: None
+        """
+        self.__cache_directory = cache_directory
+        self.__data_type = data_type
+        self.__chunk_size = chunk_size
+
+    @staticmethod
+    def get_columns(filename: str) -> list:
+        """
+        Return the names of the columns of the CSV file, only its first line is read.
+        The compressed files are decompressed while they are read.
+
+        :type filename: str
+        :param filename: The path and filename of the CSV file, it can be compressed with gzip.
+
+        :rtype: list[str]
+        :return: The columns.
+        """
+        open_file = gzip.open if is_gzip_file(filename) else open
+        with open_file(filename, 'rt') as file_reference:
+            return file_reference.readline().strip().split(',')
+
+    def get_cache_filename(self, filename: str, columns: list) -> str:
+        """
+        Return the filename of the binary file, it depends on the CSV file, the columns and the type.
+
+        :type filename: str
+        :param filename: The path and filename of the CSV file.
+
+        :type columns: list[str]
+        :param columns: The Columns Names which are loaded.
+
+        :rtype: str
+        :return: The filename, for example `dataset-cache/records-0123456789abcdef.bin` for `records.csv`.
+        """
+        key: str = sha256(dumps([abspath(filename), columns, self.__data_type]).encode()).hexdigest()[:16]
+        return join(self.__cache_directory, f'{splitext(basename(filename))[0]}-{key}.bin')
+
+    def load(self, filename: str, columns: list = None, drop_columns: list = None) -> DataFrame:
+        """
+        Return the records of the CSV file.
+
+        :type filename: str
+        :param filename: The path and filename of the CSV file.
+
+        :type columns: list[str]
+        :param columns: The Columns Names which are loaded, by default all of them.
+
+        :type drop_columns: list[str]
+        :param drop_columns: The Columns Names which are not loaded, for example the players of every turn.
+
+        :rtype: DataFrame
+        :return: The data frame with the records, mapped to the binary file. Its attribute `source` has the path,
+        the size and the modification time of the CSV file.
+        """
+        drop_columns = drop_columns or []
+        columns = [column for column in columns or self.get_columns(filename) if column not in drop_columns]
+        cache_filename: str = self.get_cache_filename(filename, columns)
+
+        information = stat(filename)
+        data_frame: DataFrame = None
+        if exists(cache_filename):
+            binary_records: BinaryRecords = BinaryRecords(cache_filename)
+            if binary_records.header.get('size') == information.st_size \
+                    and binary_records.header.get('modification_time') == information.st_mtime_ns:
+                data_frame = binary_records.get_data_frame()
+
+        if data_frame is None:
+            self.__store_cache(filename, columns, cache_filename, information.st_size, information.st_mtime_ns)
+            data_frame = BinaryRecords(cache_filename).get_data_frame()
+
+        # The source of the records identifies them without read them, see `split_data.get_fingerprint`.
+        data_frame.attrs['source'] = [abspath(filename), information.st_size, information.st_mtime_ns]
+        return data_frame
+
+    def __store_cache(self, filename: str, columns: list, cache_filename: str, size: int,
+                      modification_time: int) -> None:
+        """
+        Parse the CSV file in chunks and store its records in the binary file.
+        The binary file is replaced at the end, so an interrupted parse keeps the previous file.
+
+        :type filename: str
+        :param filename: The path and filename of the CSV file.
+
+        :type columns: list[str]
+        :param columns: The Columns Names which are stored.
+
+        :type cache_filename: str
+        :param cache_filename: The path and filename of the binary file.
+
+        :type size: int
+        :param size: The size of the CSV file, stored in the header.
+
+        :type modification_time: int
+        :param modification_time: The modification time of the CSV file in nanoseconds, stored in the header.
+
+        :rtype: None
+        """
+        makedirs(self.__cache_directory, exist_ok=True)
+        limits: iinfo = iinfo(self.__data_type)
+        # Pandas wraps the values out of the range of the parsed type, so the columns are parsed with the type of
+        # double size, `int16` for `int8`, and the range is checked before they are stored with the data type.
+        parse_type: str = f'int{min(limits.bits * 2, 64)}'
+        temporary_filename: str = f'{cache_filename}.tmp'
+        try:
+            with open(temporary_filename, 'wb') as file_reference:
+                file_reference.write(get_header(columns, self.__data_type, source=abspath(filename), size=size,
+                                                modification_time=modification_time))
+
+                chunk: DataFrame
+                for chunk in read_csv(filename, usecols=columns, chunksize=self.__chunk_size,
+                                      dtype={column: parse_type for column in columns},
+                                      compression='gzip' if is_gzip_file(filename) else None):
+                    values: ndarray = chunk[columns].to_numpy()
+                    if values.size and (values.min() < limits.min or values.max() > limits.max):
+                        raise ValueError(f'The file "{filename}" has values out of the type {self.__data_type}, '
+                                         f'use a bigger type.')
+
+                    file_reference.write(values.astype(self.__data_type).tobytes())
+        except BaseException:
+            remove(temporary_filename)
+            raise
+
+        replace(temporary_filename, cache_filename)
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Stream of the records in the files of the game generator, used for the training with data sets larger than the RAM.
+"""
+from glob import glob
+from hashlib import sha256
+from json import dumps
+
+from tensorflow import data, io, gather, cast, stack, one_hot, float32, int8, int32
+
+from core.binary_records import MAGIC, read_header
+from core.dataset_loader import DatasetLoader, is_gzip_file
+from core.split_data import get_fingerprint
+
+
+def get_filenames(files) -> list:
+    """
+    Return the filenames of a split, the patterns are expanded in order.
+
+    :type files: str | list[str]
+    :param files: A filename or a pattern, for example `resources/records-train-shard-*.csv`, or a list of them.
+
+    :rtype: list[str]
+    :return: The filenames.
+    """
+    patterns: list = [files] if isinstance(files, str) else list(files)
+    filenames: list = []
+    pattern: str
+    for pattern in patterns:
+        matches: list = sorted(glob(pattern))
+        if not matches:
+            raise ValueError(f'There are no files which match "{pattern}".')
+        filenames.extend(matches)
+
+    return filenames
+
+
+def is_binary_file(filename: str) -> bool:
+    """
+    Check if the file is a binary file of records, by its magic bytes.
+
+    :type filename: str
+    :param filename: The path and filename.
+
+    :rtype: bool
+    :return: True if it is a binary file of records.
+    """
+    with open(filename, 'rb') as file_reference:
+        return file_reference.read(len(MAGIC)) == MAGIC
+
+
+def read_columns(filename: str) -> tuple:
+    """
+    Read the columns of a file: the headers of the CSV file, or the columns of the header of the binary file.
+
+    :type filename: str
+    :param filename: The path and filename.
+
+    :rtype: tuple[list[str], int]
+    :return: The columns, and the offset of the records for the binary file or `None` for the CSV file.
+    """
+    if is_binary_file(filename):
+        header: dict
+        offset: int
+        header, offset = read_header(filename)
+        if header['dtype'] != 'int8':
+            raise ValueError(f'The file "{filename}" has records of type "{header["dtype"]}", only int8 is read.')
+        return header['columns'], offset
+
+    return DatasetLoader.get_columns(filename), None
+
+
+class FileStream:
+    """
+    Read the records of the CSV files or the binary files of the game generator, without load them in memory.
+    Every split has its own files, for example the shards of the workers or the files of `--splits`.
+    The files are read in parallel and interleaved, the lines are parsed by blocks, and the training split
+    is shuffled with a buffer of bounded size. The memory does not depend on the size of the files.
+    """
+    __splits: dict
+    __offsets: dict
+    __compressions: dict
+    __batch_size: int
+    __parse_size: int
+    __shuffle_buffer: int
+    __seed: int
+    __columns: list
+    __input_indexes: list
+    __output_index: int
+    __weight_index: int
+    __output_categories: int
+    __read_buffer: int
+    SPLITS: tuple = ('train', 'validation', 'test')
+
+    def __init__(self, splits: dict, output_feature: str, drop_columns: list = None, weight_feature: str = None,
+                 batch_size: int = 1024, shuffle_buffer: int = 100000, seed: int = 42, output_categories: int = 3,
+                 parse_size: int = 4096, read_buffer: int = 4 * 1024 * 1024) -> None:
+        """
+        Construction method.
+
+        :type splits: dict[str, str | list[str]]
+        :param splits: The files of every split: `train`, `validation` and `test`. Every value is a filename,
+        a pattern or a list of them. All the files must have the same columns.
+
+        :type output_feature: str
+        :param output_feature: The Column Name for the output feature.
+
+        :type drop_columns: list[str]
+        :param drop_columns: The Columns Names which are not used as input features, they are not parsed.
+
+        :type weight_feature: str
+        :param weight_feature: The Column Name used as sample weight, for example the `count` of the deduplicated
+        games. It is not an input feature.
+
+        :type batch_size: int
+        :param batch_size: Number of records in every batch.
+
+        :type shuffle_buffer: int
+        :param shuffle_buffer: Number of records in the buffer of the shuffle, only for the training split.
+        It bounds the memory, a bigger buffer mixes the records of more distant lines.
+
+        :type seed: int
+        :param seed: Seed of the order of the files and the shuffle. If it is `None` the order is not reproducible.
+
+        :type output_categories: int
+        :param output_categories: Number of categories of the output feature.
+
+        :type parse_size: int
+        :param parse_size: Number of lines parsed together, or number of binary records decoded together.
+
+        :type read_buffer: int
+        :param read_buffer: Size in bytes of the buffer which reads every file.
+
+        :rtype: None
+        """
+        unknown_splits: list = [split for split in splits if split not in self.SPLITS]
+        if unknown_splits:
+            raise ValueError(f'Unknown splits "{", ".join(unknown_splits)}", '
+                             f'the options are: {", ".join(self.SPLITS)}.')
+
+        self.__splits = {split: get_filenames(files) for split, files in splits.items()}
+        self.__offsets = {}
+        self.__compressions = {}
+        self.__batch_size = batch_size
+        self.__parse_size = parse_size
+        self.__shuffle_buffer = shuffle_buffer
+        self.__seed = seed
+        self.__output_categories = output_categories
+        self.__read_buffer = read_buffer
+
+        self.__columns = None
+        split: str
+        filenames: list
+        for split, filenames in self.__splits.items():
+            columns: list
+            columns, self.__offsets[split] = read_columns(filenames[0])
+            # The same check of gzip as `DatasetLoader`, by the suffix or the magic bytes.
+            compressed_files: list = [is_gzip_file(filename) for filename in filenames]
+            if any(compressed_files) and not all(compressed_files):
+                raise ValueError(f'The files of the split "{split}" are compressed and not compressed, '
+                                 f'they must be all compressed with gzip or none of them.')
+            self.__compressions[split] = 'GZIP' if compressed_files[0] else ''
+            if self.__columns is not None and columns != self.__columns:
+                raise ValueError(f'The files of the split "{split}" have different columns than the other splits.')
+            self.__columns = columns
+
+        drop_columns = drop_columns or []
+        self.__input_indexes = [
+            index for index, column in enumerate(self.__columns)
+            if column not in (output_feature, weight_feature) and column not in drop_columns
+        ]
+        self.__output_index = self.__columns.index(output_feature)
+        self.__weight_index = self.__columns.index(weight_feature) if weight_feature is not None else None
+
+    @property
+    def input_size(self) -> int:
+        """
+        Get the number of input features.
+
+        :rtype: int
+        :return: The number of input features.
+        """
+        return len(self.__input_indexes)
+
+    @property
+    def output_categories(self) -> int:
+        """
+        Get the number of categories of the output feature.
+
+        :rtype: int
+        :return: The number of categories.
+        """
+        return self.__output_categories
+
+    def get_filenames(self, split: str) -> list:
+        """
+        Return the files of a split.
+
+        :type split: str
+        :param split: The split: `train`, `validation` or `test`.
+
+        :rtype: list[str]
+        :return: The filenames.
+        """
+        if split not in self.__splits:
+            raise ValueError(f'Unknown split "{split}", the options are: {", ".join(self.__splits)}.')
+
+        return self.__splits[split]
+
+    def get_fingerprint(self) -> str:
+        """
+        Return the fingerprint of the stream: the fingerprints of the files of every split, the used columns,
+        the size of the batches and the shuffle.
+
+        :rtype: str
+        :return: The fingerprint in hexadecimal, or `None` if the stream is not reproducible without seed.
+        """
+        if self.__seed is None:
+            return None
+
+        files: dict = {split: [get_fingerprint(filename) for filename in filenames]
+                       for split, filenames in sorted(self.__splits.items())}
+        return sha256(dumps([files, self.__input_indexes, self.__output_index, self.__weight_index,
+                             self.__output_categories, self.__batch_size, self.__shuffle_buffer,
+                             self.__seed]).encode()).hexdigest()
+
+    def get_dataset(self, split: str = 'train', number_batches: int = None,
+                    convert_output_to_category: bool = True) -> data.Dataset:
+        """
+        Return the records of a split as a dataset of batches for Keras.
+        The files are read again in every pass, so the dataset never ends, like the stream of new games.
+
+        :type split: str
+        :param split: The split: `train`, `validation` or `test`. Only the training split is shuffled.
+
+        :type number_batches: int
+        :param number_batches: Number of batches. If it is `None`, the dataset never ends.
+
+        :type convert_output_to_category: bool
+        :param convert_output_to_category: If true, it converts the output feature to one-hot categories.
+
+        :rtype: tensorflow.data.Dataset
+        :return: The dataset with the input features, the output feature and the sample weights if any.
+        """
+        filenames: list = self.get_filenames(split)
+        shuffle: bool = split == 'train'
+        files: data.Dataset = data.Dataset.from_tensor_slices(filenames)
+        if shuffle:
+            files = files.shuffle(len(filenames), seed=self.__seed, reshuffle_each_iteration=True)
+
+        # Every file is read and parsed by its own reader, the blocks of the files are interleaved.
+        blocks: data.Dataset = files.interleave(
+            lambda filename: self.__read_blocks(filename, split),
+            cycle_length=min(len(filenames), 8),
+            num_parallel_calls=data.AUTOTUNE,
+        )
+
+        records: data.Dataset = blocks.unbatch()
+        if shuffle:
+            records = records.shuffle(self.__shuffle_buffer, seed=self.__seed, reshuffle_each_iteration=True)
+
+        dataset: data.Dataset = records.repeat().batch(self.__batch_size, drop_remainder=True)
+        if number_batches is not None:
+            dataset = dataset.take(number_batches)
+
+        if convert_output_to_category:
+            dataset = dataset.map(
+                lambda features, output, *weights: (features, one_hot(output, self.__output_categories), *weights),
+                num_parallel_calls=data.AUTOTUNE,
+            )
+
+        return dataset.prefetch(data.AUTOTUNE)
+
+    def __read_blocks(self, filename, split: str) -> data.Dataset:
+        """
+        Return the dataset of the blocks of records of a file, already split in features.
+        All the files of a split have the same format as its first file.
+
+        :type filename: tensorflow.Tensor
+        :param filename: The path and filename, as a tensor of the dataset of files.
+
+        :type split: str
+        :param split: The split of the file.
+
+        :rtype: tensorflow.data.Dataset
+        :return: The blocks of the input features, the output feature and the sample weights if any.
+        """
+        if self.__offsets[split] is not None:
+            # The binary files of the game generator with the same columns have the same header.
+            records: data.Dataset = data.FixedLengthRecordDataset(
+                filename, record_bytes=len(self.__columns), header_bytes=self.__offsets[split],
+                buffer_size=self.__read_buffer,
+            ).batch(self.__parse_size)
+            return records.map(self.__decode_binary, num_parallel_calls=data.AUTOTUNE)
+
+        lines: data.Dataset = data.TextLineDataset(
+            filename, compression_type=self.__compressions[split], buffer_size=self.__read_buffer,
+        ).skip(1).batch(self.__parse_size)
+        return lines.map(self.__decode_csv, num_parallel_calls=data.AUTOTUNE)
+
+    def __decode_binary(self, records) -> tuple:
+        """
+        Decode a block of binary records, every record is a row of signed integers of 1 byte.
+
+        :type records: tensorflow.Tensor
+        :param records: The records as strings of bytes.
+
+        :rtype: tuple[tensorflow.Tensor]
+        :return: The input features, the output feature and the sample weights if any.
+        """
+        values = io.decode_raw(records, int8)
+        return self.__split_features(lambda index: gather(values, index, axis=1))
+
+    def __decode_csv(self, lines) -> tuple:
+        """
+        Decode a block of lines of the CSV file, only the used columns are parsed.
+
+        :type lines: tensorflow.Tensor
+        :param lines: The lines.
+
+        :rtype: tuple[tensorflow.Tensor]
+        :return: The input features, the output feature and the sample weights if any.
+        """
+        indexes: list = self.__get_used_indexes()
+        values: list = io.decode_csv(lines, record_defaults=[[0]] * len(indexes), select_cols=indexes)
+        positions: dict = {index: position for position, index in enumerate(indexes)}
+
+        def get_column(index):
+            if isinstance(index, list):
+                return stack([values[positions[value]] for value in index], axis=1)
+            return values[positions[index]]
+
+        return self.__split_features(get_column)
+
+    def __get_used_indexes(self) -> list:
+        """
+        Return the indexes of the columns which are used, in order.
+
+        :rtype: list[int]
+        :return: The indexes of the input features, the output feature and the sample weight.
+        """
+        indexes: list = self.__input_indexes + [self.__output_index]
+        if self.__weight_index is not None:
+            indexes.append(self.__weight_index)
+
+        return sorted(indexes)
+
+    def __split_features(self, get_column) -> tuple:
+        """
+        Split a block of records in the input features, the output feature and the sample weights.
+
+        :type get_column: Callable
+        :param get_column: Function which returns the values of a column index, or of a list of column indexes.
+
+        :rtype: tuple[tensorflow.Tensor]
+        :return: The input features as floats, the output feature as integers and the sample weights as floats.
+        """
+        features: tuple = (
+            cast(get_column(self.__input_indexes), float32),
+            cast(get_column(self.__output_index), int32),
+        )
+        if self.__weight_index is not None:
+            features += (cast(get_column(self.__weight_index), float32),)
+
+        return features
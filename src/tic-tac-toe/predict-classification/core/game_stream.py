@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Stream of new games played by the game generator, used for the training without CSV files.
+"""
+import sys
+from importlib import import_module
+from importlib.util import module_from_spec, spec_from_file_location
+from os.path import abspath, dirname, join
+from threading import Lock
+from types import ModuleType
+from typing import Iterator
+
+from numpy import ndarray, random, float32, int32
+from tensorflow import TensorSpec, data, one_hot
+
+GAME_GENERATOR_DIRECTORY: str = join(dirname(dirname(dirname(abspath(__file__)))), 'game-generator')
+
+# Name of the package `core` of the game generator in this application, which has its own package `core`.
+GAME_GENERATOR_PACKAGE: str = 'game_generator_core'
+
+GAME_GENERATOR_LOCK: Lock = Lock()
+
+
+def import_game_module(name: str, directory: str = GAME_GENERATOR_DIRECTORY) -> ModuleType:
+    """
+    Import a module of the package `core` of the game generator, for example `stream` or `board`.
+    The package `core` of the game generator is loaded with the name `game_generator_core`, its modules import
+    each other with relative imports, so the package `core` of this application is never replaced.
+
+    :type name: str
+    :param name: The name of the module in the package.
+
+    :type directory: str
+    :param directory: The directory of the game generator.
+
+    :rtype: ModuleType
+    :return: The module.
+    """
+    package_directory: str = join(abspath(directory), 'core')
+    with GAME_GENERATOR_LOCK:
+        package: ModuleType = sys.modules.get(GAME_GENERATOR_PACKAGE)
+        if package is None:
+            spec = spec_from_file_location(GAME_GENERATOR_PACKAGE, join(package_directory, '__init__.py'),
+                                           submodule_search_locations=[package_directory])
+            package = module_from_spec(spec)
+            sys.modules[GAME_GENERATOR_PACKAGE] = package
+            try:
+                spec.loader.exec_module(package)
+            except BaseException:
+                del sys.modules[GAME_GENERATOR_PACKAGE]
+                raise
+        elif list(package.__path__) != [package_directory]:
+            raise ValueError(f'The game generator is already imported from "{package.__path__[0]}", '
+                             f'it cannot be imported from "{package_directory}".')
+
+    return import_module(f'{GAME_GENERATOR_PACKAGE}.{name}')
+
+
+def import_game_stream(directory: str = GAME_GENERATOR_DIRECTORY) -> ModuleType:
+    """
+    Import the module `core.stream` of the game generator.
+
+    :type directory: str
+    :param directory: The directory of the game generator.
+
+    :rtype: ModuleType
+    :return: The module with the stream of games.
+    """
+    return import_game_module('stream', directory)
+
+
+class GameStream:
+    """
+    Generate new games in memory, for the training, validation and test splits.
+    Every split has its own random stream, spawned from the same seed.
+    """
+    __stream_module: ModuleType
+    __batch_size: int
+    __split_seeds: dict
+    __policies: tuple
+    __board: object
+    __output_feature: str
+    __input_indexes: list
+    __output_index: int
+    __output_categories: int
+    SPLITS: tuple = ('train', 'validation', 'test')
+
+    def __init__(self, output_feature: str, drop_columns: list = None, batch_size: int = 1024, seed: int = None,
+                 policies: tuple = None, output_categories: int = 3,
+                 generator_directory: str = GAME_GENERATOR_DIRECTORY, board_size: tuple = (3, 3, 3)) -> None:
+        """
+        Construction method.
+
+        :type output_feature: str
+        :param output_feature: The Column Name for the output feature.
+
+        :type drop_columns: list[str]
+        :param drop_columns: The Columns Names which are not used as input features.
+
+        :type batch_size: int
+        :param batch_size: Number of games played in every batch.
+
+        :type seed: int
+        :param seed: Seed for the random movements. If it is `None` the results are not reproducible.
+
+        :type policies: tuple[str, str]
+        :param policies: The names of the policies of the player 1 and the player 2, by default random.
+
+        :type output_categories: int
+        :param output_categories: Number of categories of the output feature.
+
+        :type generator_directory: str
+        :param generator_directory: The directory of the game generator.
+
+        :type board_size: tuple[int, int, int]
+        :param board_size: The rows, the columns and the line length of the board. The number of input
+        features depends on the board, the boards different than 3x3 are only played with random policies.
+
+        :rtype: None
+        """
+        self.__stream_module = import_game_stream(generator_directory)
+        self.__batch_size = batch_size
+        self.__split_seeds = dict(zip(self.SPLITS, random.SeedSequence(seed).spawn(len(self.SPLITS))))
+        self.__policies = policies
+        self.__board = import_game_module('board', generator_directory).get_board(*board_size)
+        self.__output_feature = output_feature
+        self.__output_categories = output_categories
+
+        columns: list = self.__stream_module.get_columns(self.__board)
+        drop_columns = drop_columns or []
+        self.__input_indexes = [
+            index for index, column in enumerate(columns)
+            if column != output_feature and column not in drop_columns
+        ]
+        self.__output_index = columns.index(output_feature)
+
+    @property
+    def input_size(self) -> int:
+        """
+        Get the number of input features.
+
+        :rtype: int
+        :return: The number of input features.
+        """
+        return len(self.__input_indexes)
+
+    @property
+    def output_categories(self) -> int:
+        """
+        Get the number of categories of the output feature.
+
+        :rtype: int
+        :return: The number of categories.
+        """
+        return self.__output_categories
+
+    def iter_batches(self, split: str = 'train', number_batches: int = None) -> Iterator[tuple]:
+        """
+        Yield batches of new games, split in input and output features.
+
+        :type split: str
+        :param split: The split which defines the random stream: `train`, `validation` or `test`.
+
+        :type number_batches: int
+        :param number_batches: Number of batches. If it is `None`, the stream never ends.
+
+        :rtype: Iterator[tuple[ndarray, ndarray]]
+        :return: The input features as floats and the output feature as integers.
+        """
+        if split not in self.__split_seeds:
+            raise ValueError(f'Unknown split "{split}", the options are: {", ".join(self.SPLITS)}.')
+
+        # The seed sequence is copied, so every call starts the same stream.
+        seed_sequence: random.SeedSequence = random.SeedSequence(
+            self.__split_seeds[split].entropy, spawn_key=self.__split_seeds[split].spawn_key,
+        )
+        games: ndarray
+        for games in self.__stream_module.iter_game_batches(self.__batch_size, seed_sequence, number_batches,
+                                                            policies=self.__policies, board=self.__board):
+            yield games[:, self.__input_indexes].astype(float32), games[:, self.__output_index].astype(int32)
+
+    def get_dataset(self, split: str = 'train', number_batches: int = None,
+                    convert_output_to_category: bool = True) -> data.Dataset:
+        """
+        Return the stream as a dataset of batches for Keras.
+
+        :type split: str
+        :param split: The split which defines the random stream: `train`, `validation` or `test`.
+
+        :type number_batches: int
+        :param number_batches: Number of batches. If it is `None`, the dataset never ends.
+
+        :type convert_output_to_category: bool
+        :param convert_output_to_category: If true, it converts the output feature to one-hot categories.
+
+        :rtype: tensorflow.data.Dataset
+        :return: The dataset with the input and output features.
+        """
+        dataset: data.Dataset = data.Dataset.from_generator(
+            lambda: self.iter_batches(split, number_batches),
+            output_signature=(
+                TensorSpec(shape=(None, self.input_size), dtype=float32),
+                TensorSpec(shape=(None,), dtype=int32),
+            ),
+        )
+
+        if convert_output_to_category:
+            dataset = dataset.map(lambda features, output: (features, one_hot(output, self.__output_categories)))
+
+        return dataset.prefetch(data.AUTOTUNE)
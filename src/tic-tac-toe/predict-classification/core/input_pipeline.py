@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Input pipeline of a split for Keras, the records are converted to tensors only one time.
+"""
+from numpy import ndarray, asarray, float32
+from pandas import DataFrame
+from tensorflow import Tensor, convert_to_tensor, data, gather
+
+
+class InputPipeline:
+    """
+    Convert the input features, the output feature and the sample weights of a split to tensors of floats,
+    and build the datasets of batches for `fit` and `evaluate`.
+    The datasets are kept by batch size, so every trial of the tuner with the same batch size reuses them.
+    The shuffle permutes the indexes of the records in every epoch, and the batches are gathered from the tensors.
+    """
+    __features: Tensor
+    __labels: Tensor
+    __weights: Tensor
+    __size: int
+    __input_size: int
+    __output_categories: int
+    __shuffle: bool
+    __seed: int
+    __datasets: dict
+
+    def __init__(self, x, y, sample_weight: ndarray = None, shuffle: bool = True, seed: int = 42) -> None:
+        """
+        Construction method.
+
+        :type x: DataFrame | ndarray
+        :param x: The input features.
+
+        :type y: ndarray
+        :param y: The output feature, for example the categories of the winner. The dense labels are converted
+        to floats, the sparse labels keep their integer type.
+
+        :type sample_weight: ndarray
+        :param sample_weight: The weight of every record. If it is `None`, the records have the same weight.
+
+        :type shuffle: bool
+        :param shuffle: If true, the records are shuffled in every epoch. The validation and the test splits
+        do not need it.
+
+        :type seed: int
+        :param seed: Seed of the shuffle. If it is `None` the order is not reproducible.
+
+        :rtype: None
+        """
+        features: ndarray = x.to_numpy(dtype=float32) if isinstance(x, DataFrame) else asarray(x, dtype=float32)
+        self.__features = convert_to_tensor(features)
+        labels: ndarray = asarray(y)
+        if labels.ndim == 1 and labels.dtype.kind in 'iu':
+            self.__output_categories = int(labels.max()) + 1 if len(labels) else 1
+        else:
+            self.__output_categories = labels.shape[1] if labels.ndim > 1 else 1
+            labels = labels.astype(float32, copy=False)
+        self.__labels = convert_to_tensor(labels)
+        self.__weights = None
+        if sample_weight is not None:
+            self.__weights = convert_to_tensor(asarray(sample_weight, dtype=float32))
+        self.__size = features.shape[0]
+        self.__input_size = features.shape[1]
+        self.__shuffle = shuffle
+        self.__seed = seed
+        self.__datasets = {}
+
+    def __len__(self) -> int:
+        return self.__size
+
+    @property
+    def input_size(self) -> int:
+        """
+        Get the number of input features.
+
+        :rtype: int
+        :return: The number of input features.
+        """
+        return self.__input_size
+
+    @property
+    def output_categories(self) -> int:
+        """
+        Get the number of categories of the output feature: the columns of the dense labels, or the maximum plus one
+        of the sparse labels. It is 1 if the output feature is not categorical.
+
+        :rtype: int
+        :return: The number of categories.
+        """
+        return self.__output_categories
+
+    def get_dataset(self, batch_size: int, shuffle: bool = None) -> data.Dataset:
+        """
+        Return the dataset of batches: the input features, the output feature and the sample weights if any.
+
+        :type batch_size: int
+        :param batch_size: Number of records in every batch.
+
+        :type shuffle: bool
+        :param shuffle: If true, the records are shuffled in every epoch. By default, the option of the pipeline.
+
+        :rtype: tensorflow.data.Dataset
+        :return: The dataset.
+        """
+        shuffle = self.__shuffle if shuffle is None else shuffle
+        key: tuple = (batch_size, shuffle)
+        if key not in self.__datasets:
+            tensors: tuple = (self.__features, self.__labels)
+            if self.__weights is not None:
+                tensors += (self.__weights,)
+
+            if shuffle:
+                # Only the indexes pass through the shuffle buffer, the records are gathered by batch.
+                dataset: data.Dataset = data.Dataset.range(self.__size) \
+                    .shuffle(self.__size, seed=self.__seed, reshuffle_each_iteration=True) \
+                    .batch(batch_size) \
+                    .map(lambda indexes: tuple(gather(tensor, indexes) for tensor in tensors),
+                         num_parallel_calls=data.AUTOTUNE)
+            else:
+                dataset: data.Dataset = data.Dataset.from_tensor_slices(tensors).batch(batch_size).cache()
+
+            self.__datasets[key] = dataset.prefetch(data.AUTOTUNE)
+
+        return self.__datasets[key]
@@ -3,28 +3,350 @@
 """
 Scalable hyperparameter optimization to search the best parameters for the model.
 """
-from os.path import isdir
-from shutil import rmtree
+from hashlib import sha256
+from itertools import product
+from json import dumps
+from math import ceil
+from os import environ
 
-from keras import Sequential, callbacks
+from keras import Sequential
 from keras import activations
-from keras import losses
 from keras import metrics
 from keras import layers
 from keras import optimizers
-from keras_tuner import HyperModel, Hyperband, Objective, HyperParameters, HyperParameter
+from keras_tuner import HyperModel, Objective, HyperParameters, HyperParameter, Oracle, Tuner
+from keras_tuner.engine.trial import TrialStatus
+from keras_tuner.engine.tuner_utils import convert_to_metrics_dict
 from numpy import ndarray
 from pandas import DataFrame
+from tensorflow import data as tf_data
 
+from core.file_stream import FileStream
+from core.game_stream import GameStream
+from core.input_pipeline import InputPipeline
+from core.label_mode import check_label_mode, get_loss, get_metric_name
 from core.split_data import SplitData
+from core.telemetry import Telemetry
+from core.trial_cache import TrialCache, TRIAL_CACHE_DIRECTORY, clean_tuner_directory
+
+
+def is_distributed() -> bool:
+    """
+    Check if this process is the chief or a worker of a distributed search, see `ParallelSearch`.
+
+    :rtype: bool
+    :return: True if the environment has the oracle of the chief.
+    """
+    return 'KERASTUNER_ORACLE_IP' in environ
+
+
+def is_chief() -> bool:
+    """
+    Check if this process runs the oracle: it is the chief of a distributed search, or a search of one process.
+
+    :rtype: bool
+    :return: True if this process has the results of all the trials.
+    """
+    return not is_distributed() or environ.get('KERASTUNER_TUNER_ID') == 'chief'
+
+
+class GridOracle(Oracle):
+    """
+    Oracle which enumerates every combination of a finite space one time, in a deterministic order.
+    The space is only of `Choice`, `Boolean`, `Fixed` or hyperparameters with step, so no combination is sampled
+    again and there are no collisions.
+
+    With a halving factor, the combinations are trained with successive halving: the first round trains all of them
+    with a small budget of epochs, and every next round continues the training of the best `1 / factor` of the
+    previous round, with `factor` times more epochs, until `max_epochs`.
+    The trials have the same values `tuner/epochs`, `tuner/initial_epoch`, `tuner/bracket` and `tuner/round` as
+    the trials of Hyperband.
+    """
+    __max_epochs: int
+    __halving_factor: int
+    __min_epochs: int
+    __combinations: list
+    __next_combination: int
+    __rounds: list
+
+    def __init__(self, objective, max_epochs: int, halving_factor: int = None, min_epochs: int = 1,
+                 **kwargs) -> None:
+        """
+        Construction method.
+
+        :type objective: Objective | list[Objective] | str
+        :param objective: The objective of the search.
+
+        :type max_epochs: int
+        :param max_epochs: Number of epochs of the combinations of the last round.
+
+        :type halving_factor: int
+        :param halving_factor: Reduction of the combinations in every round of the successive halving.
+        If it is `None`, every combination is trained one time with `max_epochs`.
+
+        :type min_epochs: int
+        :param min_epochs: Minimum number of epochs of the first round.
+
+        :param kwargs: Other arguments of the oracle, for example `seed`.
+
+        :rtype: None
+        """
+        super().__init__(objective=objective, **kwargs)
+        if halving_factor is not None and halving_factor < 2:
+            raise ValueError(f'The halving factor must be greater than 1, it is {halving_factor}.')
+
+        self.__max_epochs = max_epochs
+        self.__halving_factor = halving_factor
+        self.__min_epochs = min_epochs
+        self.__combinations = None
+        self.__next_combination = 0
+        self.__rounds = []
+
+    def get_combinations(self) -> list:
+        """
+        Return all the combinations of the values of the space, in the order of the space and of the values.
+
+        :rtype: list[dict]
+        :return: The values of every combination.
+        """
+        hyperparameter: HyperParameter
+        names: list = []
+        values: list = []
+        for hyperparameter in self.hyperparameters.space:
+            if getattr(hyperparameter, 'step', 1) is None:
+                raise ValueError(f'The hyperparameter "{hyperparameter.name}" has not a finite number of values, '
+                                 f'use `Choice` or set its step.')
+            names.append(hyperparameter.name)
+            values.append(list(hyperparameter.values))
+
+        return [dict(zip(names, combination)) for combination in product(*values)]
+
+    def populate_space(self, trial_id: str) -> dict:
+        """
+        Return the values of the next trial: the next combination of the first round, or the next best trial of
+        the previous round. The next round waits until all the trials of the previous round finish.
+
+        :type trial_id: str
+        :param trial_id: The identifier of the new trial.
+
+        :rtype: dict
+        :return: The status of the trial and its values.
+        """
+        if self.__combinations is None:
+            self.__combinations = self.get_combinations()
+            self.__rounds = [[] for _ in range(self.__get_number_rounds())]
+
+        if self.__next_combination < len(self.__combinations):
+            values: dict = dict(self.__combinations[self.__next_combination])
+            self.__next_combination += 1
+            self.__rounds[0].append({'past_id': None, 'id': trial_id})
+            return {'status': TrialStatus.RUNNING, 'values': self.__add_budget(values, 0)}
+
+        round_number: int
+        for round_number in range(1, len(self.__rounds)):
+            round_trials: list = self.__rounds[round_number]
+            if len(round_trials) >= self.__get_size(round_number):
+                continue
+
+            past_trials: list = [self.trials[information['id']] for information in self.__rounds[round_number - 1]]
+            if any(trial.status not in (TrialStatus.COMPLETED, TrialStatus.FAILED) for trial in past_trials):
+                return {'status': TrialStatus.IDLE, 'values': None}
+
+            selected_ids: list = [information['past_id'] for information in round_trials]
+            candidates: list = [trial for trial in past_trials
+                                if trial.status == TrialStatus.COMPLETED and trial.trial_id not in selected_ids]
+            if not candidates:
+                # The failed trials of the previous round are not replaced.
+                continue
+
+            best_trial = sorted(candidates, key=lambda trial: trial.score,
+                                reverse=self.objective.direction == 'max')[0]
+            values: dict = {name: value for name, value in best_trial.hyperparameters.values.items()
+                            if not name.startswith('tuner/')}
+            values['tuner/trial_id'] = best_trial.trial_id
+            round_trials.append({'past_id': best_trial.trial_id, 'id': trial_id})
+            return {'status': TrialStatus.RUNNING, 'values': self.__add_budget(values, round_number)}
+
+        if self.ongoing_trials:
+            return {'status': TrialStatus.IDLE, 'values': None}
+
+        return {'status': TrialStatus.STOPPED, 'values': None}
+
+    def get_state(self) -> dict:
+        state: dict = super().get_state()
+        state.update(
+            grid_combinations=self.__combinations,
+            grid_next_combination=self.__next_combination,
+            grid_rounds=self.__rounds,
+        )
+        return state
+
+    def set_state(self, state: dict) -> None:
+        super().set_state(state)
+        self.__combinations = state['grid_combinations']
+        self.__next_combination = state['grid_next_combination']
+        self.__rounds = state['grid_rounds']
+
+    def _compute_values_hash(self, values: dict) -> str:
+        # The budget is not part of the combination, like in Hyperband.
+        return super()._compute_values_hash({name: value for name, value in values.items()
+                                             if not name.startswith('tuner/')})
+
+    def __get_number_rounds(self) -> int:
+        """
+        Return the number of rounds of the successive halving: the epochs of the first round are at least
+        `min_epochs`, and the last round has more than one combination only if the epochs do not allow more rounds.
+
+        :rtype: int
+        :return: The number of rounds, 1 without halving factor.
+        """
+        if self.__halving_factor is None:
+            return 1
+
+        rounds: int = 1
+        while self.__max_epochs / self.__halving_factor ** rounds >= self.__min_epochs \
+                and len(self.__combinations) / self.__halving_factor ** rounds > 1:
+            rounds += 1
+
+        return rounds
+
+    def __get_size(self, round_number: int) -> int:
+        """
+        Return the number of trials of a round.
+
+        :type round_number: int
+        :param round_number: The round, 0 is the first one.
+
+        :rtype: int
+        :return: The number of trials.
+        """
+        if round_number == 0:
+            return len(self.__combinations)
+
+        return max(1, ceil(len(self.__combinations) / self.__halving_factor ** round_number))
+
+    def __add_budget(self, values: dict, round_number: int) -> dict:
+        """
+        Add the budget of epochs of the round to the values of a trial, with the names of Hyperband.
+
+        :type values: dict
+        :param values: The values of the combination.
+
+        :type round_number: int
+        :param round_number: The round of the trial.
+
+        :rtype: dict
+        :return: The values.
+        """
+        values['tuner/epochs'] = self.__get_epochs(round_number)
+        values['tuner/initial_epoch'] = self.__get_epochs(round_number - 1) if round_number > 0 else 0
+        values['tuner/bracket'] = 0
+        values['tuner/round'] = round_number
+        return values
+
+    def __get_epochs(self, round_number: int) -> int:
+        """
+        Return the cumulative epochs of the trials of a round.
+
+        :type round_number: int
+        :param round_number: The round.
+
+        :rtype: int
+        :return: The epochs, `max_epochs` for the last round.
+        """
+        last_round: int = len(self.__rounds) - 1
+        if round_number == last_round:
+            return self.__max_epochs
+
+        return max(self.__min_epochs, ceil(self.__max_epochs / self.__halving_factor ** (last_round - round_number)))
+
+
+class GridTuner(Tuner):
+    """
+    Tuner of the `GridOracle`, the trials continue the training of the previous round like in Hyperband.
+    The completed trials are stored in the trial cache, and the trials which are in the cache are not trained.
+    """
+    __trial_cache: TrialCache
+
+    def __init__(self, hypermodel: HyperModel, objective, max_epochs: int, halving_factor: int = None,
+                 min_epochs: int = 1, seed: int = None, trial_cache: TrialCache = None, **kwargs) -> None:
+        """
+        Construction method.
+
+        :type hypermodel: HyperModel
+        :param hypermodel: The model of the search.
+
+        :type objective: Objective | list[Objective] | str
+        :param objective: The objective of the search.
+
+        :type max_epochs: int
+        :param max_epochs: Number of epochs of the combinations of the last round.
+
+        :type halving_factor: int
+        :param halving_factor: Reduction of the combinations in every round of the successive halving.
+        If it is `None`, every combination is trained one time with `max_epochs`.
+
+        :type min_epochs: int
+        :param min_epochs: Minimum number of epochs of the first round.
+
+        :type seed: int
+        :param seed: Seed of the oracle.
+
+        :type trial_cache: TrialCache
+        :param trial_cache: The cache of the completed trials. By default, all the trials are trained.
+
+        :param kwargs: Other arguments of the tuner, for example `directory`.
+
+        :rtype: None
+        """
+        oracle: GridOracle = GridOracle(objective, max_epochs, halving_factor=halving_factor, min_epochs=min_epochs,
+                                        seed=seed)
+        self.__trial_cache = trial_cache if trial_cache is not None else TrialCache()
+        super().__init__(oracle=oracle, hypermodel=hypermodel, **kwargs)
+
+    def run_trial(self, trial, *fit_args, **fit_kwargs):
+        values: dict = trial.hyperparameters.values
+        checkpoint: str = self._get_checkpoint_fname(trial.trial_id)
+        metrics: dict = self.__trial_cache.restore(values, checkpoint)
+        if metrics is not None:
+            print(f'Trial {trial.trial_id} restored from the trial cache.')
+            return metrics
+
+        fit_kwargs['epochs'] = values['tuner/epochs']
+        fit_kwargs['initial_epoch'] = values['tuner/initial_epoch']
+        results = super().run_trial(trial, *fit_args, **fit_kwargs)
+        self.__trial_cache.store(values, convert_to_metrics_dict(results, self.oracle.objective), checkpoint)
+
+        return results
+
+    def _build_hypermodel(self, hp: HyperParameters):
+        model = super()._build_hypermodel(hp)
+        if 'tuner/trial_id' in hp.values:
+            # Continue the training of the trial of the previous round.
+            model.load_weights(self._get_checkpoint_fname(hp.values['tuner/trial_id']))
+
+        return model
 
 
 class GeneralHyperModel(HyperModel):
     __output_layer_units: int
+    __label_mode: str
 
-    def __init__(self, output_layer_units: int):
+    def __init__(self, output_layer_units: int, label_mode: str = 'sparse'):
+        """
+        Construction method.
+
+        :type output_layer_units: int
+        :param output_layer_units: Number of categories of the output feature.
+
+        :type label_mode: str
+        :param label_mode: The labels of the output feature: `sparse` integers or `dense` one-hot categories.
+        The loss and the metrics depend on it.
+        """
         super().__init__()
+        check_label_mode(label_mode)
         self.__output_layer_units = output_layer_units
+        self.__label_mode = label_mode
 
     def build(self, hp: HyperParameters) -> Sequential:
         # Total of combinations = 3*3*2*2 = 36
@@ -55,41 +377,78 @@ class GeneralHyperModel(HyperModel):
                 learning_rate=hp_learning_rate,
                 # amsgrad=hp_amsgrad,
             ),
-            loss=losses.CategoricalCrossentropy(),
-            metrics=[
-                metrics.Accuracy(),
-                metrics.CategoricalAccuracy(),
-                # metrics.TopKCategoricalAccuracy(),
-                metrics.CategoricalCrossentropy(),
-                # metrics.KLDivergence(),
-                # metrics.Poisson(),
-                # metrics.MeanSquaredError(),
-                # metrics.RootMeanSquaredError(),
-                # metrics.MeanAbsoluteError(),
-                # metrics.MeanAbsolutePercentageError(),
-                # metrics.MeanSquaredLogarithmicError(),
-                # metrics.CosineSimilarity(),
-                # metrics.LogCoshError(),
-                metrics.Precision(),
-                # metrics.AUC(),
-                # metrics.Recall(),
-                # metrics.TruePositives(),
-                # metrics.TrueNegatives(),
-                # metrics.FalsePositives(),
-                # metrics.FalseNegatives(),
-                # metrics.PrecisionAtRecall(recall=0.8),
-                # metrics.SensitivityAtSpecificity(0.8),
-                # metrics.SpecificityAtSensitivity(0.8),
-                # metrics.Hinge(),
-                # metrics.SquaredHinge(),
-                # metrics.CategoricalHinge(),
-            ],
+            loss=get_loss(self.__label_mode),
+            metrics=self.__get_metrics(),
         )
 
         return model
 
+    def __get_metrics(self) -> list:
+        """
+        Return the metrics of the label mode.
+
+        :rtype: list[keras.metrics.Metric]
+        :return: The metrics.
+        """
+        if self.__label_mode == 'sparse':
+            return [
+                metrics.SparseCategoricalAccuracy(),
+                # metrics.SparseTopKCategoricalAccuracy(),
+                metrics.SparseCategoricalCrossentropy(),
+            ]
+
+        return [
+            metrics.Accuracy(),
+            metrics.CategoricalAccuracy(),
+            # metrics.TopKCategoricalAccuracy(),
+            metrics.CategoricalCrossentropy(),
+            # metrics.KLDivergence(),
+            # metrics.Poisson(),
+            # metrics.MeanSquaredError(),
+            # metrics.RootMeanSquaredError(),
+            # metrics.MeanAbsoluteError(),
+            # metrics.MeanAbsolutePercentageError(),
+            # metrics.MeanSquaredLogarithmicError(),
+            # metrics.CosineSimilarity(),
+            # metrics.LogCoshError(),
+            metrics.Precision(),
+            # metrics.AUC(),
+            # metrics.Recall(),
+            # metrics.TruePositives(),
+            # metrics.TrueNegatives(),
+            # metrics.FalsePositives(),
+            # metrics.FalseNegatives(),
+            # metrics.PrecisionAtRecall(recall=0.8),
+            # metrics.SensitivityAtSpecificity(0.8),
+            # metrics.SpecificityAtSensitivity(0.8),
+            # metrics.Hinge(),
+            # metrics.SquaredHinge(),
+            # metrics.CategoricalHinge(),
+        ]
+
     def fit(self, hp: HyperParameters, model: Sequential, *args, **kwargs):
         batch_size = hp.get('batch_size')
+        if args and isinstance(args[0], InputPipeline):
+            # The records are already tensors, the datasets of every batch size are shared by the trials.
+            validation_data = kwargs.pop('validation_data', None)
+            if isinstance(validation_data, InputPipeline):
+                validation_data = validation_data.get_dataset(batch_size)
+            return model.fit(
+                args[0].get_dataset(batch_size),
+                *args[1:],
+                validation_data=validation_data,
+                **kwargs,
+            )
+
+        if args and isinstance(args[0], tf_data.Dataset):
+            # The datasets are already in batches, they are batched again with the size of the trial.
+            dataset: tf_data.Dataset = args[0].unbatch().batch(batch_size)
+            return model.fit(
+                dataset,
+                *args[1:],
+                **kwargs,
+            )
+
         return model.fit(
             *args,
             batch_size=batch_size,
@@ -101,79 +460,182 @@ class KerasTunerHyper:
     """
     Search the best parameters for the model.
     """
-    __tuner: Hyperband
+    __tuner: GridTuner
     __data: DataFrame
-    __train_set_x: DataFrame
-    __train_set_y: ndarray
-    __validation_set_x: DataFrame
-    __validation_set_y: ndarray
+    __game_stream: GameStream
+    __output_categories: int
+    __steps_per_epoch: int
+    __validation_steps: int
+    __train_pipeline: InputPipeline
+    __validation_pipeline: InputPipeline
     __test_set_x: DataFrame
     __test_set_y: ndarray
+    __weight_feature: str
     __train_size: float
     __max_epochs: int
+    __halving_factor: int
     __output_feature: str
+    __label_mode: str
+    __telemetry: Telemetry
+    __data_fingerprint: str
+    trial_cache: TrialCache
     tuner_directory: str
     tuner_best_model_result_directory: str
 
     def __init__(self, data: DataFrame, output_feature: str, fit_epochs: int = 40,
-                 train_size: float = 0.98, tuner_directory: str = 'keras-tuner-trials') -> None:
+                 train_size: float = 0.98, tuner_directory: str = 'keras-tuner-trials',
+                 steps_per_epoch: int = 1000, validation_steps: int = 20, weight_feature: str = None,
+                 label_mode: str = 'sparse', telemetry: Telemetry = None, halving_factor: int = 3,
+                 use_trial_cache: bool = True, output_categories: int = None) -> None:
         """
         Construction method.
+
+        :type data: DataFrame | GameStream | FileStream
+        :param data: The records, or the stream of new games or of the records in files, which replaces the training
+        and validation sets. It is `None` for the chief of a distributed search, which only runs the oracle.
+
+        :type steps_per_epoch: int
+        :param steps_per_epoch: Number of batches in every epoch, only for the streams.
+
+        :type validation_steps: int
+        :param validation_steps: Number of batches for the validation, only for the streams.
+
+        :type weight_feature: str
+        :param weight_feature: The Column Name used as sample weight, for example the `count` of the deduplicated
+        games. Only for the records.
+
+        :type label_mode: str
+        :param label_mode: The labels of the output feature: `sparse` integers of 1 byte, or `dense` one-hot
+        categories. The objectives of the tuner are the metrics of the label mode.
+
+        :type telemetry: Telemetry
+        :param telemetry: The telemetry of the trials in TensorBoard. By default, only the scalars.
+
+        :type halving_factor: int
+        :param halving_factor: Every combination of the hyperparameters is trained one time, and the best
+        `1 / halving_factor` of every round continue with more epochs until `fit_epochs`. If it is `None`, every
+        combination is trained with `fit_epochs`.
+
+        :type use_trial_cache: bool
+        :param use_trial_cache: If true, the completed trials are stored by their hyperparameters, epochs and
+        the fingerprint of the splits, and the next searches restore them instead of training them again.
+        The stream of new games is random, so its trials are not cached. Use `trial_cache.clear()` to invalidate
+        them, for example after a change of the model.
+
+        :type output_categories: int
+        :param output_categories: Number of categories of the output feature, only without data. The oracle only
+        needs the space of the hyperparameters, which depends on the output layer but not on the records.
         """
+        check_label_mode(label_mode)
         self.__data = data
+        self.__label_mode = label_mode
+        self.__telemetry = telemetry if telemetry is not None else Telemetry('scalars')
         self.__train_size = train_size
         self.__output_feature = output_feature
+        self.__weight_feature = weight_feature
         self.__max_epochs = fit_epochs
+        self.__halving_factor = halving_factor
+        self.__steps_per_epoch = steps_per_epoch
+        self.__validation_steps = validation_steps
+        self.__game_stream = data if isinstance(data, (GameStream, FileStream)) else None
+        self.__output_categories = output_categories
+        self.__data_fingerprint = None
 
-        self.__split_data()
+        if data is None:
+            if output_categories is None:
+                raise ValueError('The number of output categories is needed without data.')
+        elif self.__game_stream is None:
+            self.__split_data()
+        elif isinstance(self.__game_stream, FileStream):
+            stream_fingerprint: str = self.__game_stream.get_fingerprint()
+            if stream_fingerprint is not None:
+                self.__data_fingerprint = sha256(dumps([stream_fingerprint, self.__steps_per_epoch,
+                                                        self.__validation_steps]).encode()).hexdigest()
 
         self.tuner_directory = tuner_directory
-        if isdir(self.tuner_directory):
-            rmtree(self.tuner_directory)
+        self.trial_cache = TrialCache(f'{self.tuner_directory}/{TRIAL_CACHE_DIRECTORY}',
+                                      self.__data_fingerprint if use_trial_cache else None)
+        # In a distributed search, the directory is cleaned one time before the chief and the workers start.
+        if not is_distributed():
+            clean_tuner_directory(self.tuner_directory)
 
     def __split_data(self) -> None:
         """
         Split the data for the training, validation and test.
+        The training and validation sets are converted to tensors one time, for all the trials.
 
         :rtype: None
         """
         split_data: SplitData = SplitData(self.__data, train_size=self.__train_size,
                                           output_feature=self.__output_feature,
-                                          convert_output_to_category=True)
-        self.__train_set_x, self.__train_set_y, \
-            self.__validation_set_x, self.__validation_set_y, \
+                                          convert_output_to_category=self.__label_mode == 'dense',
+                                          weight_feature=self.__weight_feature)
+        self.__data_fingerprint = split_data.get_fingerprint()
+        train_set_x, train_set_y, \
+            validation_set_x, validation_set_y, \
             self.__test_set_x, self.__test_set_y = split_data.get_data_split()
+        train_set_weight, validation_set_weight, _ = split_data.get_sample_weights()
+        self.__train_pipeline = InputPipeline(train_set_x, train_set_y, train_set_weight)
+        self.__validation_pipeline = InputPipeline(validation_set_x, validation_set_y, validation_set_weight,
+                                                   shuffle=False)
 
     def search(self):
         tuner_logs_search_directory: str = f'{self.tuner_directory}/logs-search'
-        # max_collisions: int = self.__max_epochs * 10
 
-        self.__tuner = Hyperband(
+        if self.__data is None:
+            # The chief of a distributed search only runs the oracle, the workers train the trials.
+            output_layer_units: int = self.__output_categories
+            search_data: tuple = ()
+            search_arguments: dict = {}
+        elif self.__game_stream is not None:
+            output_layer_units: int = self.__game_stream.output_categories
+            convert_output_to_category: bool = self.__label_mode == 'dense'
+            search_data: tuple = (self.__game_stream.get_dataset(
+                'train', convert_output_to_category=convert_output_to_category),)
+            search_arguments: dict = {
+                'validation_data': self.__game_stream.get_dataset(
+                    'validation', self.__validation_steps, convert_output_to_category=convert_output_to_category),
+                'steps_per_epoch': self.__steps_per_epoch,
+            }
+        else:
+            output_layer_units: int = self.__train_pipeline.output_categories
+            search_data: tuple = (self.__train_pipeline,)
+            search_arguments: dict = {
+                'validation_data': self.__validation_pipeline,
+            }
+
+        self.__tuner = GridTuner(
             GeneralHyperModel(
-                output_layer_units=self.__train_set_y.shape[1]
+                output_layer_units=output_layer_units,
+                label_mode=self.__label_mode,
             ),
             objective=[
-                Objective('val_categorical_crossentropy', direction='min'),
-                Objective('val_categorical_accuracy', direction='max'),
+                Objective(get_metric_name('crossentropy', self.__label_mode, validation=True), direction='min'),
+                Objective(get_metric_name('accuracy', self.__label_mode, validation=True), direction='max'),
                 # Objective('val_categorical_hinge', direction='min'),
                 # Objective('val_top_k_categorical_accuracy', direction='max'),
                 # Objective('val_precision', direction='max'),
             ],
+            max_epochs=self.__max_epochs,
+            halving_factor=self.__halving_factor,
             seed=42,
-            overwrite=True,
+            trial_cache=self.trial_cache,
+            overwrite=False,
             directory=self.tuner_directory,
             project_name='PredictClassification',
         )
         print(f'tuner.tuner_id: {self.__tuner.tuner_id}')
 
         self.__tuner.search(
-            self.__train_set_x,
-            self.__train_set_y,
-            validation_data=(self.__validation_set_x, self.__validation_set_y),
-            callbacks=[callbacks.TensorBoard(tuner_logs_search_directory,
-                                             histogram_freq=1, write_images=True,
-                                             embeddings_freq=1)],
+            *search_data,
+            **search_arguments,
+            callbacks=self.__telemetry.get_callbacks(tuner_logs_search_directory),
         )
+        self.__telemetry.display_information(f'Search {self.__tuner.tuner_id}')
+
+        if not is_chief():
+            # The workers only run trials, the chief has the results of all of them.
+            return
 
         print('--- --- --- --- --- --- --- --- --- --- --- --- --- --- ---')
         print('# Get the best results')
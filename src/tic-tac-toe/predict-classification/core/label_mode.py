@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Modes of the labels of the output feature: sparse integers or dense one-hot categories.
+"""
+from keras import losses
+from keras.utils import to_categorical
+from numpy import ndarray, int8
+
+LABEL_MODES: tuple = ('sparse', 'dense')
+
+
+def check_label_mode(label_mode: str) -> None:
+    """
+    Check that the label mode exists.
+
+    :type label_mode: str
+    :param label_mode: The label mode: `sparse` or `dense`.
+
+    :rtype: None
+    """
+    if label_mode not in LABEL_MODES:
+        raise ValueError(f'Unknown label mode "{label_mode}", the options are: {", ".join(LABEL_MODES)}.')
+
+
+def get_labels(values: ndarray, label_mode: str, output_categories: int = None) -> ndarray:
+    """
+    Return the labels of the output feature.
+    The sparse labels are signed integers of 1 byte, the dense labels are one float per category.
+
+    :type values: ndarray
+    :param values: The categories of the output feature, for example the winner.
+
+    :type label_mode: str
+    :param label_mode: The label mode: `sparse` or `dense`.
+
+    :type output_categories: int
+    :param output_categories: Number of categories, only for the dense labels. By default, the maximum plus one.
+
+    :rtype: ndarray
+    :return: The labels.
+    """
+    check_label_mode(label_mode)
+    if label_mode == 'dense':
+        return to_categorical(values, num_classes=output_categories)
+
+    return values.astype(int8, copy=False)
+
+
+def get_loss(label_mode: str) -> losses.Loss:
+    """
+    Return the loss of the categories for the label mode.
+
+    :type label_mode: str
+    :param label_mode: The label mode: `sparse` or `dense`.
+
+    :rtype: keras.losses.Loss
+    :return: The cross entropy loss.
+    """
+    check_label_mode(label_mode)
+    if label_mode == 'dense':
+        return losses.CategoricalCrossentropy()
+
+    return losses.SparseCategoricalCrossentropy()
+
+
+def get_label_mode(loss) -> str:
+    """
+    Return the label mode of the loss of a model, for example a loaded model.
+
+    :type loss: keras.losses.Loss | str
+    :param loss: The loss of the model.
+
+    :rtype: str
+    :return: The label mode: `sparse` or `dense`.
+    """
+    name: str = loss if isinstance(loss, str) else getattr(loss, 'name', type(loss).__name__)
+    return 'sparse' if 'sparse' in name.lower() else 'dense'
+
+
+def get_metric_name(metric: str, label_mode: str, validation: bool = False) -> str:
+    """
+    Return the name of a categorical metric in the logs of Keras, for the label mode.
+
+    :type metric: str
+    :param metric: The metric: `accuracy` or `crossentropy`.
+
+    :type label_mode: str
+    :param label_mode: The label mode: `sparse` or `dense`.
+
+    :type validation: bool
+    :param validation: If true, the name of the metric of the validation set.
+
+    :rtype: str
+    :return: The name, for example `val_sparse_categorical_accuracy`.
+    """
+    check_label_mode(label_mode)
+    prefix: str = 'val_' if validation else ''
+    mode: str = 'sparse_' if label_mode == 'sparse' else ''
+
+    return f'{prefix}{mode}categorical_{metric}'
@@ -3,19 +3,28 @@
 """
 Load the model with the best training.
 """
-from keras import models, Sequential, callbacks, layers, activations, optimizers, losses, metrics
-from keras.utils import to_categorical
+from keras import models, Sequential, layers, activations, optimizers, metrics
 from numpy import ndarray
 from pandas import DataFrame
 
+from core.file_stream import FileStream
+from core.game_stream import GameStream
+from core.input_pipeline import InputPipeline
+from core.label_mode import check_label_mode, get_labels, get_loss
+from core.telemetry import Telemetry
+
 
 class ModelBest:
     """
     Load the best model and evaluate it.
     """
     __data: DataFrame
-    __data_set_x: DataFrame
-    __data_set_y: ndarray
+    __input_pipeline: InputPipeline
+    __weight_feature: str
+    __game_stream: GameStream
+    __steps_per_epoch: int
+    __input_size: int
+    __output_categories: int
     __epochs: int
     __logs_path: str
     __model_path: str
@@ -25,22 +34,49 @@ class ModelBest:
     __layers: int
     __learning_rate: float
     __ams_grad: bool
+    __label_mode: str
+    __telemetry: Telemetry
     tuner_directory: str
     tuner_best_model_result_directory: str
 
     def __init__(self, data: DataFrame, model_path: str, output_feature: str, epochs: int,
                  batch_size: int, units: int, layers_model: int, learning_rate: float, ams_grad: bool,
-                 tuner_directory: str = 'keras-tuner-trials',
+                 tuner_directory: str = 'keras-tuner-trials', steps_per_epoch: int = 1000,
+                 weight_feature: str = None, label_mode: str = 'sparse', telemetry: Telemetry = None,
                  ):
         """
         Construction method.
+
+        :type data: DataFrame | GameStream | FileStream
+        :param data: The records, the stream of new games, or the stream of the records in files larger than the RAM.
+
+        :type steps_per_epoch: int
+        :param steps_per_epoch: Number of batches in every epoch and in the evaluation, only for the streams.
+
+        :type weight_feature: str
+        :param weight_feature: The Column Name used as sample weight, for example the `count` of the deduplicated
+        games. It is not an input feature. Only for the records.
+
+        :type label_mode: str
+        :param label_mode: The labels of the output feature: `sparse` integers of 1 byte with the sparse loss and
+        metrics, or `dense` one-hot categories.
+
+        :type telemetry: Telemetry
+        :param telemetry: The telemetry of the training in TensorBoard. By default, the scalars and the histograms
+        of the weights every 10 epochs.
         """
+        check_label_mode(label_mode)
+        self.__label_mode = label_mode
+        self.__telemetry = telemetry if telemetry is not None else Telemetry('histograms')
         self.__data = data
+        self.__game_stream = data if isinstance(data, (GameStream, FileStream)) else None
+        self.__steps_per_epoch = steps_per_epoch
         self.__logs_path = f'{tuner_directory}/logs-best-model'
         self.__model_path = model_path
         self.tuner_directory = tuner_directory
         self.tuner_best_model_result_directory = model_path
         self.__output_feature = output_feature
+        self.__weight_feature = weight_feature
         self.__epochs = epochs
         self.__batch_size = batch_size
         self.__units = units
@@ -48,72 +84,122 @@ class ModelBest:
         self.__learning_rate = learning_rate
         self.__ams_grad = ams_grad
 
-        self.__split_data()
+        if self.__game_stream is not None:
+            self.__input_size = self.__game_stream.input_size
+            self.__output_categories = self.__game_stream.output_categories
+        else:
+            self.__split_data()
         self.__generate_model()
 
     def __split_data(self) -> None:
         """
-        Split the data for input and output features.
+        Split the data for input and output features, they are converted to tensors one time.
 
         :rtype: None
         """
-        self.__data_set_x = self.__data.drop(columns=[self.__output_feature])
-        print('self.__data_set_x:')
-        print(self.__data_set_x)
-        self.__data_set_y = self.__data[self.__output_feature].copy().to_numpy()
-        print('self.__data_set_y:')
-        print(self.__data_set_y)
-        self.__data_set_y = to_categorical(self.__data_set_y)
-        print('self.__data_set_y:')
-        print(self.__data_set_y)
+        drop_columns: list = [self.__output_feature]
+        data_set_weight: ndarray = None
+        if self.__weight_feature is not None:
+            drop_columns.append(self.__weight_feature)
+            data_set_weight = self.__data[self.__weight_feature].to_numpy(dtype='float32')
+
+        data_set_x: DataFrame = self.__data.drop(columns=drop_columns)
+        print('data_set_x:')
+        print(data_set_x)
+        data_set_y: ndarray = self.__data[self.__output_feature].to_numpy()
+        print('data_set_y:')
+        print(data_set_y)
+        data_set_y = get_labels(data_set_y, self.__label_mode)
+        print('data_set_y:')
+        print(data_set_y)
+        self.__input_pipeline = InputPipeline(data_set_x, data_set_y, data_set_weight)
+        self.__input_size = self.__input_pipeline.input_size
+        self.__output_categories = self.__input_pipeline.output_categories
+
+    def __get_data_arguments(self, split: str) -> dict:
+        """
+        Return the arguments with the data for the methods `fit` and `evaluate` of the model.
+
+        :type split: str
+        :param split: The split of the stream, `train` or `test`. The records are shuffled for `train`.
+
+        :rtype: dict
+        :return: The data and its batch information.
+        """
+        if self.__game_stream is not None:
+            return {
+                'x': self.__game_stream.get_dataset(
+                    split, convert_output_to_category=self.__label_mode == 'dense',
+                ).unbatch().batch(self.__batch_size),
+                'steps': self.__steps_per_epoch,
+            }
+
+        return {
+            'x': self.__input_pipeline.get_dataset(self.__batch_size, shuffle=split == 'train'),
+        }
 
     def __generate_model(self):
         self.__best_model: Sequential = models.Sequential()
 
         # Input layer
-        self.__best_model.add(layers.Dense(input_shape=self.__data_set_x.shape[1:],
+        self.__best_model.add(layers.Dense(input_shape=(self.__input_size,),
                                            units=self.__units, activation=activations.relu))
         # Hidden layers
         for _ in range(self.__layers - 1):
             self.__best_model.add(layers.Dense(units=self.__units, activation=activations.relu))
 
         # Output layer
-        self.__best_model.add(layers.Dense(self.__data_set_y.shape[1], activation=activations.softmax))
+        self.__best_model.add(layers.Dense(self.__output_categories, activation=activations.softmax))
 
         self.__best_model.compile(
             optimizer=optimizers.Adam(
                 learning_rate=self.__learning_rate,
                 amsgrad=self.__ams_grad,
             ),
-            loss=losses.CategoricalCrossentropy(),
-            metrics=[
-                metrics.Accuracy(),
-                metrics.CategoricalAccuracy(),
-                metrics.TopKCategoricalAccuracy(),
-                metrics.CategoricalCrossentropy(),
-                metrics.Precision(),
-                metrics.CategoricalHinge(),
-            ],
+            loss=get_loss(self.__label_mode),
+            metrics=self.__get_metrics(),
         )
 
         self.__best_model.summary()
 
+    def __get_metrics(self) -> list:
+        """
+        Return the metrics of the label mode.
+
+        :rtype: list[keras.metrics.Metric]
+        :return: The metrics.
+        """
+        if self.__label_mode == 'sparse':
+            return [
+                metrics.SparseCategoricalAccuracy(),
+                metrics.SparseTopKCategoricalAccuracy(),
+                metrics.SparseCategoricalCrossentropy(),
+            ]
+
+        return [
+            metrics.Accuracy(),
+            metrics.CategoricalAccuracy(),
+            metrics.TopKCategoricalAccuracy(),
+            metrics.CategoricalCrossentropy(),
+            metrics.Precision(),
+            metrics.CategoricalHinge(),
+        ]
+
     def fit(self):
+        data_arguments: dict = self.__get_data_arguments('train')
+        if 'steps' in data_arguments:
+            data_arguments['steps_per_epoch'] = data_arguments.pop('steps')
+
         self.__best_model.fit(
-            self.__data_set_x,
-            self.__data_set_y,
-            batch_size=self.__batch_size,
+            **data_arguments,
             epochs=self.__epochs,
-            callbacks=[callbacks.TensorBoard(self.__logs_path,
-                                             histogram_freq=1, write_images=True,
-                                             embeddings_freq=1)],
+            callbacks=self.__telemetry.get_callbacks(self.__logs_path),
         )
+        self.__telemetry.display_information('Fit')
 
     def evaluate(self):
         evaluation = self.__best_model.evaluate(
-            self.__data_set_x,
-            self.__data_set_y,
-            batch_size=self.__batch_size,
+            **self.__get_data_arguments('test'),
             verbose=2,
         )
         index: int
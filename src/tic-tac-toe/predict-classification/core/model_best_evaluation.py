@@ -4,10 +4,11 @@
 Load the model and evaluate it.
 """
 from keras import models, Sequential, callbacks, layers, activations, optimizers, losses, metrics
-from keras.utils import to_categorical
 from numpy import ndarray
 from pandas import DataFrame
 
+from core.label_mode import check_label_mode, get_labels, get_label_mode
+
 
 class ModelBestEvaluation:
     """
@@ -16,6 +17,8 @@ class ModelBestEvaluation:
     __data: DataFrame
     __data_set_x: DataFrame
     __data_set_y: ndarray
+    __data_set_weight: ndarray
+    __weight_feature: str
     __epochs: int
     __logs_path: str
     __model_path: str
@@ -26,20 +29,33 @@ class ModelBestEvaluation:
     __learning_rate: float
     __ams_grad: bool
     __output_categories: int
+    __label_mode: str
     tuner_directory: str
     tuner_best_model_result_directory: str
 
-    def __init__(self, data: DataFrame, output_feature: str, model_path: str, output_categories: int):
+    def __init__(self, data: DataFrame, output_feature: str, model_path: str, output_categories: int,
+                 weight_feature: str = None, label_mode: str = None):
         """
         Construction method.
+
+        :type weight_feature: str
+        :param weight_feature: The Column Name used as sample weight, for example the `count` of the deduplicated
+        games. It is not an input feature.
+
+        :type label_mode: str
+        :param label_mode: The labels of the output feature: `sparse` integers of 1 byte, or `dense` one-hot
+        categories. By default, the label mode of the loss of the saved model.
         """
         self.__data = data
         self.__output_feature = output_feature
+        self.__weight_feature = weight_feature
         self.__model_path = model_path
         self.__output_categories = output_categories
 
-        self.__split_data()
         self.__best_model = models.load_model(self.__model_path)
+        self.__label_mode = label_mode if label_mode is not None else get_label_mode(self.__best_model.loss)
+        check_label_mode(self.__label_mode)
+        self.__split_data()
 
     def __split_data(self) -> None:
         """
@@ -47,13 +63,19 @@ class ModelBestEvaluation:
 
         :rtype: None
         """
-        self.__data_set_x = self.__data.drop(columns=[self.__output_feature])
+        drop_columns: list = [self.__output_feature]
+        self.__data_set_weight = None
+        if self.__weight_feature is not None:
+            drop_columns.append(self.__weight_feature)
+            self.__data_set_weight = self.__data[self.__weight_feature].to_numpy(dtype='float32')
+
+        self.__data_set_x = self.__data.drop(columns=drop_columns)
         print('self.__data_set_x:')
         print(self.__data_set_x)
         self.__data_set_y = self.__data[self.__output_feature].copy().to_numpy()
         print('self.__data_set_y:')
         print(self.__data_set_y)
-        self.__data_set_y = to_categorical(self.__data_set_y, num_classes=self.__output_categories)
+        self.__data_set_y = get_labels(self.__data_set_y, self.__label_mode, self.__output_categories)
         print('self.__data_set_y:')
         print(self.__data_set_y)
 
@@ -61,6 +83,7 @@ class ModelBestEvaluation:
         evaluation = self.__best_model.evaluate(
             self.__data_set_x,
             self.__data_set_y,
+            sample_weight=self.__data_set_weight,
             verbose=2,
         )
         index: int
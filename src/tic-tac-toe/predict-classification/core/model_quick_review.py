@@ -7,7 +7,7 @@ from numpy import ndarray
 from pandas import DataFrame
 from tensorflow.python.keras.activations import softmax
 from tensorflow.python.keras.backend import relu
-from tensorflow.python.keras.callbacks import History
+from tensorflow.python.keras.callbacks import History, TensorBoard
 from tensorflow.python.keras.layers import Dense
 from tensorflow.python.keras.losses import categorical_crossentropy
 from tensorflow.python.keras.metrics import Precision, accuracy
@@ -15,7 +15,9 @@ from tensorflow.python.keras.models import Sequential
 from tensorflow.python.keras.optimizer_v2.adam import Adam
 
 from core.graphic_information import GraphicInformation
+from core.input_pipeline import InputPipeline
 from core.split_data import SplitData
+from core.telemetry import Telemetry
 
 
 class ModelQuickReview:
@@ -30,18 +32,34 @@ class ModelQuickReview:
     __validation_set_y: ndarray
     __test_set_x: DataFrame
     __test_set_y: ndarray
+    __train_pipeline: InputPipeline
+    __validation_pipeline: InputPipeline
+    __test_pipeline: InputPipeline
+    __batch_size: int
     __history: History
     __model: Sequential
+    __telemetry: Telemetry
+    __logs_path: str
 
-    def __init__(self, data: DataFrame, output_feature: str, train_size: float = 0.98) -> None:
+    def __init__(self, data: DataFrame, output_feature: str, train_size: float = 0.98, telemetry: Telemetry = None,
+                 logs_path: str = 'keras-tuner-trials/logs-quick-review') -> None:
         """
         Construction method.
 
+        :type telemetry: Telemetry
+        :param telemetry: The telemetry of the training in TensorBoard. By default, it is off.
+
+        :type logs_path: str
+        :param logs_path: The directory of the logs of TensorBoard.
+
         :rtype: None
         """
+        self.__telemetry = telemetry if telemetry is not None else Telemetry('off')
+        self.__logs_path = logs_path
         self.__data = data
         self.__output_feature = output_feature
         self.__train_size = train_size
+        self.__batch_size = 512
 
     def split_data(self,
                    show_text_information: bool = False,
@@ -63,6 +81,9 @@ class ModelQuickReview:
         self.__train_set_x, self.__train_set_y, \
             self.__validation_set_x, self.__validation_set_y, \
             self.__test_set_x, self.__test_set_y = split_data.get_data_split()
+        self.__train_pipeline = InputPipeline(self.__train_set_x, self.__train_set_y)
+        self.__validation_pipeline = InputPipeline(self.__validation_set_x, self.__validation_set_y, shuffle=False)
+        self.__test_pipeline = InputPipeline(self.__test_set_x, self.__test_set_y, shuffle=False)
         if show_text_information:
             split_data.display_information_text()
         if show_graph_information:
@@ -86,12 +107,12 @@ class ModelQuickReview:
         print(self.__model.summary())
 
         self.__history = self.__model.fit(
-            self.__train_set_x,
-            self.__train_set_y,
+            self.__train_pipeline.get_dataset(self.__batch_size),
             epochs=3,
-            batch_size=512,
-            validation_data=(self.__validation_set_x, self.__validation_set_y)
+            validation_data=self.__validation_pipeline.get_dataset(self.__batch_size),
+            callbacks=self.__telemetry.get_callbacks(self.__logs_path, tensorboard_class=TensorBoard),
         )
+        self.__telemetry.display_information('Quick review')
 
     def show_graphic_information(self) -> None:
         """
@@ -116,7 +137,7 @@ class ModelQuickReview:
         :rtype: None
         """
         error_evaluation, accuracy_evaluation, \
-            precision_evaluation = self.__model.evaluate(self.__test_set_x, self.__test_set_y)
+            precision_evaluation = self.__model.evaluate(self.__test_pipeline.get_dataset(self.__batch_size))
         print()
         print('Evaluate the model with the test data.')
         print(f'Error Raw: {error_evaluation:,.2g}')
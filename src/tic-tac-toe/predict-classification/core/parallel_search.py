@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Run the search of the Keras Tuner in parallel, with a chief oracle and local worker processes.
+"""
+import socket
+from multiprocessing import get_context
+from multiprocessing.connection import wait
+from os import environ, sched_getaffinity, sched_setaffinity
+from typing import Callable
+
+from core.trial_cache import clean_tuner_directory
+
+
+def get_free_port(host: str = '127.0.0.1') -> int:
+    """
+    Return a free port of the host, for the oracle of the chief.
+
+    :type host: str
+    :param host: The IP address of the host.
+
+    :rtype: int
+    :return: The port.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server_socket:
+        server_socket.bind((host, 0))
+        return server_socket.getsockname()[1]
+
+
+def run_tuner(tuner_id: str, host: str, port: int, cpus: list, inter_op_threads: int, get_data: Callable,
+              output_feature: str, output_categories: int, tuner_arguments: dict) -> None:
+    """
+    Run the search in this process, as the chief or as a worker.
+    The environment and the threads are set before TensorFlow is imported. The chief only runs the oracle,
+    so it does not load the data.
+
+    :type tuner_id: str
+    :param tuner_id: The identifier of the tuner: `chief` for the oracle, or `tuner0`, `tuner1`... for the workers.
+
+    :type host: str
+    :param host: The IP address of the oracle.
+
+    :type port: int
+    :param port: The port of the oracle.
+
+    :type cpus: list[int]
+    :param cpus: The CPUs of the process. If it is empty, the affinity is not changed.
+
+    :type inter_op_threads: int
+    :param inter_op_threads: Number of threads which run independent operations at the same time.
+
+    :type get_data: Callable
+    :param get_data: Function without arguments which returns the data, it runs in this process.
+
+    :type output_feature: str
+    :param output_feature: The Column Name for the output feature.
+
+    :type output_categories: int
+    :param output_categories: Number of categories of the output feature, for the space of the chief.
+
+    :type tuner_arguments: dict
+    :param tuner_arguments: Other arguments of `KerasTunerHyper`.
+
+    :rtype: None
+    """
+    environ['KERASTUNER_TUNER_ID'] = tuner_id
+    environ['KERASTUNER_ORACLE_IP'] = host
+    environ['KERASTUNER_ORACLE_PORT'] = str(port)
+    if cpus:
+        sched_setaffinity(0, cpus)
+        environ['OMP_NUM_THREADS'] = str(len(cpus))
+
+    from tensorflow import config
+
+    intra_op_threads: int = len(cpus) if cpus else 1
+    config.threading.set_intra_op_parallelism_threads(intra_op_threads)
+    config.threading.set_inter_op_parallelism_threads(inter_op_threads if cpus else 1)
+
+    from core.keras_tuner_hyper import KerasTunerHyper
+
+    if tuner_id == 'chief':
+        keras_tuner_hyperparameter: KerasTunerHyper = KerasTunerHyper(
+            None, output_feature, output_categories=output_categories, **tuner_arguments)
+    else:
+        keras_tuner_hyperparameter: KerasTunerHyper = KerasTunerHyper(get_data(), output_feature, **tuner_arguments)
+    keras_tuner_hyperparameter.search()
+
+
+class ParallelSearch:
+    """
+    Search the best parameters with a chief and several workers in the same host.
+    The chief only runs the oracle, which gives the trials to the workers, and every worker trains its trials
+    with its own CPUs and threads of TensorFlow. The trials are stored in the same directory as the search of
+    one process.
+    """
+    __get_data: Callable
+    __output_feature: str
+    __output_categories: int
+    __workers: int
+    __cpus: list
+    __inter_op_threads: int
+    __host: str
+    __port: int
+    __tuner_arguments: dict
+    tuner_directory: str
+
+    def __init__(self, get_data: Callable, output_feature: str, workers: int = None, inter_op_threads: int = 2,
+                 host: str = '127.0.0.1', port: int = None, tuner_directory: str = 'keras-tuner-trials',
+                 output_categories: int = 3, **tuner_arguments) -> None:
+        """
+        Construction method.
+
+        :type get_data: Callable
+        :param get_data: Function without arguments which returns the data, every process calls it.
+        It must be picklable, for example `functools.partial(DatasetLoader().load, filename)`, so the processes
+        map the same binary cache instead of receive a copy of the data.
+
+        :type output_feature: str
+        :param output_feature: The Column Name for the output feature.
+
+        :type workers: int
+        :param workers: Number of worker processes. By default, one worker for every 4 CPUs.
+
+        :type inter_op_threads: int
+        :param inter_op_threads: Number of threads of every worker which run independent operations at the same time.
+
+        :type host: str
+        :param host: The IP address of the oracle of the chief.
+
+        :type port: int
+        :param port: The port of the oracle of the chief. By default, a free port.
+
+        :type tuner_directory: str
+        :param tuner_directory: The directory of the trials.
+
+        :type output_categories: int
+        :param output_categories: Number of categories of the output feature. The chief builds the space of the
+        hyperparameters with it, instead of loading the data.
+
+        :param tuner_arguments: Other arguments of `KerasTunerHyper`, for example `fit_epochs`.
+
+        :rtype: None
+        """
+        self.__cpus = sorted(sched_getaffinity(0))
+        if workers is None:
+            workers = max(1, len(self.__cpus) // 4)
+        if workers < 1:
+            raise ValueError(f'The number of workers must be positive, it is {workers}.')
+
+        self.__get_data = get_data
+        self.__output_feature = output_feature
+        self.__output_categories = output_categories
+        self.__workers = workers
+        self.__inter_op_threads = inter_op_threads
+        self.__host = host
+        self.__port = port
+        self.tuner_directory = tuner_directory
+        self.__tuner_arguments = {**tuner_arguments, 'tuner_directory': tuner_directory}
+
+    def get_worker_cpus(self) -> list:
+        """
+        Return the CPUs of every worker, the CPUs of this process are divided in contiguous groups.
+        If there are more workers than CPUs, the workers share all of them.
+
+        :rtype: list[list[int]]
+        :return: The CPUs of every worker.
+        """
+        if self.__workers > len(self.__cpus):
+            return [self.__cpus] * self.__workers
+
+        return [
+            self.__cpus[len(self.__cpus) * index // self.__workers:len(self.__cpus) * (index + 1) // self.__workers]
+            for index in range(self.__workers)
+        ]
+
+    def search(self) -> None:
+        """
+        Start the chief and the workers, and wait until the oracle finishes all the trials.
+
+        :rtype: None
+        """
+        clean_tuner_directory(self.tuner_directory)
+
+        port: int = self.__port if self.__port is not None else get_free_port(self.__host)
+        # TensorFlow is not safe after a fork, every process starts a new interpreter.
+        context = get_context('spawn')
+        tuners: list = [('chief', [])] + [(f'tuner{index}', cpus) for index, cpus in enumerate(self.get_worker_cpus())]
+        processes: list = []
+        tuner_id: str
+        cpus: list
+        for tuner_id, cpus in tuners:
+            process = context.Process(
+                target=run_tuner, name=tuner_id,
+                args=(tuner_id, self.__host, port, cpus, self.__inter_op_threads, self.__get_data,
+                      self.__output_feature, self.__output_categories, self.__tuner_arguments),
+            )
+            process.start()
+            processes.append(process)
+
+        # The workers wait for the oracle of the chief without timeout, so all the processes are polled: if any of
+        # them fails, the others are stopped instead of waiting forever.
+        running_processes: list = list(processes)
+        failed_processes: list = []
+        while running_processes and not failed_processes:
+            sentinel: int
+            for sentinel in wait([process.sentinel for process in running_processes]):
+                process = next(process for process in running_processes if process.sentinel == sentinel)
+                process.join()
+                running_processes.remove(process)
+                if process.exitcode != 0:
+                    failed_processes.append(f'{process.name} ({process.exitcode})')
+
+        for process in running_processes:
+            process.terminate()
+        for process in running_processes:
+            process.join()
+
+        if failed_processes:
+            raise RuntimeError(f'The processes of the search failed: {", ".join(failed_processes)}.')
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Run the stages of the application, with the resources which they need loaded only one time and only if needed.
+"""
+from typing import Callable
+
+from core.chronometer import Chronometer
+
+
+class Pipeline:
+    """
+    This class runs the selected stages in order.
+    Every stage and every resource declares the resources which it requires, for example the data sets or a model.
+    A resource is created the first time that it is required, and it is kept for the next stages.
+    The chronometer checks every resource and every stage.
+    """
+    __chronometer: Chronometer
+    __resources: dict
+    __stages: dict
+    __values: dict
+
+    def __init__(self, chronometer: Chronometer = None) -> None:
+        """
+        Construction method.
+
+        :type chronometer: Chronometer
+        :param chronometer: The chronometer which checks the resources and the stages, by default a new one.
+
+        :rtype: None
+        """
+        self.__chronometer = chronometer if chronometer is not None else Chronometer()
+        self.__resources = {}
+        self.__stages = {}
+        self.__values = {}
+
+    @property
+    def chronometer(self) -> Chronometer:
+        """
+        Get the chronometer.
+
+        :rtype: Chronometer
+        :return: The chronometer.
+        """
+        return self.__chronometer
+
+    @property
+    def stages(self) -> list:
+        """
+        Get the names of the stages, in the order which they were added.
+
+        :rtype: list[str]
+        :return: The stages.
+        """
+        return list(self.__stages)
+
+    def add_resource(self, name: str, function: Callable, requires: tuple = ()) -> None:
+        """
+        Add a resource, it is created when a stage or other resource requires it.
+
+        :type name: str
+        :param name: The name of the resource.
+
+        :type function: Callable
+        :param function: Function which receives the required resources as keyword arguments and returns the resource.
+
+        :type requires: tuple[str]
+        :param requires: The names of the resources which the function receives.
+
+        :rtype: None
+        """
+        self.__resources[name] = (function, requires)
+
+    def add_stage(self, name: str, function: Callable, requires: tuple = ()) -> None:
+        """
+        Add a stage.
+
+        :type name: str
+        :param name: The name of the stage.
+
+        :type function: Callable
+        :param function: Function which receives the required resources as keyword arguments.
+        If it returns a dictionary, its items are stored as resources for the next stages.
+
+        :type requires: tuple[str]
+        :param requires: The names of the resources which the function receives.
+
+        :rtype: None
+        """
+        self.__stages[name] = (function, requires)
+
+    def get(self, name: str):
+        """
+        Return a resource, it is created the first time.
+
+        :type name: str
+        :param name: The name of the resource.
+
+        :rtype: object
+        :return: The resource.
+        """
+        if name not in self.__values:
+            if name not in self.__resources:
+                raise ValueError(f'Unknown resource "{name}", the options are: {", ".join(self.__resources)}.')
+
+            function: Callable
+            requires: tuple
+            function, requires = self.__resources[name]
+            arguments: dict = self.__get_arguments(requires)
+            self.__values[name] = function(**arguments)
+            self.__chronometer.check(f'Load {name}')
+
+        return self.__values[name]
+
+    def run(self, stages: list) -> None:
+        """
+        Run the stages in the order of the pipeline, only the resources which they require are created.
+
+        :type stages: list[str]
+        :param stages: The names of the stages.
+
+        :rtype: None
+        """
+        unknown_stages: list = [stage for stage in stages if stage not in self.__stages]
+        if unknown_stages:
+            raise ValueError(f'Unknown stages "{", ".join(unknown_stages)}", '
+                             f'the options are: {", ".join(self.__stages)}.')
+
+        name: str
+        for name in self.__stages:
+            if name not in stages:
+                continue
+
+            function: Callable
+            requires: tuple
+            function, requires = self.__stages[name]
+            arguments: dict = self.__get_arguments(requires)
+            outputs = function(**arguments)
+            if isinstance(outputs, dict):
+                self.__values.update(outputs)
+            self.__chronometer.check(f'Stage {name}')
+
+    def __get_arguments(self, requires: tuple) -> dict:
+        """
+        Return the required resources as keyword arguments, the dashes of the names are underscores.
+
+        :type requires: tuple[str]
+        :param requires: The names of the resources.
+
+        :rtype: dict
+        :return: The resources.
+        """
+        return {name.replace('-', '_'): self.get(name) for name in requires}
@@ -3,46 +3,103 @@
 """
 Split the data for the deep learning in three slices: training, validation and test.
 """
-from numpy import ndarray
+from collections import OrderedDict
+from hashlib import sha256
+from json import dumps
+from os import makedirs, replace, stat
+from os.path import abspath, exists, join
+
+from numpy import ndarray, arange, empty, load, savez, result_type, int8
 from pandas import DataFrame
 from sklearn.model_selection import train_test_split
 from tensorflow.python.keras.utils.np_utils import to_categorical
 
+from core.dataset_loader import DatasetLoader
 from core.graphic_information import GraphicInformation
 
 
+def get_fingerprint(data_set) -> str:
+    """
+    Return the fingerprint of a data set, from facts which are not read from its values: its columns, its types,
+    its shape, and the path, the size and the modification time of its CSV file.
+    The data sets of `DatasetLoader` have their CSV file in the attribute `source`, the other data sets have not
+    a file, so their values are hashed.
+
+    :type data_set: DataFrame | str
+    :param data_set: The data set or the filename of a CSV file.
+
+    :rtype: str
+    :return: The fingerprint in hexadecimal.
+    """
+    if isinstance(data_set, str):
+        file_stat = stat(data_set)
+        return sha256(dumps([abspath(data_set), file_stat.st_size, file_stat.st_mtime_ns]).encode()).hexdigest()
+
+    facts: list = [list(map(str, data_set.columns)), list(map(str, data_set.dtypes)), list(data_set.shape)]
+    if data_set.attrs.get('source') is not None:
+        return sha256(dumps(facts + [data_set.attrs['source']]).encode()).hexdigest()
+
+    fingerprint = sha256(dumps(facts).encode())
+    column: str
+    for column in data_set.columns:
+        fingerprint.update(data_set[column].to_numpy().tobytes())
+
+    return fingerprint.hexdigest()
+
+
 class SplitData:
     """
     Split data in three slices: training, validation and test.
+    The data can be already split in files by the game generator, so it is not shuffled and copied in memory.
+
+    Only the indexes of the records are split, and they are stored in the cache directory by the fingerprint
+    of the data, the train size and the random state. Every split is copied one time to a contiguous matrix
+    of input features and an array of output features, the data frames of the input features are views of them.
+    The last `SPLITS_CACHE_SIZE` splits are kept in memory, so the next instances with the same data and options
+    reuse them, until `clear_cache`.
     """
     __data: DataFrame
+    __split_files: dict
     __output_feature: str
+    __weight_feature: str
     __convert_output_to_category: bool
-    __train_set: DataFrame
+    __cache_directory: str
+    __fingerprint: str
+    __split_indexes: dict
     __train_set_x: DataFrame
     __train_set_y: ndarray
-    __validation_set: DataFrame
     __validation_set_x: DataFrame
     __validation_set_y: ndarray
-    __test_set: DataFrame
     __test_set_x: DataFrame
     __test_set_y: ndarray
+    __train_set_weight: ndarray
+    __validation_set_weight: ndarray
+    __test_set_weight: ndarray
     __train_size: float
     __random_state: int
+    __splits_cache: OrderedDict = OrderedDict()
+
+    SPLITS: tuple = ('train', 'validation', 'test')
+    SPLITS_CACHE_SIZE: int = 2
 
-    def __init__(self, data: DataFrame, output_feature: str, convert_output_to_category=False,
-                 train_size: float = 0.98, random_state: int = 42) -> None:
+    def __init__(self, data, output_feature: str, convert_output_to_category=False,
+                 train_size: float = 0.98, random_state: int = 42, weight_feature: str = None,
+                 cache_directory: str = 'dataset-cache') -> None:
         """
         Construction method.
 
-        :type data: DataFrame
-        :param data: Data frame with the data which will split.
+        :type data: DataFrame | dict[str, DataFrame | str]
+        :param data: Data frame with the data which will split. Or a dictionary with the data already split,
+        for the keys `train`, `validation` and `test`, every value is a data frame or the filename of a CSV file,
+        for example the files of `game-generator/main.py --splits train=0.98 validation=0.01 test=0.01`.
+        In this case, `train_size` and `random_state` are not used.
 
         :type output_feature: str
         :param output_feature: The Column Name for the output feature.
 
         :type convert_output_to_category: bool
-        :param convert_output_to_category: If true, it converts the output feature to category.
+        :param convert_output_to_category: If true, it converts the output feature to dense one-hot categories.
+        If false, the output feature is returned as sparse labels, signed integers of 1 byte.
 
         :type train_size: float
         :param train_size: The size of the records for the train size.
@@ -50,15 +107,59 @@ class SplitData:
 
         :type random_state: int
         :param random_state: Generate the same results always. It keeps the same split in every iteration.
-        If random is desired, set to `None` this parameter.
+        If random is desired, set to `None` this parameter, then the split is not cached.
+
+        :type weight_feature: str
+        :param weight_feature: The Column Name for the weight of every record, for example the `count` of the
+        deduplicated games. It is not an input feature, see `get_sample_weights`.
+
+        :type cache_directory: str
+        :param cache_directory: The directory of the files with the indexes of the splits.
 
         :rtype: None
         """
+        self.__split_files = None
         self.__data = data
+        if isinstance(data, dict):
+            missing_splits: list = [split for split in self.SPLITS if split not in data]
+            if missing_splits:
+                raise ValueError(f'Missing splits "{", ".join(missing_splits)}", the options are: '
+                                 f'{", ".join(self.SPLITS)}.')
+            self.__split_files = data
+            self.__data = None
         self.__output_feature = output_feature
+        self.__weight_feature = weight_feature
         self.__train_size = train_size
         self.__random_state = random_state
         self.__convert_output_to_category = convert_output_to_category
+        self.__cache_directory = cache_directory
+        self.__fingerprint = None
+        self.__split_indexes = None
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Release the splits which are kept in memory, the files with the indexes are kept.
+
+        :rtype: None
+        """
+        cls.__splits_cache.clear()
+
+    def get_fingerprint(self) -> str:
+        """
+        Return the fingerprint of the splits: the fingerprint of the data, the train size, the random state,
+        the output and weight features and the conversion of the output feature.
+
+        :rtype: str
+        :return: The fingerprint in hexadecimal.
+        """
+        if self.__split_files is not None:
+            fingerprints: list = [get_fingerprint(self.__split_files[split]) for split in self.SPLITS]
+        else:
+            fingerprints: list = [self.__get_fingerprint(), self.__train_size]
+
+        return sha256(dumps([fingerprints, self.__random_state, self.__output_feature, self.__weight_feature,
+                             self.__convert_output_to_category]).encode()).hexdigest()
 
     def get_data_split(self) -> tuple:
         """
@@ -67,30 +168,186 @@ class SplitData:
         :rtype: tuple[DataFrame, ndarray, DataFrame, ndarray, DataFrame, ndarray]
         :return: The data set for training for x and y, validation for x and y and test for x and y.
         """
-        self.__train_set, remaining_set = train_test_split(self.__data,
-                                                           train_size=self.__train_size,
-                                                           random_state=self.__random_state)
-        self.__validation_set, self.__test_set = train_test_split(remaining_set,
-                                                                  test_size=0.5,
-                                                                  random_state=self.__random_state)
-
-        self.__train_set_y = self.__train_set[self.__output_feature].copy().to_numpy()
-        self.__validation_set_y = self.__validation_set[self.__output_feature].copy().to_numpy()
-        self.__test_set_y = self.__test_set[self.__output_feature].copy().to_numpy()
+        key: str = self.get_fingerprint()
+        splits: dict = self.__splits_cache.get(key) if self.__random_state is not None else None
+        if splits is not None:
+            self.__splits_cache.move_to_end(key)
+        else:
+            splits = {split: self.__get_split_arrays(split) for split in self.SPLITS}
+            if self.__random_state is not None:
+                self.__splits_cache[key] = splits
+                # Only the last splits are kept, the oldest ones are released.
+                while len(self.__splits_cache) > self.SPLITS_CACHE_SIZE:
+                    self.__splits_cache.popitem(last=False)
 
-        if self.__convert_output_to_category:
-            self.__train_set_y = to_categorical(self.__train_set_y)
-            self.__validation_set_y = to_categorical(self.__validation_set_y)
-            self.__test_set_y = to_categorical(self.__test_set_y)
-
-        self.__train_set_x = self.__train_set.drop(columns=[self.__output_feature])
-        self.__validation_set_x = self.__validation_set.drop(columns=[self.__output_feature])
-        self.__test_set_x = self.__test_set.drop(columns=[self.__output_feature])
+        self.__train_set_x, self.__train_set_y, self.__train_set_weight = splits['train']
+        self.__validation_set_x, self.__validation_set_y, self.__validation_set_weight = splits['validation']
+        self.__test_set_x, self.__test_set_y, self.__test_set_weight = splits['test']
 
         return self.__train_set_x, self.__train_set_y, \
             self.__validation_set_x, self.__validation_set_y, \
             self.__test_set_x, self.__test_set_y
 
+    def get_sample_weights(self) -> tuple:
+        """
+        Return the weights of the records for training, validation and test, after `get_data_split`.
+
+        :rtype: tuple[ndarray, ndarray, ndarray]
+        :return: The sample weights for training, validation and test, or `None` if there is no weight feature.
+        """
+        return self.__train_set_weight, self.__validation_set_weight, self.__test_set_weight
+
+    def get_split_indexes(self) -> dict:
+        """
+        Return the indexes of the records of every split, they are computed one time for the same data,
+        train size and random state, and they are stored in the cache directory.
+
+        :rtype: dict[str, ndarray]
+        :return: The positions of the records in the data for `train`, `validation` and `test`.
+        """
+        if self.__split_indexes is not None:
+            return self.__split_indexes
+
+        if self.__split_files is not None:
+            raise ValueError('The data is already split in files, there are no indexes.')
+
+        cache_filename: str = None
+        if self.__random_state is not None:
+            key: str = sha256(dumps([self.__get_fingerprint(), self.__train_size,
+                                     self.__random_state]).encode()).hexdigest()[:16]
+            cache_filename = join(self.__cache_directory, f'split-{key}.npz')
+            if exists(cache_filename):
+                with load(cache_filename) as indexes:
+                    self.__split_indexes = {split: indexes[split] for split in self.SPLITS}
+                return self.__split_indexes
+
+        # The same split as `train_test_split` over the data frame, but only the indexes are shuffled.
+        train_indexes, remaining_indexes = train_test_split(arange(len(self.__data)),
+                                                            train_size=self.__train_size,
+                                                            random_state=self.__random_state)
+        validation_indexes, test_indexes = train_test_split(remaining_indexes,
+                                                            test_size=0.5,
+                                                            random_state=self.__random_state)
+        self.__split_indexes = dict(zip(self.SPLITS, (train_indexes, validation_indexes, test_indexes)))
+
+        if cache_filename is not None:
+            makedirs(self.__cache_directory, exist_ok=True)
+            temporal_filename: str = f'{cache_filename}.tmp.npz'
+            savez(temporal_filename, **self.__split_indexes)
+            replace(temporal_filename, cache_filename)
+
+        return self.__split_indexes
+
+    def __get_fingerprint(self) -> str:
+        """
+        Return the fingerprint of the data, it is computed one time.
+
+        :rtype: str
+        :return: The fingerprint in hexadecimal.
+        """
+        if self.__fingerprint is None:
+            self.__fingerprint = get_fingerprint(self.__data)
+
+        return self.__fingerprint
+
+    def __get_split_set(self, split: str) -> DataFrame:
+        """
+        Return the data set of a split which is already split.
+
+        :type split: str
+        :param split: The split: `train`, `validation` or `test`.
+
+        :rtype: DataFrame
+        :return: The data set, it is loaded by `DatasetLoader` if it is a filename.
+        """
+        data_set = self.__split_files[split]
+        if isinstance(data_set, str):
+            filename: str = data_set
+            weight_columns: list = [self.__weight_feature] if self.__weight_feature is not None else []
+            data_set = DatasetLoader(self.__cache_directory).load(filename, drop_columns=weight_columns)
+            if weight_columns:
+                # The weights, for example the `count` of the deduplicated games, need a bigger type.
+                weights: DataFrame = DatasetLoader(self.__cache_directory, data_type='int32').load(
+                    filename, columns=weight_columns)
+                data_set = data_set.assign(**{self.__weight_feature: weights[self.__weight_feature]})
+            self.__split_files[split] = data_set
+
+        return data_set
+
+    def __get_split_records(self, split: str) -> tuple:
+        """
+        Return the data set which has the records of a split, and their positions in it.
+
+        :type split: str
+        :param split: The split: `train`, `validation` or `test`.
+
+        :rtype: tuple[DataFrame, ndarray]
+        :return: The data set, and the indexes of the records or `None` for all of them.
+        """
+        if self.__split_files is not None:
+            return self.__get_split_set(split), None
+
+        return self.__data, self.get_split_indexes()[split]
+
+    def __get_split_arrays(self, split: str) -> tuple:
+        """
+        Copy the records of a split to a contiguous matrix of input features, only one column at a time
+        is gathered, so the data is not copied complete.
+
+        :type split: str
+        :param split: The split: `train`, `validation` or `test`.
+
+        :rtype: tuple[DataFrame, ndarray, ndarray]
+        :return: The input features, the output feature and the weights or `None` if there is no weight feature.
+        """
+        data_set: DataFrame
+        indexes: ndarray
+        data_set, indexes = self.__get_split_records(split)
+
+        def get_values(column: str, data_type=None) -> ndarray:
+            values: ndarray = data_set[column].to_numpy(dtype=data_type)
+            return values if indexes is None else values[indexes]
+
+        input_columns: list = [column for column in data_set.columns
+                               if column not in (self.__output_feature, self.__weight_feature)]
+        input_features: ndarray = empty((len(data_set) if indexes is None else len(indexes), len(input_columns)),
+                                        dtype=result_type(*data_set.dtypes[input_columns]))
+        position: int
+        column: str
+        for position, column in enumerate(input_columns):
+            input_features[:, position] = get_values(column)
+
+        output_feature: ndarray = get_values(self.__output_feature)
+        if self.__convert_output_to_category:
+            output_feature = to_categorical(output_feature)
+        else:
+            output_feature = output_feature.astype(int8, copy=False)
+
+        weight: ndarray = None
+        if self.__weight_feature is not None:
+            weight = get_values(self.__weight_feature, 'float32')
+
+        return DataFrame(input_features, columns=input_columns, copy=False), output_feature, weight
+
+    def __get_split_frame(self, split: str, columns: list) -> DataFrame:
+        """
+        Return the records of a split with the selected columns, only for the graphics.
+
+        :type split: str
+        :param split: The split: `train`, `validation` or `test`.
+
+        :type columns: list[str]
+        :param columns: The Columns Names.
+
+        :rtype: DataFrame
+        :return: The data set of the split.
+        """
+        data_set: DataFrame
+        indexes: ndarray
+        data_set, indexes = self.__get_split_records(split)
+
+        return data_set[columns] if indexes is None else data_set[columns].iloc[indexes]
+
     def display_information_text(self) -> None:
         """
         Display or print in the console the information in text mode.
@@ -98,12 +355,19 @@ class SplitData:
         :rtype: None
         """
         print('--- --- --- --- --- --- --- --- --- --- --- --- --- --- --- ---')
-        print(f'Null values for all the data:\n{self.__data.isna().any()}')
+        if self.__data is not None:
+            print(f'Null values for all the data:\n{self.__data.isna().any()}')
+        else:
+            null_values: DataFrame = DataFrame([self.__get_split_set(split).isna().any() for split in self.SPLITS])
+            print(f'Null values for all the data:\n{null_values.any()}')
         print('--- --- --- --- --- --- --- --- --- --- --- --- --- --- --- ---')
-        print(f'Data set length:       {len(self.__data)}')
+        print(f'Data set length:       '
+              f'{len(self.__train_set_x) + len(self.__validation_set_x) + len(self.__test_set_x)}')
         print(f'Training set length:   {len(self.__train_set_x)}')
         print(f'Validation set length: {len(self.__validation_set_x)}')
         print(f'Test set length:       {len(self.__test_set_x)}')
+        if self.__weight_feature is not None:
+            print(f'Training set weight:   {self.__train_set_weight.sum():,.0f}')
         print('--- --- --- --- --- --- --- --- --- --- --- --- --- --- --- ---')
 
     def display_information_graphic(self, columns: list) -> None:
@@ -115,14 +379,8 @@ class SplitData:
 
         :rtype: None
         """
-        graphic_train_set = GraphicInformation(self.__train_set)
-        graphic_train_set.set_columns(columns)
-        graphic_train_set.get_distribution_columns()
-
-        graphic_validation_set = GraphicInformation(self.__validation_set)
-        graphic_validation_set.set_columns(columns)
-        graphic_validation_set.get_distribution_columns()
-
-        graphic_test_set = GraphicInformation(self.__test_set)
-        graphic_test_set.set_columns(columns)
-        graphic_test_set.get_distribution_columns()
+        split: str
+        for split in self.SPLITS:
+            graphic_set = GraphicInformation(self.__get_split_frame(split, columns))
+            graphic_set.set_columns(columns)
+            graphic_set.get_distribution_columns()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Levels of the telemetry of the training in TensorBoard, and the time which the telemetry consumes.
+"""
+from datetime import timedelta
+from functools import lru_cache
+from time import perf_counter
+from uuid import uuid4
+
+from keras import callbacks
+
+TELEMETRY_LEVELS: tuple = ('off', 'scalars', 'histograms', 'full')
+
+# The hooks of the callback which write the summaries, they are timed.
+TIMED_HOOKS: tuple = (
+    'set_model', 'on_train_begin', 'on_train_end', 'on_epoch_begin', 'on_epoch_end',
+    'on_test_begin', 'on_test_end', 'on_train_batch_begin', 'on_train_batch_end',
+)
+
+# Time of the telemetry by its key. The tuner copies the callbacks for every trial, the copies keep the key.
+ELAPSED_TIMES: dict = {}
+
+
+def get_timed_hook(base_class: type, name: str):
+    """
+    Return a hook of the callback which adds its time to the telemetry.
+
+    :type base_class: type
+    :param base_class: The class of the callback.
+
+    :type name: str
+    :param name: The name of the hook, for example `on_epoch_end`.
+
+    :rtype: Callable
+    :return: The hook.
+    """
+    base_hook = getattr(base_class, name)
+
+    def timed_hook(self, *args, **kwargs):
+        start_time: float = perf_counter()
+        try:
+            return base_hook(self, *args, **kwargs)
+        finally:
+            ELAPSED_TIMES[self.telemetry_key] = ELAPSED_TIMES.get(self.telemetry_key, 0.0) + \
+                perf_counter() - start_time
+
+    timed_hook.__name__ = name
+    return timed_hook
+
+
+@lru_cache(maxsize=None)
+def get_timed_tensorboard_class(base_class: type = callbacks.TensorBoard) -> type:
+    """
+    Return a subclass of the TensorBoard callback which measures the time of its hooks.
+
+    :type base_class: type
+    :param base_class: The class of the TensorBoard callback, for example the one of `tensorflow.python.keras`.
+
+    :rtype: type
+    :return: The subclass with the same name, its instances have the attribute `telemetry_key`.
+    """
+    attributes: dict = {name: get_timed_hook(base_class, name) for name in TIMED_HOOKS if hasattr(base_class, name)}
+    # The subclass keeps the name of its base class: the Keras Tuner only gives its own directory of logs and the
+    # HParams callback to every trial for the callbacks whose class is named `TensorBoard`.
+    return type(base_class.__name__, (base_class,), attributes)
+
+
+class Telemetry:
+    """
+    Create the TensorBoard callbacks of a level of telemetry, shared by the tuner and the models:
+
+    - `off`: no callback.
+    - `scalars`: the loss and the metrics, every `update_interval` batches or every epoch.
+    - `histograms`: the scalars and the histograms of the weights every `histogram_interval` epochs.
+    - `full`: the histograms and the images of the weights and the embeddings every epoch, and the graph.
+
+    The hooks of the callbacks are timed, so the time which the telemetry consumes is reported.
+    """
+    __level: str
+    __update_interval: object
+    __histogram_interval: int
+    __key: str
+
+    def __init__(self, level: str = 'scalars', update_interval=None, histogram_interval: int = 10) -> None:
+        """
+        Construction method.
+
+        :type level: str
+        :param level: The level of the telemetry: `off`, `scalars`, `histograms` or `full`.
+
+        :type update_interval: int
+        :param update_interval: Number of batches between the summaries of the scalars. By default, one summary
+        every epoch, the summaries of the batches are written inside the training step.
+
+        :type histogram_interval: int
+        :param histogram_interval: Number of epochs between the histograms, only for the level `histograms`.
+
+        :rtype: None
+        """
+        if level not in TELEMETRY_LEVELS:
+            raise ValueError(f'Unknown telemetry level "{level}", the options are: {", ".join(TELEMETRY_LEVELS)}.')
+        if histogram_interval < 1:
+            raise ValueError(f'The histogram interval must be positive, it is {histogram_interval}.')
+
+        self.__level = level
+        self.__update_interval = update_interval if update_interval is not None else 'epoch'
+        self.__histogram_interval = histogram_interval
+        self.__key = uuid4().hex
+
+    @property
+    def level(self) -> str:
+        """
+        Get the level of the telemetry.
+
+        :rtype: str
+        :return: The level: `off`, `scalars`, `histograms` or `full`.
+        """
+        return self.__level
+
+    @property
+    def elapsed_time(self) -> float:
+        """
+        Get the time which the callbacks of this telemetry consumed, in seconds.
+
+        :rtype: float
+        :return: The time.
+        """
+        return ELAPSED_TIMES.get(self.__key, 0.0)
+
+    def get_callbacks(self, log_directory: str, tensorboard_class: type = callbacks.TensorBoard) -> list:
+        """
+        Return the callbacks for the methods `fit` of the models, or `search` of the tuner.
+
+        :type log_directory: str
+        :param log_directory: The directory of the logs of TensorBoard.
+
+        :type tensorboard_class: type
+        :param tensorboard_class: The class of the TensorBoard callback, for the models of `tensorflow.python.keras`.
+
+        :rtype: list
+        :return: The callbacks, empty for the level `off`.
+        """
+        if self.__level == 'off':
+            return []
+
+        arguments: dict = {
+            'histogram_freq': 0,
+            'write_graph': False,
+            'update_freq': self.__update_interval,
+        }
+        if self.__level == 'histograms':
+            arguments['histogram_freq'] = self.__histogram_interval
+        elif self.__level == 'full':
+            arguments.update(histogram_freq=1, write_graph=True, write_images=True, embeddings_freq=1)
+
+        tensorboard = get_timed_tensorboard_class(tensorboard_class)(log_directory, **arguments)
+        tensorboard.telemetry_key = self.__key
+
+        return [tensorboard]
+
+    def display_information(self, name: str) -> None:
+        """
+        Print the time which the telemetry consumed.
+
+        :type name: str
+        :param name: The name of the training, for example `Search`.
+
+        :rtype: None
+        """
+        if self.__level != 'off':
+            print(f'{name} telemetry ({self.__level}): {timedelta(seconds=self.elapsed_time)}')
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Cache of the completed trials of the tuner, addressed by their content: the values of the hyperparameters,
+the budget of epochs and the fingerprint of the data.
+"""
+from glob import glob
+from hashlib import sha256
+from json import dumps, load, dump
+from os import listdir, makedirs, remove, replace, getpid
+from os.path import basename, dirname, isdir, join
+from shutil import copy2, rmtree
+
+# The values of the trial which do not change its result, for example the trial resumed in the previous round.
+IGNORED_VALUES: tuple = ('tuner/trial_id', 'tuner/bracket', 'tuner/round')
+
+TRIAL_CACHE_DIRECTORY: str = 'trial-cache'
+
+
+def clean_tuner_directory(tuner_directory: str) -> None:
+    """
+    Remove the trials and the logs of the previous search, the trial cache is kept.
+
+    :type tuner_directory: str
+    :param tuner_directory: The directory of the tuner.
+
+    :rtype: None
+    """
+    if not isdir(tuner_directory):
+        return
+
+    name: str
+    for name in listdir(tuner_directory):
+        if name == TRIAL_CACHE_DIRECTORY:
+            continue
+        path: str = join(tuner_directory, name)
+        if isdir(path):
+            rmtree(path)
+        else:
+            remove(path)
+
+
+class TrialCache:
+    """
+    Store the metrics and the checkpoint of every completed trial, so the next searches with the same data skip
+    the combinations which are already trained, and only train the new or changed ones.
+
+    Every entry is a directory named by the hash of the values of the trial and the fingerprint of the data.
+    The entries are never replaced, they are invalidated explicitly with `clear`, for example after a change of
+    the model, which is not part of the key.
+    """
+    __directory: str
+    __fingerprint: str
+
+    def __init__(self, directory: str = f'keras-tuner-trials/{TRIAL_CACHE_DIRECTORY}',
+                 fingerprint: str = None) -> None:
+        """
+        Construction method.
+
+        :type directory: str
+        :param directory: The directory of the entries.
+
+        :type fingerprint: str
+        :param fingerprint: The fingerprint of the data and the options of the training, for example the
+        fingerprint of the splits. If it is `None`, the data is not reproducible and the cache is disabled.
+
+        :rtype: None
+        """
+        self.__directory = directory
+        self.__fingerprint = fingerprint
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Get if the cache is used, there is a fingerprint of the data.
+
+        :rtype: bool
+        :return: True if the trials are stored and restored.
+        """
+        return self.__fingerprint is not None
+
+    def get_key(self, values: dict) -> str:
+        """
+        Return the key of a trial.
+
+        :type values: dict
+        :param values: The values of the hyperparameters of the trial, with `tuner/epochs` and
+        `tuner/initial_epoch`.
+
+        :rtype: str
+        :return: The key in hexadecimal.
+        """
+        used_values: dict = {name: value for name, value in values.items() if name not in IGNORED_VALUES}
+        return sha256(dumps([self.__fingerprint, used_values], sort_keys=True).encode()).hexdigest()
+
+    def restore(self, values: dict, checkpoint: str) -> dict:
+        """
+        Copy the checkpoint of a cached trial and return its metrics.
+
+        :type values: dict
+        :param values: The values of the hyperparameters of the trial.
+
+        :type checkpoint: str
+        :param checkpoint: The prefix of the files of the checkpoint of the new trial.
+
+        :rtype: dict
+        :return: The metrics of the best epoch, or `None` if the trial is not in the cache.
+        """
+        if not self.enabled:
+            return None
+
+        entry_directory: str = join(self.__directory, self.get_key(values))
+        if not isdir(entry_directory):
+            return None
+
+        with open(join(entry_directory, 'metrics.json'), 'r') as file_handler:
+            metrics: dict = load(file_handler)
+
+        makedirs(dirname(checkpoint), exist_ok=True)
+        filename: str
+        for filename in glob(join(entry_directory, 'checkpoint*')):
+            copy2(filename, join(dirname(checkpoint), basename(checkpoint) + basename(filename)[len('checkpoint'):]))
+
+        return metrics
+
+    def store(self, values: dict, metrics: dict, checkpoint: str) -> None:
+        """
+        Store the metrics and the checkpoint of a completed trial. If the trial is already stored, for example
+        by other worker, the entry is kept.
+
+        :type values: dict
+        :param values: The values of the hyperparameters of the trial.
+
+        :type metrics: dict
+        :param metrics: The metrics of the best epoch.
+
+        :type checkpoint: str
+        :param checkpoint: The prefix of the files of the checkpoint of the trial.
+
+        :rtype: None
+        """
+        if not self.enabled:
+            return
+
+        entry_directory: str = join(self.__directory, self.get_key(values))
+        if isdir(entry_directory):
+            return
+
+        # The entry is written in a temporal directory and renamed, so it is complete or it does not exist.
+        temporal_directory: str = f'{entry_directory}.tmp-{getpid()}'
+        makedirs(temporal_directory, exist_ok=True)
+        with open(join(temporal_directory, 'metrics.json'), 'w') as file_handler:
+            dump({name: float(value) for name, value in metrics.items()}, file_handler)
+
+        filename: str
+        for filename in glob(f'{checkpoint}*'):
+            copy2(filename, join(temporal_directory, 'checkpoint' + basename(filename)[len(basename(checkpoint)):]))
+
+        try:
+            replace(temporal_directory, entry_directory)
+        except OSError:
+            # Other process stored the same trial.
+            rmtree(temporal_directory)
+
+    def clear(self) -> None:
+        """
+        Remove all the entries, the next search trains all the combinations.
+
+        :rtype: None
+        """
+        if isdir(self.__directory):
+            rmtree(self.__directory)
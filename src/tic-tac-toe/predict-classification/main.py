@@ -2,47 +2,107 @@
 # -*- coding: UTF-8 -*-
 """
 Entry point of the execution in this application.
+
+Every section is a stage of the pipeline, it is selected with `--stages`:
+
+    python3 main.py --stages evaluation-production evaluation-production-one
+
+Only the data sets which the selected stages require are loaded, and the modules of TensorFlow, Keras and
+Matplotlib are imported inside the stages which use them.
 """
-from datetime import timedelta
-from time import monotonic
+from argparse import ArgumentParser
+from functools import partial
 
-import pandas as pd
 from pandas import DataFrame
 
 from core.chronometer import Chronometer
-from core.csv_trials import CsvTrials
-from core.graphic_information import GraphicInformation
-from core.keras_tuner_hyper import KerasTunerHyper
-from core.model_best import ModelBest
-from core.model_best_evaluation import ModelBestEvaluation
-from core.text_information import TextInformation
+from core.dataset_loader import DatasetLoader
+from core.pipeline import Pipeline
 
-if __name__ == '__main__':
-    # -------------------------------------------------------------------------
-    # Take time from every section.
-    # -------------------------------------------------------------------------
-    chronometer = Chronometer()
-    chronometer.check('Start')
+OUTPUT_FEATURE: str = 'winner'
+OUTPUT_CATEGORIES: int = 3
+BEST_MODEL_DIRECTORY: str = 'keras-tuner-trials/best-model'
 
-    # -------------------------------------------------------------------------
-    # Retrieve data from the CSV file for quick review of the information.
-    # -------------------------------------------------------------------------
-    data_for_information = pd.read_csv('resources/tic-tac-toe-records-train-reduced-04.csv')
+# Files of the data sets, the CSV files are parsed one time and the next executions map their binary cache.
+INFORMATION_FILENAME: str = 'resources/tic-tac-toe-records-train-reduced-04.csv'
+QUICK_FILENAME: str = 'resources/tic-tac-toe-records-train-reduced-04.csv'
+TRAIN_FILENAME: str = 'resources/tic-tac-toe-records-train-complete.csv'
+PRODUCTION_FILENAME: str = 'resources/tic-tac-toe-records-production.csv'
+PRODUCTION_ALL_FILENAME: str = 'resources/tic-tac-toe-records-production-all.csv'
+PRODUCTION_ONE_FILENAME: str = 'resources/tic-tac-toe-records-production-one.csv'
 
-    chronometer.check('Retrieve data information')
+# Files which are streamed instead of loaded, for example the binary shards of `--splits` with `--no-merge`.
+# The patterns end with the extension of the records, so the checkpoints and the temporary files are not read.
+STREAM_FILENAMES: dict = {
+    'train': 'resources/stream/tic-tac-toe-records-train*.bin',
+    'validation': 'resources/stream/tic-tac-toe-records-validation*.bin',
+    'test': 'resources/stream/tic-tac-toe-records-test*.bin',
+}
 
-    # -------------------------------------------------------------------------
-    # Show information in text mode.
-    # -------------------------------------------------------------------------
-    pandas_information = TextInformation(data_for_information)
-    # pandas_information.display_information()
-    #
-    # chronometer.check('Show information text')
+# The stages which run without `--stages`.
+DEFAULT_STAGES: list = ['evaluation-production', 'evaluation-production-all', 'evaluation-production-one']
 
-    # -------------------------------------------------------------------------
-    # Show information in graphic mode.
-    # -------------------------------------------------------------------------
-    graphic_information = GraphicInformation(data_for_information, is_show_activated=False)
+
+def get_player_columns(dataset_loader: DatasetLoader, filename: str = TRAIN_FILENAME) -> list:
+    """
+    Return the player columns, the models do not use them so they are not loaded.
+    The number of turns depends on the board of the game generator, the columns are taken from the headers.
+
+    :type dataset_loader: DatasetLoader
+    :param dataset_loader: The loader of the data sets.
+
+    :type filename: str
+    :param filename: The CSV file which is loaded, its headers are read.
+
+    :rtype: list[str]
+    :return: The Columns Names of the players.
+    """
+    return [column for column in dataset_loader.get_columns(filename) if column.endswith('_player')]
+
+
+def get_stream_train():
+    """
+    Return the stream of the records in the files of `STREAM_FILENAMES`, they are not loaded in memory.
+    The player columns are not parsed.
+
+    :rtype: FileStream
+    :return: The stream of the records.
+    """
+    from core.file_stream import FileStream, get_filenames, read_columns
+
+    columns: list = read_columns(get_filenames(STREAM_FILENAMES['train'])[0])[0]
+    player_columns: list = [column for column in columns if column.endswith('_player')]
+
+    return FileStream(STREAM_FILENAMES, OUTPUT_FEATURE, drop_columns=player_columns)
+
+
+def show_text_information(data_information: DataFrame) -> None:
+    """
+    Show information in text mode.
+
+    :type data_information: DataFrame
+    :param data_information: The data for the review of the information.
+
+    :rtype: None
+    """
+    from core.text_information import TextInformation
+
+    pandas_information = TextInformation(data_information)
+    pandas_information.display_information()
+
+
+def show_graphic_information(data_information: DataFrame) -> None:
+    """
+    Show information in graphic mode.
+
+    :type data_information: DataFrame
+    :param data_information: The data for the review of the information.
+
+    :rtype: None
+    """
+    from core.graphic_information import GraphicInformation
+
+    graphic_information = GraphicInformation(data_information, is_show_activated=False)
     columns_by_players_and_cells = ['turn_1_player', 'turn_1_cell',
                                     'turn_5_player', 'turn_5_cell',
                                     'turn_6_player', 'turn_6_cell',
@@ -50,14 +110,10 @@ if __name__ == '__main__':
                                     'winner',
                                     ]
     graphic_information.set_columns(columns_by_players_and_cells)
-    # graphic_information.reset_columns()
-
-    # graphic_information.get_distribution_columns()
-    # graphic_information.get_correlation_matrix()
+    graphic_information.get_distribution_columns()
+    graphic_information.get_correlation_matrix()
     # graphic_information.get_matrix_scatter_plots()
     # graphic_information.get_scatter_plots('turn_1_player', 'turn_1_cell')
-    # graphic_information.get_scatter_plots('turn_1_player', 'winner')
-    # graphic_information.get_scatter_plots('turn_1_cell', 'winner')
     # graphic_information.get_3d_scatter_plots(
     #     columns=[
     #         ('turn_1_player', 'turn_1_cell', 'winner'),
@@ -67,106 +123,151 @@ if __name__ == '__main__':
     #     ],
     #     x_label='Player', y_label='Cell', z_label='Winner'
     # )
-    #
-    # columns_by_cells = ['turn_1_cell', 'turn_2_cell', 'turn_3_cell', 'turn_4_cell', 'turn_5_cell',
-    #                     'turn_6_cell', 'turn_7_cell', 'turn_8_cell', 'turn_9_cell']
-    # graphic_information.set_columns(columns_by_cells)
-    # graphic_information.get_density(x_label='Cells')
-    #
-    # columns_by_players = ['winner']
-    # graphic_information.set_columns(columns_by_players)
-    # graphic_information.get_density(x_label='Winner ID')
-    #
-    # graphic_information.show()
-    #
-    # chronometer.check('Show information graph')
 
-    # -------------------------------------------------------------------------
-    # Retrieve data from the CSV file for quick review of the deep learning.
-    # -------------------------------------------------------------------------
-    data_for_train_model = pd.read_csv('resources/tic-tac-toe-records-train-complete.csv')
-    # data_for_quick_model = pd.read_csv('resources/tic-tac-toe-records-train-reduced-04.csv')
-    data_for_production_model = pd.read_csv('resources/tic-tac-toe-records-production.csv')
-    data_for_production_all_model = pd.read_csv('resources/tic-tac-toe-records-production-all.csv')
-    data_for_production_one_model = pd.read_csv('resources/tic-tac-toe-records-production-one.csv')
-    output_feature = 'winner'
+    columns_by_cells = [column for column in data_information.columns if column.endswith('_cell')]
+    graphic_information.set_columns(columns_by_cells)
+    graphic_information.get_density(x_label='Cells')
 
-    chronometer.check('Retrieve data')
+    columns_by_players = ['winner']
+    graphic_information.set_columns(columns_by_players)
+    graphic_information.get_density(x_label='Winner ID')
 
-    # -------------------------------------------------------------------------
-    # Create the deep learning model for quick review.
-    # -------------------------------------------------------------------------
-    # model_quick_review = ModelQuickReview(data_for_quick_model, output_feature)
-    # model_quick_review.split_data()
-    # model_quick_review.fit()
-    # model_quick_review.show_graphic_information()
-    # model_quick_review.evaluate()
-    #
-    # chronometer.check('Model quick review')
+    graphic_information.show()
 
-    # -------------------------------------------------------------------------
-    # Create the deep learning model removing player columns.
-    # -------------------------------------------------------------------------
-    # player_column_ids = [
-    #     'turn_1_player', 'turn_2_player', 'turn_3_player', 'turn_4_player', 'turn_5_player',
-    #     'turn_6_player', 'turn_7_player', 'turn_8_player', 'turn_9_player'
-    # ]
-    # data_without_players = data_for_quick_model.drop(columns=player_column_ids)
-    # model_quick_review = ModelQuickReview(data_without_players, output_feature)
-    # model_quick_review.split_data()
-    # model_quick_review.fit()
-    # model_quick_review.show_graphic_information()
-    # model_quick_review.evaluate()
-    #
-    # chronometer.check('Removing player columns')
 
-    # -------------------------------------------------------------------------
-    # Create the deep learning model removing cell columns.
-    # -------------------------------------------------------------------------
-    # player_column_ids = [
-    #     'turn_1_cell', 'turn_2_cell', 'turn_3_cell', 'turn_4_cell', 'turn_5_cell',
-    #     'turn_6_cell', 'turn_7_cell', 'turn_8_cell', 'turn_9_cell'
-    # ]
-    # data_without_players = data_for_quick_model.drop(columns=player_column_ids)
-    # model_quick_review = ModelQuickReview(data_without_players, output_feature)
-    # model_quick_review.split_data()
-    # model_quick_review.fit()
-    # model_quick_review.show_graphic_information()
-    # model_quick_review.evaluate()
-    #
-    # chronometer.check('Removing cell columns')
+def get_telemetry(level: str = None, update_interval: int = None, histogram_interval: int = 10):
+    """
+    Return the telemetry of the trainings in TensorBoard.
 
-    # -------------------------------------------------------------------------
-    # Execute the Keras Tuner to search the best of these.
-    # -------------------------------------------------------------------------
-    player_column_ids = [
-        'turn_1_player', 'turn_2_player', 'turn_3_player', 'turn_4_player', 'turn_5_player',
-        'turn_6_player', 'turn_7_player', 'turn_8_player', 'turn_9_player'
-    ]
-    # data_without_players_test: DataFrame = data_for_quick_model.drop(columns=player_column_ids)
-    # data_without_players_test: DataFrame = data_for_train_model.drop(columns=player_column_ids)
-    #
-    # keras_tuner_hyperparameter: KerasTunerHyper = KerasTunerHyper(data_without_players_test,
-    #                                                               output_feature, fit_epochs=80)
-    # chronometer.check('Keras tuner')
-    #
-    # keras_tuner_hyperparameter.search()
-    # chronometer.check('Keras tuner search')
+    :type level: str
+    :param level: The level of the telemetry: `off`, `scalars`, `histograms` or `full`. If it is `None`, every
+    training uses its default level.
 
-    # -------------------------------------------------------------------------
-    # Store the analysis of the trials in a CSV file.
-    # -------------------------------------------------------------------------
-    # csv_trials = CsvTrials()
-    # csv_trials.generate()
-    #
-    # chronometer.check('CSV Trials')
-    #
-    # chronometer.display_information()
-    # exit(0)
+    :type update_interval: int
+    :param update_interval: Number of batches between the summaries of the scalars, by default every epoch.
+
+    :type histogram_interval: int
+    :param histogram_interval: Number of epochs between the histograms of the level `histograms`.
+
+    :rtype: Telemetry
+    :return: The telemetry, or `None` for the default levels.
+    """
+    if level is None:
+        return None
+
+    from core.telemetry import Telemetry
+
+    return Telemetry(level, update_interval, histogram_interval)
+
+
+def review_quick_model(data_quick: DataFrame, telemetry=None) -> None:
+    """
+    Create the deep learning model for quick review.
+    To review the model without the player or the cell columns, drop them from the data.
+
+    :type data_quick: DataFrame
+    :param data_quick: The data for the quick review, with all the columns.
+
+    :type telemetry: Telemetry
+    :param telemetry: The telemetry of the training, by default it is off.
+
+    :rtype: None
+    """
+    from core.model_quick_review import ModelQuickReview
+
+    model_quick_review = ModelQuickReview(data_quick, OUTPUT_FEATURE, telemetry=telemetry)
+    model_quick_review.split_data()
+    model_quick_review.fit()
+    model_quick_review.show_graphic_information()
+    model_quick_review.evaluate()
+
+
+def clear_trial_cache() -> None:
+    """
+    Remove the trials which are cached, so the next search trains all the combinations again.
+    It is needed after a change of the model, the cache only knows the hyperparameters and the data.
+
+    :rtype: None
+    """
+    from core.trial_cache import TrialCache, TRIAL_CACHE_DIRECTORY
+
+    TrialCache(f'keras-tuner-trials/{TRIAL_CACHE_DIRECTORY}').clear()
+
+
+def search_hyperparameters(data_train: DataFrame, telemetry=None) -> None:
+    """
+    Execute the Keras Tuner to search the best of these.
+
+    :type data_train: DataFrame | FileStream
+    :param data_train: The data for the training without the player columns, or the stream of the records.
+
+    :type telemetry: Telemetry
+    :param telemetry: The telemetry of the trials, by default only the scalars.
+
+    :rtype: None
+    """
+    from core.keras_tuner_hyper import KerasTunerHyper
+
+    keras_tuner_hyperparameter: KerasTunerHyper = KerasTunerHyper(data_train, OUTPUT_FEATURE, fit_epochs=80,
+                                                                  telemetry=telemetry)
+    keras_tuner_hyperparameter.search()
+
+
+def search_hyperparameters_parallel(dataset_loader: DatasetLoader, player_columns: list, tuner_workers: int,
+                                    telemetry=None) -> None:
+    """
+    Execute the Keras Tuner with a chief and several worker processes.
+    Every process loads the training data from the binary cache, this process does not load it.
+
+    :type dataset_loader: DatasetLoader
+    :param dataset_loader: The loader of the data sets.
+
+    :type player_columns: list[str]
+    :param player_columns: The Columns Names of the players, they are not loaded.
+
+    :type tuner_workers: int
+    :param tuner_workers: Number of worker processes. If it is `None`, one worker for every 4 CPUs.
+
+    :type telemetry: Telemetry
+    :param telemetry: The telemetry of the trials, by default only the scalars.
+
+    :rtype: None
+    """
+    from core.parallel_search import ParallelSearch
+
+    parallel_search: ParallelSearch = ParallelSearch(
+        partial(dataset_loader.load, TRAIN_FILENAME, drop_columns=player_columns), OUTPUT_FEATURE,
+        workers=tuner_workers, output_categories=OUTPUT_CATEGORIES, fit_epochs=80, telemetry=telemetry,
+    )
+    parallel_search.search()
+
+
+def generate_csv_trials() -> None:
+    """
+    Store the analysis of the trials in a CSV file.
+
+    :rtype: None
+    """
+    from core.csv_trials import CsvTrials
+
+    csv_trials = CsvTrials()
+    csv_trials.generate()
+
+
+def fit_best_model(data_train: DataFrame, telemetry=None) -> None:
+    """
+    Fit the best model with the training data, and save it.
+
+    :type data_train: DataFrame | FileStream
+    :param data_train: The data for the training without the player columns, or the stream of the records.
+
+    :type telemetry: Telemetry
+    :param telemetry: The telemetry of the training, by default the scalars and periodic histograms.
+
+    :rtype: None
+    """
+    from core.model_best import ModelBest
 
-    # -------------------------------------------------------------------------
-    # Fit the best model with the production test data.
-    # -------------------------------------------------------------------------
     # trial_id | batch_size | units | layers | learning_rate | epoch | score          | accuracy | crossentropy |
     # -----------------------------------------------------------
     # 11       | 128        | 1024  | 4      | 0.001         | 2     | -0.999999933195326 | 1 | 6.68046737928307E-08 |
@@ -179,58 +280,126 @@ if __name__ == '__main__':
     learning_rate: float = 0.001
     ams_grad: bool = False
     epochs: int = 2
-    best_model_directory = 'keras-tuner-trials/best-model'
-    # data_without_players_production: DataFrame = data_for_train_model.drop(columns=player_column_ids)
-    # model_best: ModelBest = ModelBest(data_without_players_production, best_model_directory,
-    #                                   output_feature, epochs, batch_size, units, layers,
-    #                                   learning_rate, ams_grad)
-    # chronometer.check('Best model creation')
-    #
-    # model_best.fit()
-    # chronometer.check('Best model fit')
-    #
-    # model_best.evaluate()
-    # chronometer.check('Best model evaluate')
-    #
-    # model_best.save()
-    # chronometer.check('Best model save')
+    model_best: ModelBest = ModelBest(data_train, BEST_MODEL_DIRECTORY,
+                                      OUTPUT_FEATURE, epochs, batch_size, units, layers,
+                                      learning_rate, ams_grad, telemetry=telemetry)
+    model_best.fit()
+    model_best.evaluate()
+    model_best.save()
 
-    # -------------------------------------------------------------------------
-    # Evaluate the best model with the test production data.
-    # -------------------------------------------------------------------------
-    output_categories: int = 3
-    data_without_players_production_all: DataFrame = data_for_production_model.drop(columns=player_column_ids)
-    model_best_evaluation = ModelBestEvaluation(data_without_players_production_all,
-                                                output_feature, best_model_directory,
-                                                output_categories)
-    chronometer.check('Best model production creation test records')
 
+def evaluate_best_model(data: DataFrame) -> None:
+    """
+    Evaluate the best model with the production data.
+
+    :type data: DataFrame
+    :param data: The production data, without the player columns.
+
+    :rtype: None
+    """
+    from core.model_best_evaluation import ModelBestEvaluation
+
+    model_best_evaluation = ModelBestEvaluation(data, OUTPUT_FEATURE, BEST_MODEL_DIRECTORY, OUTPUT_CATEGORIES)
     model_best_evaluation.evaluate()
-    chronometer.check('Best model production evaluation test records')
 
+
+def get_pipeline(chronometer: Chronometer) -> Pipeline:
+    """
+    Return the pipeline with all the stages and their data sets.
+
+    :type chronometer: Chronometer
+    :param chronometer: The chronometer which checks every data set and every stage.
+
+    :rtype: Pipeline
+    :return: The pipeline.
+    """
+    pipeline = Pipeline(chronometer)
+    pipeline.add_resource('dataset-loader', DatasetLoader)
+    # The player columns of the training file, for the processes of the parallel search which load it.
+    pipeline.add_resource('player-columns', get_player_columns, requires=('dataset-loader',))
+    pipeline.add_resource('data-information', lambda dataset_loader: dataset_loader.load(INFORMATION_FILENAME),
+                          requires=('dataset-loader',))
+    pipeline.add_resource('data-quick', lambda dataset_loader: dataset_loader.load(QUICK_FILENAME),
+                          requires=('dataset-loader',))
+
+    name: str
+    filename: str
+    for name, filename in (('data-train', TRAIN_FILENAME),
+                           ('data-production', PRODUCTION_FILENAME),
+                           ('data-production-all', PRODUCTION_ALL_FILENAME),
+                           ('data-production-one', PRODUCTION_ONE_FILENAME)):
+        # The player columns are taken from the file of every data set, so a stage only reads its own file.
+        pipeline.add_resource(
+            name,
+            lambda dataset_loader, data_filename=filename: dataset_loader.load(
+                data_filename, drop_columns=get_player_columns(dataset_loader, data_filename)),
+            requires=('dataset-loader',),
+        )
+    pipeline.add_resource('stream-train', get_stream_train)
+    pipeline.add_resource('tuner-workers', lambda: None)
+    pipeline.add_resource('telemetry', get_telemetry)
+
+    pipeline.add_stage('text-information', show_text_information, requires=('data-information',))
+    pipeline.add_stage('graphic-information', show_graphic_information, requires=('data-information',))
+    pipeline.add_stage('quick-review', review_quick_model, requires=('data-quick', 'telemetry'))
+    pipeline.add_stage('tuner-cache-clear', clear_trial_cache)
+    pipeline.add_stage('tuner-search', search_hyperparameters, requires=('data-train', 'telemetry'))
+    pipeline.add_stage('tuner-search-parallel', search_hyperparameters_parallel,
+                       requires=('dataset-loader', 'player-columns', 'tuner-workers', 'telemetry'))
+    pipeline.add_stage('tuner-search-stream',
+                       lambda stream_train, telemetry: search_hyperparameters(stream_train, telemetry),
+                       requires=('stream-train', 'telemetry'))
+    pipeline.add_stage('csv-trials', generate_csv_trials)
+    pipeline.add_stage('best-model-fit', fit_best_model, requires=('data-train', 'telemetry'))
+    pipeline.add_stage('best-model-fit-stream', lambda stream_train, telemetry: fit_best_model(stream_train, telemetry),
+                       requires=('stream-train', 'telemetry'))
+    pipeline.add_stage('evaluation-production', lambda data_production: evaluate_best_model(data_production),
+                       requires=('data-production',))
+    pipeline.add_stage('evaluation-production-all',
+                       lambda data_production_all: evaluate_best_model(data_production_all),
+                       requires=('data-production-all',))
+    pipeline.add_stage('evaluation-production-one',
+                       lambda data_production_one: evaluate_best_model(data_production_one),
+                       requires=('data-production-one',))
+
+    return pipeline
+
+
+if __name__ == '__main__':
     # -------------------------------------------------------------------------
-    # Evaluate the best model with the all the production data.
+    # Take time from every section.
     # -------------------------------------------------------------------------
-    data_without_players_production_all: DataFrame = data_for_production_all_model.drop(columns=player_column_ids)
-    model_best_evaluation = ModelBestEvaluation(data_without_players_production_all,
-                                                output_feature, best_model_directory,
-                                                output_categories)
-    chronometer.check('Best model production creation all records')
+    chronometer = Chronometer()
+    chronometer.check('Start')
+    pipeline = get_pipeline(chronometer)
 
-    model_best_evaluation.evaluate()
-    chronometer.check('Best model production evaluation all records')
+    parser = ArgumentParser(
+        prog='Tic Tac Toe predict classification',
+        description='This application reviews the records of the Tic Tac Toe games, and it trains and evaluates'
+                    ' the deep learning models which predict the winner.'
+    )
+    parser.add_argument('--stages', type=str, nargs='+', default=DEFAULT_STAGES, choices=pipeline.stages,
+                        help='The stages which run, always in the order of the pipeline.')
+    parser.add_argument('--tuner-workers', type=int, default=None,
+                        help='Number of worker processes of the stage `tuner-search-parallel`,'
+                             ' by default one worker for every 4 CPUs.')
+    parser.add_argument('--telemetry', type=str, default=None, choices=['off', 'scalars', 'histograms', 'full'],
+                        help='The telemetry of the trainings in TensorBoard. By default, only the scalars for the'
+                             ' search, the scalars and periodic histograms for the best model, and off for the quick'
+                             ' review.')
+    parser.add_argument('--telemetry-interval', type=int, default=None,
+                        help='Number of batches between the summaries of the scalars, by default every epoch.')
+    parser.add_argument('--histogram-interval', type=int, default=10,
+                        help='Number of epochs between the histograms of the telemetry `histograms`.')
+    args = parser.parse_args()
+    pipeline.add_resource('tuner-workers', lambda: args.tuner_workers)
+    pipeline.add_resource('telemetry', lambda: get_telemetry(args.telemetry, args.telemetry_interval,
+                                                             args.histogram_interval))
 
     # -------------------------------------------------------------------------
-    # Evaluate the best model with the one record of the production data.
+    # Run the stages, the data sets are loaded when a stage requires them.
     # -------------------------------------------------------------------------
-    data_without_players_production_one: DataFrame = data_for_production_one_model.drop(columns=player_column_ids)
-    model_best_evaluation = ModelBestEvaluation(data_without_players_production_one,
-                                                output_feature, best_model_directory,
-                                                output_categories)
-    chronometer.check('Best model production creation one record')
-
-    model_best_evaluation.evaluate()
-    chronometer.check('Best model production evaluation one record')
+    pipeline.run(args.stages)
 
     # -------------------------------------------------------------------------
     # Summary of the time line.